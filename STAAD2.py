@@ -4,10 +4,11 @@ new file mode 100644
 index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69d809fd84
 --- /dev/null
 +++ b/app.py
-@@ -0,0 +1,591 @@
+@@ -0,0 +1,687 @@
 +import math
 +import re
 +from dataclasses import dataclass
++from functools import lru_cache
 +from typing import Dict, Optional
 +
 +import pandas as pd
@@ -204,81 +205,142 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +    return None
 +
 +
-+def parse_report(text: str) -> Dict[str, float]:
-+    values: Dict[str, float] = {}
-+    values["member_no"] = extract_value(r"Member No:\s*(\d+)", text, int)
-+    values["profile"] = extract_value(r"Profile:\s*([A-Z0-9 ]+X\d+)", text, str)
-+    values["status"] = extract_value(r"Status:\s*([A-Z]+)", text, str)
-+    values["ratio"] = extract_value(r"Ratio:\s*([0-9.]+)", text)
-+    values["loadcase"] = extract_value(r"Loadcase:\s*(\d+)", text, int)
-+    values["location"] = extract_value(r"Location:\s*([-0-9.]+)", text)
-+    values["ref"] = extract_value(r"Ref:\s*([A-Za-z0-9.\-]+)", text, str)
-+
-+    for label in ["Pz", "Vy", "Vx", "Tz", "My", "Mx"]:
-+        values[label.lower()] = extract_value(fr"{label}:\s*([-0-9.]+)", text)
-+
-+    values["actual_slenderness"] = extract_value(r"Actual Slenderness Ratio\s*:\s*([-0-9.]+)", text)
-+    values["allowable_slenderness"] = extract_value(r"Allowable Slenderness Ratio\s*:\s*([-0-9.]+)", text)
-+
++# (key in values, pattern, cast) for every field read from a report. Each
++# pattern has exactly one group, the value. Trailing context that another
++# field starts with is written as a lookahead so it is not consumed.
++REPORT_FIELDS = [
++    ("member_no", r"Member No:\s*(\d+)", int),
++    ("profile", r"Profile:\s*([A-Z0-9 ]+X\d+)", str),
++    ("status", r"Status:\s*([A-Z]+)", str),
++    ("ratio", r"Ratio:\s*([0-9.]+)", float),
++    ("loadcase", r"Loadcase:\s*(\d+)", int),
++    ("location", r"Location:\s*([-0-9.]+)", float),
++    ("ref", r"Ref:\s*([A-Za-z0-9.\-]+)", str),
++]
++REPORT_FIELDS += [(label.lower(), fr"{label}:\s*([-0-9.]+)", float) for label in ["Pz", "Vy", "Vx", "Tz", "My", "Mx"]]
++REPORT_FIELDS += [
++    ("actual_slenderness", r"Actual Slenderness Ratio\s*:\s*([-0-9.]+)", float),
++    ("allowable_slenderness", r"Allowable Slenderness Ratio\s*:\s*([-0-9.]+)", float),
 +    # section properties
-+    values.update(
-+        {
-+            "ag": extract_value(r"Ag\s*:\s*([0-9.E+-]+)", text),
-+            "axx": extract_value(r"Axx\s*:\s*([0-9.E+-]+)", text),
-+            "ayy": extract_value(r"Ayy\s*:\s*([0-9.E+-]+)", text),
-+            "ixx": extract_value(r"Ixx\s*:\s*([0-9.E+-]+)", text),
-+            "iyy": extract_value(r"Iyy\s*:\s*([0-9.E+-]+)", text),
-+            "j": extract_value(r"J\s*:\s*([0-9.E+-]+)", text),
-+            "zxx": extract_value(r"Zxx\s*:\s*([0-9.E+-]+)", text),
-+            "zyy": extract_value(r"Zyy\s*:\s*([0-9.E+-]+)", text),
-+            "sxx_pos": extract_value(r"Sxx\+:\s*([0-9.E+-]+)", text),
-+            "sxx_neg": extract_value(r"Sxx-:\s*([0-9.E+-]+)", text),
-+            "syy_pos": extract_value(r"Syy\+:\s*([0-9.E+-]+)", text),
-+            "syy_neg": extract_value(r"Syy-:\s*([0-9.E+-]+)", text),
-+            "cw": extract_value(r"Cw\s*:\s*([0-9.E+-]+)", text),
-+            "x0": extract_value(r"x0\s*:\s*([0-9.E+-]+)", text),
-+            "y0": extract_value(r"y0\s*:\s*([0-9.E+-]+)", text),
-+        }
++    ("ag", r"Ag\s*:\s*([0-9.E+-]+)", float),
++    ("axx", r"Axx\s*:\s*([0-9.E+-]+)", float),
++    ("ayy", r"Ayy\s*:\s*([0-9.E+-]+)", float),
++    ("ixx", r"Ixx\s*:\s*([0-9.E+-]+)", float),
++    ("iyy", r"Iyy\s*:\s*([0-9.E+-]+)", float),
++    ("j", r"J\s*:\s*([0-9.E+-]+)", float),
++    ("zxx", r"Zxx\s*:\s*([0-9.E+-]+)", float),
++    ("zyy", r"Zyy\s*:\s*([0-9.E+-]+)", float),
++    ("sxx_pos", r"Sxx\+:\s*([0-9.E+-]+)", float),
++    ("sxx_neg", r"Sxx-:\s*([0-9.E+-]+)", float),
++    ("syy_pos", r"Syy\+:\s*([0-9.E+-]+)", float),
++    ("syy_neg", r"Syy-:\s*([0-9.E+-]+)", float),
++    ("cw", r"Cw\s*:\s*([0-9.E+-]+)", float),
++    ("x0", r"x0\s*:\s*([0-9.E+-]+)", float),
++    ("y0", r"y0\s*:\s*([0-9.E+-]+)", float),
++    ("fy", r"Fyld:\s*([0-9.]+)", float),
++    ("fu", r"Fu:\s*([0-9.]+)", float),
++    ("length", r"Actual Member Length:\s*([0-9.]+)", float),
++]
++REPORT_FIELDS += [(param.lower(), fr"{param}:\s*([0-9.]+)", float) for param in ["Kx", "Ky", "NSF", "SLF", "CSP"]]
++REPORT_FIELDS += [
++    ("lcx_over_rx", r"Lcx/rx\s*=\s*([0-9.]+)", float),
++    ("lcy_over_ry", r"Lcy/ry\s*=\s*([0-9.]+)", float),
++    ("fex", r"Fex\s*=\s*([0-9.]+)", float),
++    ("fey", r"Fey\s*=\s*([0-9.]+)", float),
++    ("fe_ftb", r"Fe\s*=\s*([0-9.]+)(?=\s*ksi\s*\n\|\s*Crit\. F-T-B Stress\s*:\s*Fcr\s*=)", float),
++    ("fcrx", r"Fcrx\s*=\s*([0-9.]+)", float),
++    ("fcry", r"Fcry\s*=\s*([0-9.]+)", float),
++    ("fcr_ftb", r"Crit\. F-T-B Stress\s*:\s*Fcr\s*=\s*([0-9.]+)", float),
++    ("cbx", r"CbX\s*=\s*([0-9.]+)", float),
++    ("lpx", r"LpX\s*=\s*([0-9.]+)", float),
++    ("lrx", r"LrX\s*=\s*([0-9.]+)", float),
++    ("rts", r"Rts\s*=\s*([0-9.]+)", float),
++    ("mn_ltb", r"Nom L-T-B Cap\s*:\s*Mnx\s*=\s*([0-9.]+)", float),
++    ("mn_flb_x", r"Nom F-L-B Cap\s*:\s*Mnx\s*=\s*([0-9.]+)", float),
++    ("mn_flb_y", r"Nom F-L-B Cap\s*:\s*Mny\s*=\s*([0-9.]+)", float),
++    ("pn_tensile_yield", r"Nom\. Ten\. Yld Cap\s*:\s*Pn\s*=\s*([0-9.]+)", float),
++    ("pn_tensile_rupture", r"Nom\. Ten\. Rpt Cap\s*:\s*Pn\s*=\s*([0-9.]+)", float),
++    ("ae", r"Effective area\s*:\s*Ae\s*=\s*([0-9.]+)", float),
++    ("pnx", r"Nom\. Flexural Buckling\s*:\s*Pnx\s*=\s*([0-9.]+)", float),
++    ("pny", r"Nom\. Flexural Buckling\s*:\s*Pny\s*=\s*([0-9.]+)", float),
++    ("pn_ftb", r"Nom\. Flex-tor Buckling\s*:\s*Pn\s*=\s*([0-9.]+)", float),
++    ("pc", r"Axial Capacity\s*:\s*Pc\s*=\s*([0-9.]+)", float),
++    ("mcx", r"Moment Capacity\s*:\s*Mcx\s*=\s*([0-9.]+)", float),
++    ("mcy", r"Moment Capacity\s*:\s*Mcy\s*=\s*([0-9.]+)", float),
++    # flange slenderness from the flexure classification table
++    ("flange_lambda", r"Flange: [A-Za-z]+\s+([0-9.]+)(?=\s+\S+\s+[0-9.]+\s+[0-9.]+)", float),
++]
++
++
++
++def build_scanner(fields):
++    """
++    Compiles all field patterns into a single alternation, grouped by their
++    leading character so the regex engine can skip ahead to the next possible
++    label instead of trying every pattern at every position. Returns the
++    pattern and the fields in group order (match.lastindex - 1 indexes it).
++    """
++    by_first: Dict[str, list] = {}
++    for field in fields:
++        by_first.setdefault(field[1][0], []).append(field)
++    ordered = [field for group in by_first.values() for field in group]
++    pattern = "|".join(
++        re.escape(first) + "(?:" + "|".join(f"(?:{field[1][1:]})" for field in group) + ")"
++        for first, group in by_first.items()
 +    )
++    return re.compile(pattern, re.MULTILINE), ordered
 +
-+    values["fy"] = extract_value(r"Fyld:\s*([0-9.]+)", text)
-+    values["fu"] = extract_value(r"Fu:\s*([0-9.]+)", text)
-+    values["length"] = extract_value(r"Actual Member Length:\s*([0-9.]+)", text)
 +
-+    for param in ["Kx", "Ky", "NSF", "SLF", "CSP"]:
-+        values[param.lower()] = extract_value(fr"{param}:\s*([0-9.]+)", text)
++REPORT_SCANNER, SCANNER_FIELDS = build_scanner(REPORT_FIELDS)
 +
-+    values["lcx_over_rx"] = extract_value(r"Lcx/rx\s*=\s*([0-9.]+)", text)
-+    values["lcy_over_ry"] = extract_value(r"Lcy/ry\s*=\s*([0-9.]+)", text)
-+    values["fex"] = extract_value(r"Fex\s*=\s*([0-9.]+)", text)
-+    values["fey"] = extract_value(r"Fey\s*=\s*([0-9.]+)", text)
-+    values["fe_ftb"] = extract_value(r"Fe\s*=\s*([0-9.]+)\s*ksi\s*\n\|\s*Crit\. F-T-B Stress\s*:\s*Fcr\s*=", text)
-+    values["fcrx"] = extract_value(r"Fcrx\s*=\s*([0-9.]+)", text)
-+    values["fcry"] = extract_value(r"Fcry\s*=\s*([0-9.]+)", text)
-+    values["fcr_ftb"] = extract_value(r"Crit\. F-T-B Stress\s*:\s*Fcr\s*=\s*([0-9.]+)", text)
 +
-+    values["cbx"] = extract_value(r"CbX\s*=\s*([0-9.]+)", text)
-+    values["lpx"] = extract_value(r"LpX\s*=\s*([0-9.]+)", text)
-+    values["lrx"] = extract_value(r"LrX\s*=\s*([0-9.]+)", text)
-+    values["rts"] = extract_value(r"Rts\s*=\s*([0-9.]+)", text)
-+
-+    values["mn_ltb"] = extract_value(r"Nom L-T-B Cap\s*:\s*Mnx\s*=\s*([0-9.]+)", text)
-+    values["mn_flb_x"] = extract_value(r"Nom F-L-B Cap\s*:\s*Mnx\s*=\s*([0-9.]+)", text)
-+    values["mn_flb_y"] = extract_value(r"Nom F-L-B Cap\s*:\s*Mny\s*=\s*([0-9.]+)", text)
++def scan_report(text: str):
++    """
++    Walks the report once and yields (offset, key, value) for every field
++    occurrence, in document order.
++    """
++    for match in REPORT_SCANNER.finditer(text):
++        key, _, cast = SCANNER_FIELDS[match.lastindex - 1]
++        try:
++            value = cast(match.group(match.lastindex).replace(",", ""))
++        except ValueError:
++            value = None
++        yield match.start(), key, value
 +
-+    values["pn_tensile_yield"] = extract_value(r"Nom\. Ten\. Yld Cap\s*:\s*Pn\s*=\s*([0-9.]+)", text)
-+    values["pn_tensile_rupture"] = extract_value(r"Nom\. Ten\. Rpt Cap\s*:\s*Pn\s*=\s*([0-9.]+)", text)
-+    values["ae"] = extract_value(r"Effective area\s*:\s*Ae\s*=\s*([0-9.]+)", text)
 +
-+    values["pnx"] = extract_value(r"Nom\. Flexural Buckling\s*:\s*Pnx\s*=\s*([0-9.]+)", text)
-+    values["pny"] = extract_value(r"Nom\. Flexural Buckling\s*:\s*Pny\s*=\s*([0-9.]+)", text)
-+    values["pn_ftb"] = extract_value(r"Nom\. Flex-tor Buckling\s*:\s*Pn\s*=\s*([0-9.]+)", text)
++def parse_report(text: str) -> Dict[str, float]:
++    values: Dict[str, float] = dict.fromkeys(key for key, _, _ in REPORT_FIELDS)
++    seen = set()
++    for _, key, value in scan_report(text):
++        # The first occurrence wins, as with a re.search per field
++        if key not in seen:
++            seen.add(key)
++            values[key] = value
++    return values
 +
-+    values["pc"] = extract_value(r"Axial Capacity\s*:\s*Pc\s*=\s*([0-9.]+)", text)
-+    values["mcx"] = extract_value(r"Moment Capacity\s*:\s*Mcx\s*=\s*([0-9.]+)", text)
-+    values["mcy"] = extract_value(r"Moment Capacity\s*:\s*Mcy\s*=\s*([0-9.]+)", text)
 +
-+    return values
++def parse_reports(text: str):
++    """
++    Multi-member mode: splits a full STAAD run into one values dict per
++    "Member No:" header in the same single pass. Each dict also carries the
++    text of its own block under "raw_text".
++    """
++    reports = []
++    values, seen, begin = None, set(), 0
++    for offset, key, value in scan_report(text):
++        if key == "member_no":
++            if values is not None:
++                values["raw_text"] = text[begin:offset]
++                reports.append(values)
++            values, seen, begin = dict.fromkeys(key for key, _, _ in REPORT_FIELDS), set(), offset
++        if values is None or key in seen:
++            continue
++        seen.add(key)
++        values[key] = value
++    if values is not None:
++        values["raw_text"] = text[begin:]
++        reports.append(values)
++    return reports
 +
 +
 +def tensile_capacity(values: Dict[str, float]) -> Dict[str, float]:
@@ -308,13 +370,20 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +    return 0.877 * fe
 +
 +
++# Members that share section, material and length share their capacities;
++# the capacity functions below are memoised on exactly the inputs they read.
++CAPACITY_CACHE_SIZE = 4096
++
++
 +def compression_capacity(values: Dict[str, float]) -> Dict[str, float]:
-+    ag = values["ag"]
-+    fy = values["fy"]
-+    e = 29000.0
++    return dict(_compression_capacity(
++        values["ag"], values["fy"], values.get("lcx_over_rx"), values.get("lcy_over_ry"), values.get("fe_ftb")
++    ))
++
 +
-+    lcx_rx = values.get("lcx_over_rx")
-+    lcy_ry = values.get("lcy_over_ry")
++@lru_cache(maxsize=CAPACITY_CACHE_SIZE)
++def _compression_capacity(ag, fy, lcx_rx, lcy_ry, fe_ftb) -> Dict[str, float]:
++    e = 29000.0
 +
 +    fe_x = (math.pi**2 * e) / (lcx_rx**2) if lcx_rx else None
 +    fe_y = (math.pi**2 * e) / (lcy_ry**2) if lcy_ry else None
@@ -325,7 +394,6 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +    pn_x = fcr_x * ag if fcr_x else None
 +    pn_y = fcr_y * ag if fcr_y else None
 +
-+    fe_ftb = values.get("fe_ftb")
 +    fcr_ftb = fcr_from_fe(fe_ftb, fy) if fe_ftb else None
 +    pn_ftb = fcr_ftb * ag if fcr_ftb else None
 +
@@ -343,16 +411,28 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +
 +
 +def flexural_capacity(values: Dict[str, float]) -> Dict[str, float]:
-+    fy = values["fy"]
-+    zxx = values.get("zxx") or 0
-+    zyy = values.get("zyy") or 0
-+    sxx = values.get("sxx_pos") or values.get("sxx_neg") or 0
-+    syy = values.get("syy_pos") or values.get("syy_neg") or 0
-+    cb = values.get("cbx", 1.0)
-+    lp = values.get("lpx", 0)
-+    lr = values.get("lrx", 0)
-+    lb = values.get("length", 0)
-+
++    lam = values.get("flange_lambda")
++    if lam is None:
++        # fallback using provided table values
++        lam = 9.2
++    return dict(_flexural_capacity(
++        values["fy"],
++        values.get("zxx") or 0,
++        values.get("zyy") or 0,
++        values.get("sxx_pos") or values.get("sxx_neg") or 0,
++        values.get("syy_pos") or values.get("syy_neg") or 0,
++        values.get("cbx", 1.0),
++        values.get("lpx", 0),
++        values.get("lrx", 0),
++        values.get("length", 0),
++        lam,
++        values.get("flange_lp", 9.15),
++        values.get("flange_lr", 24.08),
++    ))
++
++
++@lru_cache(maxsize=CAPACITY_CACHE_SIZE)
++def _flexural_capacity(fy, zxx, zyy, sxx, syy, cb, lp, lr, lb, lam, lam_p, lam_r) -> Dict[str, float]:
 +    mp_x = fy * zxx
 +    mr_x = 0.7 * fy * sxx
 +    if lr and lp and lr > lp:
@@ -360,12 +440,6 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +    else:
 +        mn_ltb = mp_x
 +
-+    lambda_f = extract_value(r"Flange: [A-Za-z]+\s+([0-9.]+)\s+\S+\s+([0-9.]+)\s+([0-9.]+)", values.get("raw_text", ""))
-+    # fallback using provided table values
-+    lam = values.get("flange_lambda", 9.2) if lambda_f is None else lambda_f
-+    lam_p = values.get("flange_lp", 9.15)
-+    lam_r = values.get("flange_lr", 24.08)
-+
 +    mp_y = fy * zyy
 +    mr_y = 0.7 * fy * syy
 +
@@ -391,6 +465,14 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +    }
 +
 +
++def capacity_cache_info():
++    """Hit/miss counters of the memoised capacity functions."""
++    return {
++        "compression": _compression_capacity.cache_info(),
++        "flexure": _flexural_capacity.cache_info(),
++    }
++
++
 +def interaction_ratio(values: Dict[str, float]) -> Optional[float]:
 +    pu = abs(values.get("pz", 0.0))
 +    pc = values.get("pc")
@@ -437,9 +519,23 @@ index 0000000000000000000000000000000000000000..d8f26d6e5204a994cdd1c3161c7d5a69
 +
 +    with st.expander("Paste STAAD design report excerpt", expanded=True):
 +        report_text = st.text_area("STAAD report text", value=DEFAULT_REPORT, height=320)
-+
-+    values = parse_report(report_text)
-+    values["raw_text"] = report_text
++        uploaded = st.file_uploader("Or upload a full STAAD output file", type=["anl", "out", "txt"])
++    if uploaded is not None:
++        report_text = uploaded.getvalue().decode("utf-8", errors="replace")
++
++    # Multi-member mode: a full run is scanned once and split by member
++    reports = parse_reports(report_text)
++    if len(reports) > 1:
++        st.caption(f"{len(reports)} members found in the report.")
++        index = st.selectbox(
++            "Member",
++            range(len(reports)),
++            format_func=lambda i: f"Member {reports[i]['member_no']} ({reports[i]['profile']})",
++        )
++        values = reports[index]
++    else:
++        values = parse_report(report_text)
++        values["raw_text"] = report_text
 +
 +    st.markdown("### Input summary")
 +    input_data = {
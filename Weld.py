@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
 
+from page_timing import performance_panel
+from steeldesign.timing import Timings, timing_enabled
+
 # ---------------------------------------------------------
 # Page config + CSS
 # ---------------------------------------------------------
@@ -8,6 +11,18 @@ st.set_page_config(
     page_title="Fillet Weld Capacity – Calc Sheet",
     layout="wide"
 )
+timings = Timings("Weld", timing_enabled(st.session_state.get("perf_timing"))).start()
+
+
+def stop_page(timings):
+    """
+    st.stop() with the performance panel rendered first: a widget left out
+    of a run loses its state, so stopping without it would untick "Time
+    this page".
+    """
+    performance_panel(timings)
+    st.stop()
+
 
 st.markdown(
     """
@@ -122,6 +137,147 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# ---------------------------------------------------------
+# Batch mode (CSV of weld groups)
+# ---------------------------------------------------------
+mode = st.sidebar.radio("Mode", ["Single weld group", "Batch (CSV)", "Size welds (CSV)"], index=0)
+timings.annotate(mode=mode)
+
+if mode == "Batch (CSV)":
+    from steeldesign.weld import WELD_COLUMNS, read_weld_table, weld_capacity, worst_welds
+    from steeldesign.weld_tables import ECCENTRIC_COLUMNS, eccentric_capacity_table, load_c_tables
+
+    st.title("Fillet Weld Capacity – Batch Check")
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown('<div class="section-title">Weld Table</div>', unsafe_allow_html=True)
+    st.markdown(
+        f"""
+        <div class="small-caption">
+        One weld group per row with columns {", ".join(WELD_COLUMNS)}
+        (F<sub>EXX</sub> ksi, w in, L in, n lines, R<sub>u</sub> kips, LRFD or ASD).
+        Eccentric groups add {", ".join(ECCENTRIC_COLUMNS)} (group line / parallel / L / C,
+        kL and e in, θ deg) and are checked with tabulated C coefficients.
+        Other columns (marks, ids) are carried through.
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    uploaded = st.file_uploader("Weld CSV", type=["csv"])
+    worst_count = st.number_input("Worst-utilized welds to list", min_value=1, max_value=1000, value=20, step=1)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if uploaded is None:
+        st.info("Upload a weld CSV to run the batch check.")
+        stop_page(timings)
+
+    timings.stage("parse")
+    try:
+        weld_table = read_weld_table(uploaded)
+    except ValueError as exc:
+        st.error(str(exc))
+        stop_page(timings)
+
+    timings.annotate(input_size=uploaded.size, rows=len(weld_table))
+    timings.stage("calc")
+    if all(col in weld_table.columns for col in ECCENTRIC_COLUMNS):
+        with st.spinner("Loading eccentric weld coefficient tables..."):
+            load_c_tables()
+        try:
+            batch = eccentric_capacity_table(weld_table)
+        except ValueError as exc:
+            st.error(str(exc))
+            stop_page(timings)
+    else:
+        batch = weld_capacity(weld_table)
+    n_ng = int((batch["status"] == "NG").sum())
+    timings.stage("render")
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown('<div class="section-title">Result Summary</div>', unsafe_allow_html=True)
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Weld groups", f"{len(batch):,}")
+    m2.metric("NG", f"{n_ng:,}")
+    m3.metric("Max utilization", f"{batch['utilization'].max():.2f}" if len(batch) else "–")
+    if n_ng:
+        st.error(f"GLOBAL CHECK: NG – {n_ng} weld group(s) exceed design strength.")
+    else:
+        st.success("GLOBAL CHECK: OK – All demands are ≤ design strength.")
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown('<div class="section-title">Worst-Utilized Welds</div>', unsafe_allow_html=True)
+    st.dataframe(worst_welds(batch, int(worst_count)))
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown('<div class="section-title">All Welds (OK / NG)</div>', unsafe_allow_html=True)
+    st.dataframe(batch)
+    st.download_button(
+        "Download results CSV",
+        batch.to_csv(index=False).encode("utf-8"),
+        file_name="weld_check.csv",
+        mime="text/csv"
+    )
+    st.markdown('</div>', unsafe_allow_html=True)
+    stop_page(timings)
+
+# ---------------------------------------------------------
+# Weld sizing mode (connection schedule CSV)
+# ---------------------------------------------------------
+if mode == "Size welds (CSV)":
+    from steeldesign.weld import SIZING_COLUMNS, read_weld_table, size_welds
+
+    st.title("Fillet Weld Sizing – Connection Schedule")
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown('<div class="section-title">Connection Schedule</div>', unsafe_allow_html=True)
+    st.markdown(
+        f"""
+        <div class="small-caption">
+        One connection per row with columns {", ".join(SIZING_COLUMNS)}
+        (t_plate = thinner part joined, in) and optionally L_max (in, per weld line).
+        Returns the smallest 1/16" weld size within the J2.2b limits, then the shortest length.
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    uploaded = st.file_uploader("Schedule CSV", type=["csv"])
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    if uploaded is None:
+        st.info("Upload a connection schedule CSV to size the welds.")
+        stop_page(timings)
+
+    timings.stage("parse")
+    try:
+        schedule = read_weld_table(uploaded, SIZING_COLUMNS)
+    except ValueError as exc:
+        st.error(str(exc))
+        stop_page(timings)
+
+    timings.annotate(input_size=uploaded.size, rows=len(schedule))
+    timings.stage("calc")
+    sized = size_welds(schedule)
+    n_ng = int((sized["status"] == "NG").sum())
+    timings.stage("render")
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown('<div class="section-title">Sized Welds</div>', unsafe_allow_html=True)
+    if n_ng:
+        st.error(f"{n_ng} connection(s) need more than the maximum weld size or L_max.")
+    else:
+        st.success("All connections sized within the J2.2b limits.")
+    st.dataframe(sized)
+    st.download_button(
+        "Download sized schedule CSV",
+        sized.to_csv(index=False).encode("utf-8"),
+        file_name="weld_sizes.csv",
+        mime="text/csv"
+    )
+    st.markdown('</div>', unsafe_allow_html=True)
+    stop_page(timings)
+
 # ---------------------------------------------------------
 # Calculation sheet header (project info)
 # ---------------------------------------------------------
@@ -219,6 +375,7 @@ st.markdown('</div>', unsafe_allow_html=True)
 # ---------------------------------------------------------
 # CALCULATIONS
 # ---------------------------------------------------------
+timings.stage("calc")
 # Effective throat
 t = 0.707 * weld_size  # in
 
@@ -250,6 +407,7 @@ ok_global = utilization <= 1.0
 # ---------------------------------------------------------
 # INPUT SUMMARY TABLE
 # ---------------------------------------------------------
+timings.stage("render")
 st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
 st.markdown('<div class="section-title">Input Summary</div>', unsafe_allow_html=True)
 
@@ -396,3 +554,59 @@ Notes:<br>
 )
 
 st.markdown('</div>', unsafe_allow_html=True)
+
+# ---------------------------------------------------------
+# ECCENTRIC LOAD (instantaneous center method)
+# ---------------------------------------------------------
+if st.sidebar.checkbox("Eccentric load (IC method)", value=False):
+    from steeldesign.weld import WELD_GROUPS, eccentric_capacity, ic_coefficient
+
+    st.markdown('<div class="sheet-box">', unsafe_allow_html=True)
+    st.markdown(
+        '<div class="section-title">Eccentric Load – Instantaneous Center Method (AISC Manual Part 8)</div>',
+        unsafe_allow_html=True
+    )
+
+    e1, e2, e3, e4 = st.columns(4)
+    group = e1.selectbox(
+        "Weld group",
+        WELD_GROUPS,
+        index=1 if n_lines == 2 else 0,
+        help="Vertical line(s) of length L; horizontal legs kL run toward the load."
+    )
+    leg = e2.number_input("Spacing / leg length kL (in)", min_value=0.0, max_value=200.0, value=weld_length, step=0.5)
+    ecc = e3.number_input("Eccentricity from centroid aL (in)", min_value=0.0, max_value=500.0, value=weld_length / 2, step=0.5)
+    load_angle = e4.number_input("Load angle from vertical θ (deg)", min_value=0.0, max_value=90.0, value=0.0, step=15.0)
+
+    timings.stage("ic")
+    k_ratio = leg / weld_length
+    a_ratio = ecc / weld_length
+    C = ic_coefficient(group, k_ratio, a_ratio, load_angle)
+    D = weld_size * 16
+    C1 = F_exx / 70.0
+    R_ecc = eccentric_capacity(group, weld_length, k_ratio, a_ratio, load_angle, weld_size, F_exx, design_method)
+    utilization_ecc = Ru / R_ecc if R_ecc > 0 else 0.0
+    timings.stage("render")
+
+    st.latex(r"R_n = C\,C_1\,D\,l")
+    st.latex(
+        rf"R_n = {C:.3f} \times {C1:.3f} \times {D:.2f} \times {weld_length:.2f}\,\text{{in}}"
+        rf" = {C * C1 * D * weld_length:.2f}\,\text{{kips}}"
+    )
+    ecc_rows = [
+        ("k = kL / L", f"{k_ratio:.3f}"),
+        ("a = aL / L", f"{a_ratio:.3f}"),
+        ("Coefficient C", f"{C:.3f}"),
+        (f"Design strength {design_label} (kips)", f"{R_ecc:.2f}"),
+        ("Demand / Capacity ratio", f"{utilization_ecc:.2f}")
+    ]
+    st.table(pd.DataFrame(ecc_rows, columns=["Result", "Value"]))
+
+    if utilization_ecc <= 1.0:
+        st.success("ECCENTRIC CHECK: OK – Demand is ≤ design strength.")
+    else:
+        st.error("ECCENTRIC CHECK: NG – Demand exceeds design strength.")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+performance_panel(timings)
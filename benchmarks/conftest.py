@@ -0,0 +1,103 @@
+"""
+Throughput benchmarks (pytest-benchmark) on synthetic STAAD output.
+
+    pytest benchmarks                                  # 1 and 1,000 members
+    pytest benchmarks --bench-members 1,1000,100000
+    pytest benchmarks --check-baseline                 # regression gate
+    pytest benchmarks --update-baseline                # after a deliberate change
+
+Every benchmark reports members/second (from the median round) in its
+extra_info. The figures in baseline.json are absolute rates of the machine
+they were recorded on, so comparing against them is opt-in: with
+--check-baseline a benchmark fails if its rate falls more than
+--regression-threshold below the stored figure for it and the member
+count. Record the baseline on the machine that runs the gate first; the
+default threshold of 40% allows for the run-to-run spread of shared
+machines. Counts without a stored figure are reported but not checked.
+"""
+import itertools
+import json
+import os
+
+import pytest
+
+from steeldesign.synthetic import synthetic_members
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Distinct blocks held in memory; larger counts cycle through them
+BLOCK_POOL = 10000
+
+# Benchmark rounds: ~3,000 members per benchmark, at least one round
+ROUND_MEMBERS = 3000
+MAX_ROUNDS = 1000
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("steeldesign benchmarks")
+    group.addoption("--bench-members", default="1,1000",
+                    help="comma-separated member counts to benchmark (default: 1,1000)")
+    group.addoption("--check-baseline", action="store_true",
+                    help="fail benchmarks whose members/s fall below baseline.json")
+    group.addoption("--regression-threshold", type=float, default=0.4,
+                    help="allowed fractional drop in members/s below baseline.json")
+    group.addoption("--update-baseline", action="store_true",
+                    help="write the measured members/s to baseline.json instead of checking")
+
+
+def pytest_generate_tests(metafunc):
+    if "members" in metafunc.fixturenames:
+        counts = [int(n) for n in metafunc.config.getoption("--bench-members").split(",")]
+        metafunc.parametrize("members", counts, ids=[f"{n}members" for n in counts])
+
+
+@pytest.fixture(scope="session")
+def block_pool():
+    return list(synthetic_members(BLOCK_POOL, seed=1))
+
+
+@pytest.fixture
+def blocks(block_pool, members):
+    """`members` synthetic member blocks (repeating after BLOCK_POOL)."""
+    return list(itertools.islice(itertools.cycle(block_pool), members))
+
+
+@pytest.fixture
+def rounds(members):
+    return max(1, min(MAX_ROUNDS, ROUND_MEMBERS // members))
+
+
+@pytest.fixture(scope="session")
+def baseline(request):
+    with open(BASELINE, encoding="utf-8") as fh:
+        figures = json.load(fh)
+    yield figures
+    if request.config.getoption("--update-baseline"):
+        with open(BASELINE, "w", encoding="utf-8") as fh:
+            json.dump(figures, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+
+
+@pytest.fixture
+def throughput(request, baseline):
+    """
+    check(benchmark, name, members): records members/s of the finished
+    benchmark and, with --check-baseline, compares it with baseline.json.
+    """
+    def check(benchmark, name, members):
+        if benchmark.disabled:
+            return
+        rate = members / benchmark.stats.stats.median
+        benchmark.extra_info["members_per_second"] = round(rate)
+        key = f"{name}[{members}]"
+        if request.config.getoption("--update-baseline"):
+            baseline[key] = round(rate)
+            return
+        if not request.config.getoption("--check-baseline"):
+            return
+        expected = baseline.get(key)
+        if expected is None:
+            return
+        floor = expected * (1 - request.config.getoption("--regression-threshold"))
+        assert rate >= floor, f"{key}: {rate:,.0f} members/s, baseline {expected:,.0f} (floor {floor:,.0f})"
+    return check
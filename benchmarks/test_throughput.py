@@ -0,0 +1,133 @@
+"""
+Members/second of the parsers and of the recalculation.
+
+STAAD_CHECK's parse_staad_report and STAAD.py's block parser live in the
+core as steeldesign.parser.parse_staad_report and
+steeldesign.blocks.parse_check_blocks; those are what is measured.
+test_member_table also reports the memory held per member by parsed
+dicts, MemberRecord and MemberTable.
+
+STAAD2.py is a patch that creates app.py; test_staad2_parse_report
+imports the app.py it carries and measures its parse_report.
+"""
+import importlib.util
+import os
+import tracemalloc
+
+import pytest
+
+from steeldesign.batch import check_file
+from steeldesign.blocks import parse_check_blocks
+from steeldesign.checks import calculate_results, section_capacities
+from steeldesign.parser import parse_staad_report
+from steeldesign.records import MemberRecord, MemberTable
+from steeldesign.stream import iter_member_blocks
+from steeldesign.synthetic import synthetic_members
+
+STAAD2 = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "STAAD2.py")
+
+
+def test_parse_staad_report(benchmark, throughput, blocks, members, rounds):
+    def run():
+        for block in blocks:
+            parse_staad_report(block)
+    benchmark.pedantic(run, rounds=rounds, iterations=1, warmup_rounds=min(1, rounds - 1))
+    throughput(benchmark, "parse_staad_report", members)
+
+
+def test_parse_check_blocks(benchmark, throughput, blocks, members, rounds):
+    def run():
+        for block in blocks:
+            parse_check_blocks(block)
+    benchmark.pedantic(run, rounds=rounds, iterations=1, warmup_rounds=min(1, rounds - 1))
+    throughput(benchmark, "parse_check_blocks", members)
+
+
+def test_iter_member_blocks(benchmark, throughput, blocks, members, rounds):
+    lines = "".join(blocks).splitlines(keepends=True)
+
+    def run():
+        for _ in iter_member_blocks(lines):
+            pass
+    benchmark.pedantic(run, rounds=rounds, iterations=1, warmup_rounds=min(1, rounds - 1))
+    throughput(benchmark, "iter_member_blocks", members)
+
+
+def test_calculate_results(benchmark, throughput, blocks, members, rounds):
+    parsed = [parse_staad_report(block) for block in blocks]
+
+    def run():
+        for data in parsed:
+            calculate_results(data)
+    # Cold capacity cache each round, as for a model seen for the first time
+    benchmark.pedantic(run, setup=section_capacities.cache_clear, rounds=rounds, iterations=1,
+                       warmup_rounds=min(1, rounds - 1))
+    throughput(benchmark, "calculate_results", members)
+
+
+def test_check_file(benchmark, throughput, members, rounds, tmp_path_factory):
+    # Whole output file on disk, parsed and checked in this process
+    path = tmp_path_factory.mktemp("synthetic") / f"model_{members}.anl"
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.writelines(synthetic_members(members, seed=2))
+
+    def run():
+        for _ in check_file(path, workers=1):
+            pass
+    benchmark.pedantic(run, rounds=rounds, iterations=1)
+    throughput(benchmark, "check_file", members)
+
+
+def _allocated(build):
+    """Bytes still allocated by what build() returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        return tracemalloc.get_traced_memory()[0] - before, kept
+    finally:
+        tracemalloc.stop()
+
+
+def test_member_table(benchmark, throughput, blocks, members, rounds):
+    parsed = [parse_staad_report(block) for block in blocks]
+
+    def run():
+        MemberTable.from_reports(parsed)
+    # A one-member build is mostly fixed cost; let allocator and caches settle
+    benchmark.pedantic(run, rounds=rounds, iterations=1, warmup_rounds=min(10, rounds - 1))
+    throughput(benchmark, "member_table", members)
+
+    dicts, _ = _allocated(lambda: [parse_staad_report(block) for block in blocks])
+    records, _ = _allocated(lambda: [MemberRecord.from_report(data) for data in parsed])
+    table_bytes, table = _allocated(lambda: MemberTable.from_reports(parsed))
+    benchmark.extra_info.update(
+        dict_bytes_per_member=round(dicts / members),
+        record_bytes_per_member=round(records / members),
+        table_bytes_per_member=round(table_bytes / members),
+        table_nbytes_per_member=round(table.nbytes / members),
+    )
+
+
+@pytest.fixture(scope="session")
+def staad2_app(tmp_path_factory):
+    """The app.py module that the STAAD2.py patch adds."""
+    pytest.importorskip("streamlit")
+    with open(STAAD2, encoding="utf-8") as fh:
+        lines = fh.read().splitlines(keepends=True)
+    start = next(i for i, line in enumerate(lines) if line.startswith("@@")) + 1
+    end = next(i for i, line in enumerate(lines) if line.startswith("EOF"))
+    path = tmp_path_factory.mktemp("staad2") / "app.py"
+    path.write_text("".join(line[1:] for line in lines[start:end]), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("staad2_app", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_staad2_parse_report(benchmark, throughput, staad2_app, blocks, members, rounds):
+    def run():
+        for block in blocks:
+            staad2_app.parse_report(block)
+    benchmark.pedantic(run, rounds=rounds, iterations=1, warmup_rounds=min(1, rounds - 1))
+    throughput(benchmark, "staad2_parse_report", members)
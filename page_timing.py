@@ -0,0 +1,15 @@
+"""
+"Performance" sidebar panel shared by the Streamlit pages; the rows and
+total come from `steeldesign.timing.Timings.summary`.
+"""
+import streamlit as st
+
+
+def performance_panel(timings):
+    """Sidebar panel with the stage timings of this run (see steeldesign.timing)."""
+    rows, total = timings.summary()
+    with st.sidebar.expander("Performance"):
+        st.checkbox("Time this page", key="perf_timing")
+        if rows:
+            st.table(rows)
+            st.caption(total)
@@ -0,0 +1,23 @@
+"""
+Streamlit-free core of the SteelDesign calculation sheets.
+
+The Streamlit apps (STAAD_CHECK.py, AG_STAAD.py, ...) only render; parsing of
+STAAD.Pro output and the AISC 360-16 recalculation live here so they can be
+used from scripts and batch jobs as well.
+"""
+from steeldesign.blocks import parse_check_blocks
+from steeldesign.checks import calculate_results
+from steeldesign.index import MemberIndex, build_index
+from steeldesign.parser import parse_staad_report, parse_value
+from steeldesign.stream import iter_member_blocks, iter_member_reports
+
+__all__ = [
+    "MemberIndex",
+    "build_index",
+    "calculate_results",
+    "iter_member_blocks",
+    "iter_member_reports",
+    "parse_check_blocks",
+    "parse_staad_report",
+    "parse_value",
+]
@@ -0,0 +1,131 @@
+"""
+Parallel checking of complete STAAD.Pro output files.
+
+The file is cut at member boundaries with one scan (see
+`index.scan_offsets`), the byte ranges are grouped into chunks of whole
+members and the chunks are handed to a `ProcessPoolExecutor`. Each worker
+reads only its own range and returns one summary row per member; results
+come back in chunk order, so the output is the same for any worker count.
+
+    python -m steeldesign.batch run.anl --workers 32 -o summary.csv
+"""
+import argparse
+import csv
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from steeldesign.index import scan_offsets
+from steeldesign.parser import parse_staad_report
+
+CHUNK_MEMBERS = 256
+
+SUMMARY_FIELDS = ["member", "profile", "loadcase", "status", "ratio", "ref", "governing", "governing_ratio"]
+
+
+def summary_row(data):
+    """One flat row of the recalculated results of a member."""
+    governing, governing_ratio = "", 0.0
+    for name, check in data["checks"].items():
+        if check.get("ratio", 0) > governing_ratio:
+            governing, governing_ratio = name, check["ratio"]
+    return {
+        "member": data["id"],
+        "profile": data["profile"],
+        "loadcase": data["loadcase"],
+        "status": data["status"],
+        "ratio": data["ratio"],
+        "ref": data["ref"],
+        "governing": governing,
+        "governing_ratio": governing_ratio,
+    }
+
+
+def plan_chunks(path, chunk_members=CHUNK_MEMBERS):
+    """
+    Byte ranges (start, end) of consecutive runs of `chunk_members` member
+    blocks, in file order.
+    """
+    if os.path.getsize(path) == 0:
+        return []
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        offsets = [(start, end) for _, _, start, end in scan_offsets(buf)]
+    return [
+        (offsets[i][0], offsets[min(i + chunk_members, len(offsets)) - 1][1])
+        for i in range(0, len(offsets), chunk_members)
+    ]
+
+
+def check_chunk(path, start, end, full=False):
+    """
+    Parses and checks the member blocks in path[start:end]. Returns summary
+    rows, or the complete parsed data of each member when `full` is set.
+    """
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        raw = fh.read(end - start)
+    results = []
+    for _, _, b_start, b_end in scan_offsets(raw):
+        # Same text as reading the file in text mode would give
+        text = raw[b_start:b_end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+        if not text.endswith("\n"):
+            text += "\n"
+        data = parse_staad_report(text)
+        results.append(data if full else summary_row(data))
+    return results
+
+
+def check_file(path, workers=None, chunk_members=CHUNK_MEMBERS, full=False):
+    """
+    Yields the results of every member of an output file, in file order.
+
+    `workers` is the number of processes (default: all cores); with 1 the
+    chunks are checked in this process.
+    """
+    path = os.fspath(path)
+    yield from check_ranges(path, plan_chunks(path, chunk_members), workers, full)
+
+
+def check_ranges(path, chunks, workers=None, full=False):
+    """
+    Yields the results of the member blocks in the byte ranges `chunks`
+    (each holding whole blocks), in order; see `check_file`.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        for start, end in chunks:
+            yield from check_chunk(path, start, end, full)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() returns in submission order whatever order the chunks finish in
+        jobs = pool.map(
+            check_chunk, [path] * len(chunks), *zip(*chunks), [full] * len(chunks)
+        )
+        for rows in jobs:
+            yield from rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m steeldesign.batch",
+        description="Recheck every member of a STAAD.Pro output file in parallel.",
+    )
+    parser.add_argument("path", help="STAAD output file (.ANL/.OUT)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_MEMBERS, help="members per work unit")
+    parser.add_argument("-o", "--output", help="CSV file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(check_file(args.path, args.workers, args.chunk_size))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
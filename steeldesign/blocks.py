@@ -0,0 +1,72 @@
+"""
+Check-by-check breakdown of a STAAD.Pro member design report.
+
+Every check in the detailed output is a titled box with a DEMAND / CAPACITY
+/ RATIO row and, below it, the "Intermediate Results" lines
+(Description : Symbol = Value Unit Ref). STAAD.py renders these blocks as a
+calculation pad.
+"""
+import re
+
+# | DEMAND  CAPACITY  RATIO  REFERENCE  L/C  LOC |
+MAIN_ROW = re.compile(
+    r"\|\s+([-\d\.E\+]+)\s+([-\d\.E\+]+)\s+([\d\.]+)\s+(Cl\.[\w\.\-]+|Eq\.[\w\.\-]+|Table[\w\.]+)?\s+([\d]+)\s+([\d\.]+)\s+\|"
+)
+
+# | Description : Symbol = Value Unit Ref |
+INTERMEDIATE_ROW = re.compile(
+    r"\|\s+(.*?)\s+:\s+([A-Za-z0-9/]+)\s+=\s+([-\d\.E\+]+)\s+([A-Za-z]+)?\s*([A-Za-z\.\-0-9]+)?\s*\|"
+)
+
+# Uppercase text alone inside pipes, e.g. | COMPRESSION |
+TITLE_ROW = re.compile(r"\|\s+[A-Z\s\-]+\s+\|$")
+
+
+def parse_check_blocks(text):
+    """
+    Splits a member report into its check blocks:
+    [{"title", "main": {"demand", "capacity", "ratio", "ref"} or None,
+      "intermediates": [{"desc", "sym", "val", "unit", "ref"}, ...]}, ...]
+    Values are kept as the strings STAAD printed.
+    """
+    blocks = []
+    current_block = None
+
+    for line in text.split("\n"):
+        if TITLE_ROW.match(line) and "DEMAND" not in line and "Intermediate" not in line:
+            if current_block:
+                blocks.append(current_block)
+            current_block = {
+                "title": line.strip("| ").strip(),
+                "main": None,
+                "intermediates": []
+            }
+            continue
+
+        if current_block is None:
+            continue
+
+        m = MAIN_ROW.search(line)
+        if m:
+            current_block["main"] = {
+                "demand": m.group(1),
+                "capacity": m.group(2),
+                "ratio": m.group(3),
+                "ref": m.group(4) if m.group(4) else ""
+            }
+            continue
+
+        if "Intermediate Results" not in line and "----" not in line:
+            im = INTERMEDIATE_ROW.search(line)
+            if im:
+                current_block["intermediates"].append({
+                    "desc": im.group(1).strip(),
+                    "sym": im.group(2).strip(),
+                    "val": im.group(3),
+                    "unit": im.group(4) if im.group(4) else "",
+                    "ref": im.group(5) if im.group(5) else ""
+                })
+
+    if current_block:
+        blocks.append(current_block)
+    return blocks
@@ -0,0 +1,86 @@
+"""
+Server-side results table for browsing a whole model.
+
+The summary of every member (one `batch.summary_row` per design block) is
+held here as a DataFrame; filtering, sorting and paging are done on it in
+this process, and the browser is only ever sent one page of rows. The
+frame is built from a `records.MemberTable`, so the workers send back
+columns rather than a dict per member.
+
+    frame = load_summary("run.anl")
+    rows, total = query_summary(frame, status="FAIL", sort_by="ratio", page=0)
+"""
+import numpy as np
+import pandas as pd
+
+from steeldesign.batch import CHUNK_MEMBERS, SUMMARY_FIELDS
+from steeldesign.records import LABEL_FIELDS, MISSING, load_table
+
+PAGE_SIZES = (50, 100, 250, 500)
+
+SORT_COLUMNS = ("ratio", "member", "loadcase", "profile", "governing", "status")
+
+
+def table_frame(table):
+    """
+    DataFrame of the summary fields of a MemberTable. Member and load case
+    are nullable integers (a block may have no member number); label codes
+    become categoricals without decoding a string per row.
+    """
+    frame = {}
+    for column in SUMMARY_FIELDS:
+        values = table.columns[column]
+        if column in LABEL_FIELDS:
+            labels = table.labels[column]
+            # Categories in alphabetical order, as astype("category") gives
+            frame[column] = pd.Categorical.from_codes(values, labels).reorder_categories(sorted(labels))
+        elif column in ("member", "loadcase"):
+            frame[column] = pd.arrays.IntegerArray(values, values == MISSING)
+        else:
+            frame[column] = values
+    return pd.DataFrame(frame, columns=SUMMARY_FIELDS)
+
+
+def load_summary(path, workers=None, chunk_members=CHUNK_MEMBERS):
+    """Checks every member of an output file (see records.load_table)."""
+    return table_frame(load_table(path, workers, chunk_members))
+
+
+def filter_summary(frame, status=None, profile=None, governing=None, min_ratio=None):
+    """
+    Rows matching every filter given: status and governing check exactly,
+    `profile` as a case-insensitive substring, ratio >= min_ratio.
+    """
+    mask = np.ones(len(frame), dtype=bool)
+    if status:
+        mask &= (frame["status"] == status).to_numpy()
+    if governing:
+        mask &= (frame["governing"] == governing).to_numpy()
+    if profile:
+        # Matched once per distinct profile, not once per row
+        categories = frame["profile"].cat.categories
+        hits = categories[categories.str.contains(profile, case=False, regex=False)]
+        mask &= frame["profile"].isin(hits).to_numpy()
+    if min_ratio:
+        mask &= (frame["ratio"] >= min_ratio).to_numpy()
+    return frame[mask]
+
+
+def page_count(total, page_size):
+    return max(1, -(-total // page_size))
+
+
+def query_summary(frame, status=None, profile=None, governing=None, min_ratio=None,
+                  sort_by="ratio", descending=True, page=0, page_size=PAGE_SIZES[0]):
+    """
+    One page of the filtered and sorted summary, and the number of rows
+    matching the filters. `page` counts from 0 and is clamped to the last
+    page.
+    """
+    rows = filter_summary(frame, status, profile, governing, min_ratio)
+    total = len(rows)
+    if sort_by:
+        # Stable, so ties stay in file order; categories sort alphabetically
+        rows = rows.sort_values(sort_by, ascending=not descending, kind="stable", na_position="last")
+    page = min(max(page, 0), page_count(total, page_size) - 1)
+    return rows.iloc[page * page_size:(page + 1) * page_size], total
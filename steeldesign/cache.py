@@ -0,0 +1,190 @@
+"""
+Content-addressed cache for parse and check results.
+
+Streamlit reruns a page top to bottom on every widget change, and several
+users often paste the same run. Results are therefore keyed by a SHA-256 of
+the input text plus any design parameters (`content_key`), kept in one
+process-wide, size-bounded LRU (`shared_cache`), and, if the environment
+variable STEELDESIGN_CACHE_DIR names a directory, also pickled there so
+they survive restarts and are shared between server processes.
+
+Cached values are shared between callers and must be treated as read-only.
+
+Loading a pickle can run arbitrary code, so anyone who can write to the
+cache directory can run code in the server. Use a directory that only the
+server's user can write to; one the cache creates itself is made with mode
+0o700. Do not point STEELDESIGN_CACHE_DIR at a shared or world-writable
+location.
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+from steeldesign.parser import parse_staad_report
+
+# Part of every key: bump when parse/check output changes so that entries
+# on disk from an older version are not used
+CACHE_VERSION = 1
+
+CACHE_SIZE = 256
+DISK_CACHE_ENV = "STEELDESIGN_CACHE_DIR"
+DISK_CACHE_SIZE = 4096
+# The directory is scanned for files over DISK_CACHE_SIZE once per this
+# many stores, not on every one
+PRUNE_EVERY = 64
+
+_MISSING = object()
+
+
+def content_key(namespace, text, params=None):
+    """Hex SHA-256 of the namespace, the parameters and the text."""
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}\0{namespace}\0".encode())
+    digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU of `maxsize` entries, optionally backed by a directory
+    of pickles holding about `disk_maxsize` files (oldest removed first,
+    checked every PRUNE_EVERY stores).
+    """
+
+    def __init__(self, maxsize=CACHE_SIZE, directory=None, disk_maxsize=DISK_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.disk_maxsize = disk_maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+        self._stores = 0
+        if directory:
+            # Private to the server's user: the files are unpickled on load
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _remember(self, key, value):
+        # Caller holds the lock
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Cached value for `key` from memory, then disk, or `default`."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._entries[key]
+        value = self._load(key)
+        with self._lock:
+            if value is _MISSING:
+                self._stats["misses"] += 1
+                return default
+            self._stats["disk_hits"] += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+        self._store(key, value)
+
+    def get_or_compute(self, key, compute):
+        """Cached value for `key`, computed with compute() and stored on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _load(self, key):
+        if not self.directory:
+            return _MISSING
+        try:
+            with open(self._path(key), "rb") as fh:
+                return pickle.load(fh)
+        except Exception:
+            # Missing, truncated, or pickled by code that has since changed
+            # (unpickling can raise almost anything): recompute
+            return _MISSING
+
+    def _store(self, key, value):
+        if not self.directory:
+            return
+        # Written under a temporary name so readers never see half a file
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+            tmp = None
+            with self._lock:
+                self._stores += 1
+                prune = self._stores % PRUNE_EVERY == 0
+            if prune:
+                self._prune()
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+        finally:
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _prune(self):
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".pkl")]
+        if len(files) <= self.disk_maxsize:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.disk_maxsize]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def info(self):
+        """Hit / miss counts and the number of entries held in memory."""
+        with self._lock:
+            return dict(self._stats, size=len(self._entries), maxsize=self.maxsize)
+
+    def clear(self):
+        """Empties the in-memory tier (files on disk are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache():
+    """The process-wide cache, created on first use (see DISK_CACHE_ENV)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ResultCache(directory=os.environ.get(DISK_CACHE_ENV) or None)
+        return _shared
+
+
+def cached(namespace, text, compute, params=None, cache=None):
+    """
+    compute() for `text`, or the result a previous call with the same
+    namespace, text and params stored in `cache` (default: shared_cache()).
+    """
+    cache = shared_cache() if cache is None else cache
+    return cache.get_or_compute(content_key(namespace, text, params), compute)
+
+
+def cached_report(text, cache=None):
+    """`parse_staad_report(text)` through the cache."""
+    return cached("parse_staad_report", text, lambda: parse_staad_report(text), cache=cache)
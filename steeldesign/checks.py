@@ -0,0 +1,353 @@
+"""
+AISC 360-16 LRFD member checks recomputed from parsed STAAD data.
+
+Everything except the demands depends only on the section, material,
+length and design parameters, and many members of a model share those.
+The capacities are therefore computed by `section_capacities`, which is
+memoised (LRU, `CAPACITY_CACHE_SIZE` entries); see `capacity_cache_info`
+for its hit/miss counters.
+"""
+import functools
+import math
+
+CAPACITY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=CAPACITY_CACHE_SIZE)
+def section_capacities(Fy, Fu, Ag, Ixx, Iyy, J, Cw, Sxx, Syy, Zxx, Zyy, Axx, Ayy,
+                       L, Kx, Ky, Cb, NSF, SLF, c):
+    """
+    Nominal and design strengths of a member, independent of its forces.
+    The returned dict is shared by all callers with the same inputs and must
+    not be modified.
+    """
+    E = 29000.0
+    G = 11200.0
+
+    # Derived
+    rx = (Ixx/Ag)**0.5 if Ag > 0 else 0
+    ry = (Iyy/Ag)**0.5 if Ag > 0 else 0
+    # Approx h0 from Cw = Iy * h0^2 / 4 => h0 = sqrt(4*Cw/Iy)
+    h0 = (4 * Cw / Iyy)**0.5 if Iyy > 0 else 0
+
+    # --- TENSION ---
+    # Yielding
+    Pn_yield = Fy * Ag
+    phi_Pn_yield = 0.9 * Pn_yield
+
+    # Rupture
+    Ae = Ag * NSF * SLF
+    Pn_rup = Fu * Ae
+    phi_Pn_rup = 0.75 * Pn_rup
+
+    # --- COMPRESSION ---
+    # Flexural Buckling X
+    KL_rx = (Kx * L) / rx if rx > 0 else 0
+    Fex = (math.pi**2 * E) / (KL_rx**2) if KL_rx > 0 else 0
+    if KL_rx <= 4.71 * (E/Fy)**0.5:
+        Fcrx = (0.658**(Fy/Fex)) * Fy if Fex > 0 else 0
+    else:
+        Fcrx = 0.877 * Fex
+    Pnx = Fcrx * Ag
+    phi_Pnx = 0.9 * Pnx
+
+    # Flexural Buckling Y
+    KL_ry = (Ky * L) / ry if ry > 0 else 0
+    Fey = (math.pi**2 * E) / (KL_ry**2) if KL_ry > 0 else 0
+    if KL_ry <= 4.71 * (E/Fy)**0.5:
+        Fcry = (0.658**(Fy/Fey)) * Fy if Fey > 0 else 0
+    else:
+        Fcry = 0.877 * Fey
+    Pny = Fcry * Ag
+    phi_Pny = 0.9 * Pny
+
+    # FTB
+    # Assuming doubly symmetric, xo=yo=0
+    ro2 = (Ixx + Iyy)/Ag if Ag > 0 else 0
+    H = 1.0
+    Kz = 1.0 # Assume 1.0
+    Lcz = Kz * L
+    term1 = (math.pi**2 * E * Cw) / (Lcz**2) if Lcz > 0 else 0
+    term2 = G * J
+    Fez = (term1 + term2) * (1/(Ag * ro2)) if (Ag*ro2) > 0 else 0
+
+    Fe_ftb = Fez
+    if Fe_ftb > 0:
+        if (Fy/Fe_ftb) <= 2.25:
+            Fcr_ftb = (0.658**(Fy/Fe_ftb)) * Fy
+        else:
+            Fcr_ftb = 0.877 * Fe_ftb
+    else:
+        Fcr_ftb = 0
+
+    Pn_ftb = Fcr_ftb * Ag
+    phi_Pn_ftb = 0.9 * Pn_ftb
+
+    # --- SHEAR ---
+    Cv = 1.0
+    Vnx = 0.6 * Fy * Axx * Cv
+    phi_Vnx = 0.9 * Vnx
+    Vny = 0.6 * Fy * Ayy * Cv
+    phi_Vny = 0.9 * Vny
+
+    # --- BENDING ---
+    # Flexural Yielding (X-Axis - Major)
+    Mnx_yield = Fy * Zxx
+    phi_Mnx_yield = 0.9 * Mnx_yield
+
+    # Flexural Yielding (Y-Axis - Minor)
+    Mny_yield = Fy * Zyy
+    if Mny_yield > 1.6 * Fy * Syy: Mny_yield = 1.6 * Fy * Syy
+    phi_Mny = 0.9 * Mny_yield
+
+    # LTB (X-Axis - Major)
+    Lp = 1.76 * ry * (E/Fy)**0.5 if ry > 0 else 0
+    rts = ((Iyy * Cw)**0.5 / Sxx)**0.5 if Sxx > 0 else 0
+
+    if rts > 0 and h0 > 0:
+        term_lr1 = 1.95 * rts * E / (0.7 * Fy)
+        term_lr2 = (J * c) / (Sxx * h0)
+        term_lr3 = (term_lr2**2 + 6.76 * (0.7 * Fy / E)**2)**0.5
+        Lr = term_lr1 * (term_lr2 + term_lr3)**0.5
+    else:
+        Lr = 0
+
+    Mn_ltb = 0
+    Mp = Fy * Zxx
+    Lb = L
+
+    if Lb <= Lp:
+        Mn_ltb = Mp
+    elif Lb > Lp and Lb <= Lr:
+        Mn_ltb = Cb * (Mp - (Mp - 0.7*Fy*Sxx) * (Lb - Lp)/(Lr - Lp))
+        if Mn_ltb > Mp: Mn_ltb = Mp
+    elif rts > 0 and h0 > 0:
+        Fcr_ltb = (Cb * math.pi**2 * E) / ((Lb/rts)**2) * (1 + 0.078 * (J*c)/(Sxx*h0) * (Lb/rts)**2)**0.5
+        Mn_ltb = Fcr_ltb * Sxx
+        if Mn_ltb > Mp: Mn_ltb = Mp
+    else:
+        # F2-4 is undefined without Cw (angles, tees); nan, as in vector.py,
+        # carries through to the interaction and fails the member
+        Mn_ltb = math.nan
+
+    phi_Mnx = 0.9 * Mn_ltb
+
+    # FLB (X)
+    Mn_flb_x = Mp
+    phi_Mn_flb_x = 0.9 * Mn_flb_x
+
+    # FLB (Y)
+    Mn_flb_y = Mny_yield
+    phi_Mn_flb_y = 0.9 * Mn_flb_y
+
+    return {
+        "Pn_yield": Pn_yield, "phi_Pn_yield": phi_Pn_yield,
+        "Ae": Ae, "Pn_rup": Pn_rup, "phi_Pn_rup": phi_Pn_rup,
+        "KL_rx": KL_rx, "Fex": Fex, "Fcrx": Fcrx, "Pnx": Pnx, "phi_Pnx": phi_Pnx,
+        "KL_ry": KL_ry, "Fey": Fey, "Fcry": Fcry, "Pny": Pny, "phi_Pny": phi_Pny,
+        "Fe_ftb": Fe_ftb, "Fcr_ftb": Fcr_ftb, "Pn_ftb": Pn_ftb, "phi_Pn_ftb": phi_Pn_ftb,
+        "Cv": Cv, "Vnx": Vnx, "phi_Vnx": phi_Vnx, "Vny": Vny, "phi_Vny": phi_Vny,
+        "Mnx_yield": Mnx_yield, "phi_Mnx_yield": phi_Mnx_yield,
+        "Mny_yield": Mny_yield, "phi_Mny": phi_Mny,
+        "Lp": Lp, "Lr": Lr, "rts": rts, "Mn_ltb": Mn_ltb, "phi_Mnx": phi_Mnx,
+        "Mn_flb_x": Mn_flb_x, "phi_Mn_flb_x": phi_Mn_flb_x,
+        "Mn_flb_y": Mn_flb_y, "phi_Mn_flb_y": phi_Mn_flb_y,
+        # Pc for a tension / compression force, Mcx and Mcy of Chapter H
+        "Pc_tension": min(phi_Pn_yield, phi_Pn_rup),
+        "Pc_compression": min(phi_Pnx, phi_Pny, phi_Pn_ftb),
+        "Mcx": min(phi_Mnx, phi_Mn_flb_x),
+        "Mcy": min(phi_Mny, phi_Mn_flb_y),
+    }
+
+
+def capacity_cache_info():
+    """Hits, misses and size of the capacity cache."""
+    return section_capacities.cache_info()
+
+
+def _over(demand, capacity):
+    """demand / capacity; inf (nan for 0 / 0) on a zero capacity, as in vector.py."""
+    if capacity:
+        return demand / capacity
+    return math.inf if demand else math.nan
+
+
+def calculate_results(data):
+    checks = data["checks"]
+
+    # Inputs
+    Fy = data["material"].get("Fyld", 50.0)
+    Fu = data["material"].get("Fu", 65.0)
+
+    props = data["properties"]
+    Ag = props.get("Ag", {}).get("value", 0)
+    Ixx = props.get("Ixx", {}).get("value", 0)
+    Iyy = props.get("Iyy", {}).get("value", 0)
+    J = props.get("J", {}).get("value", 0)
+    Cw = props.get("Cw", {}).get("value", 0)
+    Sxx = props.get("Sxx", {}).get("value", 0)
+    Syy = props.get("Syy", {}).get("value", 0)
+    Zxx = props.get("Zxx", {}).get("value", 0)
+    Zyy = props.get("Zyy", {}).get("value", 0)
+    Axx = props.get("Axx", {}).get("value", 0) # Shear area X
+    Ayy = props.get("Ayy", {}).get("value", 0) # Shear area Y
+
+    params = data["params"]
+    L = params.get("Length", 0)
+    Kx = params.get("Kx", 1.0)
+    Ky = params.get("Ky", 1.0)
+    Cb = params.get("Cb", 1.0)
+    NSF = params.get("NSF", 1.0)
+    SLF = params.get("SLF", 1.0)
+    c = checks["ltb_x"].get("C", 1.0)
+
+    forces = data["forces"]
+    pz_data = forces.get("Pz", {})
+    Pu = abs(pz_data.get("value", 0))
+    is_tension = pz_data.get("type") == "Tension"
+    Vux = abs(forces.get("Vx", {}).get("value", 0))
+    Vuy = abs(forces.get("Vy", {}).get("value", 0))
+    Mux = abs(forces.get("Mx", {}).get("value", 0))
+    Muy = abs(forces.get("My", {}).get("value", 0))
+
+    cap = section_capacities(Fy, Fu, Ag, Ixx, Iyy, J, Cw, Sxx, Syy, Zxx, Zyy, Axx, Ayy,
+                             L, Kx, Ky, Cb, NSF, SLF, c)
+
+    # --- TENSION ---
+    # Yielding
+    phi_Pn_yield = cap["phi_Pn_yield"]
+    checks["tension_yielding"]["Pn"] = cap["Pn_yield"]
+    checks["tension_yielding"]["capacity"] = phi_Pn_yield
+    checks["tension_yielding"]["demand"] = Pu
+    checks["tension_yielding"]["ratio"] = Pu/phi_Pn_yield if phi_Pn_yield else 0
+    checks["tension_yielding"]["eqn"] = "Eq.D2-1"
+
+    # Rupture
+    phi_Pn_rup = cap["phi_Pn_rup"]
+    checks["tension_rupture"]["Pn"] = cap["Pn_rup"]
+    checks["tension_rupture"]["capacity"] = phi_Pn_rup
+    checks["tension_rupture"]["demand"] = Pu
+    checks["tension_rupture"]["ratio"] = Pu/phi_Pn_rup if phi_Pn_rup else 0
+    checks["tension_rupture"]["Ae"] = cap["Ae"]
+    checks["tension_rupture"]["eqn"] = "Eq.D2-2"
+
+    # --- COMPRESSION ---
+    # Flexural Buckling X
+    phi_Pnx = cap["phi_Pnx"]
+    checks["compression_x"]["Pnx"] = cap["Pnx"]
+    checks["compression_x"]["capacity"] = phi_Pnx
+    checks["compression_x"]["demand"] = Pu
+    checks["compression_x"]["ratio"] = Pu/phi_Pnx if phi_Pnx else 0
+    checks["compression_x"]["Lcx_rx"] = cap["KL_rx"]
+    checks["compression_x"]["Fex"] = cap["Fex"]
+    checks["compression_x"]["Fcrx"] = cap["Fcrx"]
+
+    # Flexural Buckling Y
+    phi_Pny = cap["phi_Pny"]
+    checks["compression_y"]["Pny"] = cap["Pny"]
+    checks["compression_y"]["capacity"] = phi_Pny
+    checks["compression_y"]["demand"] = Pu
+    checks["compression_y"]["ratio"] = Pu/phi_Pny if phi_Pny else 0
+    checks["compression_y"]["Lcy_ry"] = cap["KL_ry"]
+    checks["compression_y"]["Fey"] = cap["Fey"]
+    checks["compression_y"]["Fcry"] = cap["Fcry"]
+
+    # FTB
+    phi_Pn_ftb = cap["phi_Pn_ftb"]
+    checks["ftb"]["Pn"] = cap["Pn_ftb"]
+    checks["ftb"]["capacity"] = phi_Pn_ftb
+    checks["ftb"]["demand"] = Pu
+    checks["ftb"]["ratio"] = Pu/phi_Pn_ftb if phi_Pn_ftb else 0
+    checks["ftb"]["Fe"] = cap["Fe_ftb"]
+    checks["ftb"]["Fcr"] = cap["Fcr_ftb"]
+
+    # --- SHEAR ---
+    # Shear X
+    phi_Vnx = cap["phi_Vnx"]
+    checks["shear_x"]["Vnx"] = cap["Vnx"]
+    checks["shear_x"]["capacity"] = phi_Vnx
+    checks["shear_x"]["demand"] = Vux
+    checks["shear_x"]["ratio"] = Vux/phi_Vnx if phi_Vnx else 0
+    checks["shear_x"]["Cv"] = cap["Cv"]
+
+    phi_Vny = cap["phi_Vny"]
+    checks["shear_y"]["Vny"] = cap["Vny"]
+    checks["shear_y"]["capacity"] = phi_Vny
+    checks["shear_y"]["demand"] = Vuy
+    checks["shear_y"]["ratio"] = Vuy/phi_Vny if phi_Vny else 0
+    checks["shear_y"]["Cv"] = cap["Cv"]
+
+    # --- BENDING ---
+    # Flexural Yielding (X-Axis - Major)
+    phi_Mnx_yield = cap["phi_Mnx_yield"]
+    checks["flexure_x"]["Mnx"] = cap["Mnx_yield"]
+    checks["flexure_x"]["capacity"] = phi_Mnx_yield
+    checks["flexure_x"]["demand"] = Mux
+    checks["flexure_x"]["ratio"] = Mux/phi_Mnx_yield if phi_Mnx_yield else 0
+
+    # Flexural Yielding (Y-Axis - Minor)
+    phi_Mny = cap["phi_Mny"]
+    checks["flexure_y"]["Mny"] = cap["Mny_yield"]
+    checks["flexure_y"]["capacity"] = phi_Mny
+    checks["flexure_y"]["demand"] = Muy
+    checks["flexure_y"]["ratio"] = Muy/phi_Mny if phi_Mny else 0
+
+    # LTB (X-Axis - Major)
+    phi_Mnx = cap["phi_Mnx"]
+    checks["ltb_x"]["Mnx"] = cap["Mn_ltb"]
+    checks["ltb_x"]["capacity"] = phi_Mnx
+    checks["ltb_x"]["demand"] = Mux
+    checks["ltb_x"]["ratio"] = Mux/phi_Mnx if phi_Mnx else 0
+    checks["ltb_x"]["Lp"] = cap["Lp"]
+    checks["ltb_x"]["Lr"] = cap["Lr"]
+    checks["ltb_x"]["Rts"] = cap["rts"]
+    checks["ltb_x"]["Cb"] = Cb
+
+    # FLB (X)
+    phi_Mn_flb_x = cap["phi_Mn_flb_x"]
+    checks["flb_x"]["Mnx"] = cap["Mn_flb_x"]
+    checks["flb_x"]["capacity"] = phi_Mn_flb_x
+    checks["flb_x"]["demand"] = Mux
+    checks["flb_x"]["ratio"] = Mux/phi_Mn_flb_x if phi_Mn_flb_x else 0
+
+    # FLB (Y)
+    phi_Mn_flb_y = cap["phi_Mn_flb_y"]
+    checks["flb_y"]["Mny"] = cap["Mn_flb_y"]
+    checks["flb_y"]["capacity"] = phi_Mn_flb_y
+    checks["flb_y"]["demand"] = Muy
+    checks["flb_y"]["ratio"] = Muy/phi_Mn_flb_y if phi_Mn_flb_y else 0
+
+    # --- INTERACTION ---
+    # Determine Pc based on force type (Tension vs Compression)
+    if is_tension:
+        Pc = cap["Pc_tension"]
+    else:
+        Pc = cap["Pc_compression"]
+
+    Mcx = cap["Mcx"]
+    Mcy = cap["Mcy"]
+
+    # Store Mcx/Mcy in interaction dict for display
+    checks["interaction"]["Mcx"] = Mcx
+    checks["interaction"]["Mcy"] = Mcy
+
+    Pr_Pc = Pu / Pc if Pc > 0 else 0
+
+    moments = _over(Mux, Mcx) + _over(Muy, Mcy)
+    if Pr_Pc >= 0.2:
+        ratio = Pr_Pc + 8/9 * moments
+        eqn = "Eq.H1-1a"
+    else:
+        ratio = Pr_Pc/2 + moments
+        eqn = "Eq.H1-1b"
+
+    checks["interaction"]["ratio"] = ratio
+    checks["interaction"]["criteria"] = eqn
+    checks["interaction"]["Pc"] = Pc
+    checks["interaction"]["Mcx"] = Mcx
+    checks["interaction"]["Mcy"] = Mcy
+
+    # Update main status
+    data["ratio"] = ratio
+    data["status"] = "PASS" if ratio < 1.0 else "FAIL"
+    data["ref"] = eqn
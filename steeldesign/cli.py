@@ -0,0 +1,97 @@
+"""
+staad-check: recheck STAAD.Pro output files from the command line.
+
+    staad-check run1.anl outputs/ -o summary.csv
+    staad-check outputs/ --format jsonl > summary.jsonl
+
+Directories are searched recursively for output files (OUTPUT_SUFFIXES).
+Every member goes through `batch.check_file`, and one summary row per
+member is written with the file it came from. The exit status is 1 if any
+member fails, so CI jobs can gate on it. Only the standard library and the
+parser/checks are imported, so no Streamlit or pandas start-up cost.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from steeldesign.batch import CHUNK_MEMBERS, SUMMARY_FIELDS, check_file
+
+OUTPUT_SUFFIXES = (".anl", ".out")
+
+FORMATS = ("csv", "jsonl")
+
+
+def find_outputs(paths, suffixes=OUTPUT_SUFFIXES):
+    """
+    Output files named on the command line, with directories expanded to
+    the files below them that end in one of `suffixes` (any case), sorted.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            found = []
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                found.extend(os.path.join(root, name) for name in files if name.lower().endswith(suffixes))
+            yield from sorted(found)
+        elif os.path.exists(path):
+            yield path
+        else:
+            raise FileNotFoundError(path)
+
+
+def iter_summaries(paths, workers=None, chunk_members=CHUNK_MEMBERS):
+    """Summary rows (see batch.SUMMARY_FIELDS) plus "file" for every member."""
+    for path in find_outputs(paths):
+        for row in check_file(path, workers, chunk_members):
+            row["file"] = path
+            yield row
+
+
+def _format_of(output, requested):
+    if requested:
+        return requested
+    if output and output.lower().endswith((".jsonl", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="staad-check",
+        description="Recheck every member of STAAD.Pro output files against AISC 360-16.",
+    )
+    parser.add_argument("paths", nargs="+", help="output files (.ANL/.OUT) or directories")
+    parser.add_argument("-o", "--output", help="summary file to write (default: stdout)")
+    parser.add_argument("--format", choices=FORMATS, help="summary format (default: from -o, else csv)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_MEMBERS, help="members per work unit")
+    args = parser.parse_args(argv)
+
+    try:
+        files = list(find_outputs(args.paths))
+    except FileNotFoundError as exc:
+        parser.error(f"no such file or directory: {exc}")
+
+    fmt = _format_of(args.output, args.format)
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(out, fieldnames=["file"] + SUMMARY_FIELDS)
+            writer.writeheader()
+        for row in iter_summaries(files, args.workers, args.chunk_size):
+            failed += row["status"] == "FAIL"
+            if fmt == "csv":
+                writer.writerow(row)
+            else:
+                out.write(json.dumps(row) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Load-case envelopes of the H1 interaction.
+
+Section, material and length fix every capacity of a member; only the
+demands change from one load case or station to the next. `capacities`
+therefore runs `vector.check_columns` once per member, and `envelope`
+broadcasts Eq. H1-1a/H1-1b over a (member x load case x station) block of
+demands and reports where each member governs.
+"""
+import numpy as np
+
+from steeldesign.vector import check_columns
+
+
+def capacities(columns):
+    """
+    Design capacities of N members from the input columns of
+    `vector.check_columns` (demand columns, if present, are ignored).
+    """
+    section = {name: value for name, value in columns.items()
+               if name not in ("Pu", "Vux", "Vuy", "Mux", "Muy", "tension")}
+    checks = check_columns(section)["checks"]
+    return {
+        # Pc as chosen by calculate_results for a tension / compression force
+        "Pc_tension": np.minimum(checks["tension_yielding"]["capacity"], checks["tension_rupture"]["capacity"]),
+        "Pc_compression": np.minimum(
+            np.minimum(checks["compression_x"]["capacity"], checks["compression_y"]["capacity"]),
+            checks["ftb"]["capacity"],
+        ),
+        "Mcx": checks["interaction"]["Mcx"],
+        "Mcy": checks["interaction"]["Mcy"],
+        "Vcx": checks["shear_x"]["capacity"],
+        "Vcy": checks["shear_y"]["capacity"],
+    }
+
+
+def interaction(caps, Pu, Mux, Muy, tension):
+    """
+    H1 ratio and whether Eq. H1-1a applies, for demands shaped
+    (N, load cases[, stations]) against per-member capacities `caps`.
+    Pu, Mux and Muy are used as absolute values.
+    """
+    Pu, Mux, Muy, tension = np.broadcast_arrays(
+        np.abs(np.asarray(Pu, dtype=float)), np.abs(np.asarray(Mux, dtype=float)),
+        np.abs(np.asarray(Muy, dtype=float)), np.asarray(tension, dtype=bool),
+    )
+    # Capacities of member i broadcast over all of its load cases / stations
+    extra = (slice(None),) + (None,) * (Pu.ndim - 1)
+    Pc = np.where(tension, caps["Pc_tension"][extra], caps["Pc_compression"][extra])
+    Mcx, Mcy = caps["Mcx"][extra], caps["Mcy"][extra]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Pr_Pc = np.where(Pc > 0, Pu / np.where(Pc > 0, Pc, 1.0), 0.0)
+        moments = Mux / Mcx + Muy / Mcy
+    h1_1a = Pr_Pc >= 0.2
+    ratio = np.where(h1_1a, Pr_Pc + 8 / 9 * moments, Pr_Pc / 2 + moments)
+    return ratio, h1_1a
+
+
+def envelope(columns, Pu, Mux, Muy, tension=False, loadcases=None, stations=None):
+    """
+    Governing H1 interaction of every member over all load cases and
+    stations.
+
+    `columns` are the section inputs of N members (see
+    `vector.INPUT_DEFAULTS`). Pu, Mux, Muy and `tension` are shaped
+    (N, load cases) or (N, load cases, stations), or broadcast to that.
+    `loadcases` and `stations` label the second and third axes; without
+    them the indices are returned.
+
+    Returns a dict of length-N arrays: "ratio", "loadcase", "location",
+    "criteria" (Eq.H1-1a / Eq.H1-1b) and "status", plus the full "ratios"
+    block.
+    """
+    caps = capacities(columns)
+    ratio, h1_1a = interaction(caps, Pu, Mux, Muy, tension)
+    if ratio.ndim == 2:
+        ratio, h1_1a = ratio[:, :, None], h1_1a[:, :, None]
+    n, n_lc, n_st = ratio.shape
+    flat = ratio.reshape(n, -1)
+    # nan (a zero capacity) must not hide a finite governing ratio
+    worst = np.argmax(np.where(np.isnan(flat), -np.inf, flat), axis=1)
+    lc_idx, st_idx = np.divmod(worst, n_st)
+    rows = np.arange(n)
+    governing = flat[rows, worst]
+    eq_1a = h1_1a.reshape(n, -1)[rows, worst]
+    return {
+        "ratio": governing,
+        "loadcase": np.asarray(loadcases)[lc_idx] if loadcases is not None else lc_idx,
+        "location": np.asarray(stations)[st_idx] if stations is not None else st_idx,
+        "criteria": np.where(eq_1a, "Eq.H1-1a", "Eq.H1-1b"),
+        "status": np.where(governing < 1.0, "PASS", "FAIL"),
+        "ratios": ratio if n_st > 1 else ratio[:, :, 0],
+    }
@@ -0,0 +1,193 @@
+"""
+Columnar export of batch results (Parquet or Arrow IPC) for analytics.
+
+One row per member: the summary of `batch.summary_row`, the AISC
+designation of the section ("shape", see `shapes.normalize_profile`), and
+demand, capacity, ratio and reference of every check. The batch workers turn
+their chunk of members into an Arrow record batch, so only flat columns
+cross the process boundary and the file is written while the remaining
+chunks are still being checked.
+
+    python -m steeldesign.export run.anl -o results.parquet
+    python -m steeldesign.export run.anl -o results/ --partition-by shape
+    python -m steeldesign.export run.anl -o results.arrow --workers 8
+
+With --partition-by the output is a directory in hive layout
+(results/shape=W8X31/part-0.parquet, ...) that pyarrow.dataset, DuckDB
+and Spark read as one table filtered on the partition column.
+
+Needs pyarrow (`pip install steeldesign[arrow]`).
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from steeldesign.batch import CHUNK_MEMBERS, check_chunk, plan_chunks, summary_row
+from steeldesign.shapes import normalize_profile
+
+# Checks with demand/capacity; the interaction check only has a ratio and
+# its equation ("criteria")
+CHECKS = ("tension_yielding", "tension_rupture", "compression_x", "compression_y", "ftb",
+          "shear_x", "shear_y", "ltb_x", "flb_x", "flb_y", "flexure_x", "flexure_y")
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# The STAAD output has no member group names; members are grouped by the
+# section they are designed with (its AISC name: the raw profile has the
+# table prefix and blanks, "ST  W8X31")
+PARTITION_COLUMNS = ("loadcase", "shape")
+
+# Rows per Parquet row group / Arrow record batch in the file
+ROW_GROUP_ROWS = 65536
+
+
+def _schema():
+    fields = [
+        ("member", pa.int64()), ("profile", pa.string()), ("shape", pa.string()), ("loadcase", pa.int64()),
+        ("status", pa.string()), ("ratio", pa.float64()), ("ref", pa.string()),
+        ("governing", pa.string()), ("governing_ratio", pa.float64()),
+    ]
+    for name in CHECKS:
+        fields += [(f"{name}_demand", pa.float64()), (f"{name}_capacity", pa.float64()),
+                   (f"{name}_ratio", pa.float64()), (f"{name}_ref", pa.string())]
+    fields += [("interaction_ratio", pa.float64()), ("interaction_ref", pa.string())]
+    return pa.schema(fields)
+
+
+SCHEMA = _schema()
+
+
+def _number(text):
+    return int(text) if str(text).isdigit() else None
+
+
+def result_row(data):
+    """Flat row (SCHEMA columns) of a recalculated member dict."""
+    row = summary_row(data)
+    row["member"] = _number(row["member"])
+    row["loadcase"] = _number(row["loadcase"])
+    row["shape"] = normalize_profile(row["profile"])
+    checks = data["checks"]
+    for name in CHECKS:
+        check = checks[name]
+        row[f"{name}_demand"] = float(check.get("demand", 0))
+        row[f"{name}_capacity"] = float(check.get("capacity", 0))
+        row[f"{name}_ratio"] = float(check.get("ratio", 0))
+        row[f"{name}_ref"] = check.get("ref", "")
+    row["interaction_ratio"] = float(checks["interaction"].get("ratio", 0))
+    row["interaction_ref"] = checks["interaction"].get("criteria", "")
+    return row
+
+
+def export_chunk(path, start, end):
+    """Record batch of the members in path[start:end] (a batch work unit)."""
+    rows = [result_row(data) for data in check_chunk(path, start, end, full=True)]
+    return pa.RecordBatch.from_pylist(rows, schema=SCHEMA)
+
+
+def iter_batches(path, workers=None, chunk_members=CHUNK_MEMBERS):
+    """
+    Yields one record batch per chunk of members, in file order, checked
+    by `workers` processes like `batch.check_file`.
+    """
+    path = os.fspath(path)
+    chunks = plan_chunks(path, chunk_members)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        for start, end in chunks:
+            yield export_chunk(path, start, end)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(export_chunk, [path] * len(chunks), *zip(*chunks))
+
+
+def _regrouped(batches, rows=ROW_GROUP_ROWS):
+    """Tables of about `rows` rows from a stream of small record batches."""
+    pending, count = [], 0
+    for batch in batches:
+        pending.append(batch)
+        count += batch.num_rows
+        if count >= rows:
+            yield pa.Table.from_batches(pending, schema=SCHEMA)
+            pending, count = [], 0
+    if pending:
+        yield pa.Table.from_batches(pending, schema=SCHEMA)
+
+
+def write_results(batches, output, fmt="parquet", partition_by=None):
+    """
+    Writes record batches (SCHEMA) to one Parquet / Arrow IPC file, or to
+    a hive-partitioned directory when `partition_by` names a column.
+    Returns the number of rows written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    count = 0
+
+    def counted(stream):
+        nonlocal count
+        for batch in stream:
+            count += batch.num_rows
+            yield batch
+
+    if partition_by:
+        if partition_by not in PARTITION_COLUMNS:
+            raise ValueError(f"cannot partition by {partition_by!r}; expected one of {', '.join(PARTITION_COLUMNS)}")
+        ds.write_dataset(
+            counted(batches), output, schema=SCHEMA, format="parquet" if fmt == "parquet" else "ipc",
+            partitioning=[partition_by], partitioning_flavor="hive",
+            basename_template="part-{i}" + FORMATS[fmt], existing_data_behavior="delete_matching",
+            min_rows_per_group=ROW_GROUP_ROWS, max_rows_per_group=ROW_GROUP_ROWS,
+        )
+        return count
+    if fmt == "parquet":
+        with pq.ParquetWriter(output, SCHEMA) as writer:
+            for table in _regrouped(counted(batches)):
+                writer.write_table(table, row_group_size=ROW_GROUP_ROWS)
+    else:
+        with ipc.new_file(output, SCHEMA) as writer:
+            for table in _regrouped(counted(batches)):
+                writer.write_table(table.combine_chunks(), max_chunksize=ROW_GROUP_ROWS)
+    return count
+
+
+def export_file(path, output, fmt="parquet", partition_by=None, workers=None,
+                chunk_members=CHUNK_MEMBERS):
+    """Checks every member of an output file and writes the results."""
+    return write_results(iter_batches(path, workers, chunk_members), output, fmt, partition_by)
+
+
+def _format_of(output):
+    suffix = os.path.splitext(output)[1].lower()
+    if suffix in (".arrow", ".feather", ".ipc"):
+        return "arrow"
+    return "parquet"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m steeldesign.export",
+        description="Recheck a STAAD.Pro output file and write the results as Parquet or Arrow IPC.",
+    )
+    parser.add_argument("path", help="STAAD output file (.ANL/.OUT)")
+    parser.add_argument("-o", "--output", required=True, help="file to write, or directory with --partition-by")
+    parser.add_argument("--format", choices=sorted(FORMATS), default=None,
+                        help="file format (default: from the output suffix, else parquet)")
+    parser.add_argument("--partition-by", choices=PARTITION_COLUMNS, default=None,
+                        help="write a hive-partitioned directory split on this column")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_MEMBERS, help="members per work unit")
+    args = parser.parse_args(argv)
+
+    count = export_file(args.path, args.output, args.format or _format_of(args.output),
+                        args.partition_by, args.workers, args.chunk_size)
+    print(f"{count} members written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
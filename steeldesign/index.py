@@ -0,0 +1,177 @@
+"""
+Random access to single members of huge STAAD.Pro output files.
+
+`build_index` scans an .ANL/.OUT file once and records, for every member
+design block, its member number, critical load case and byte range. The
+result is kept next to the output as a small JSON sidecar (``<file>.idx``)
+and reused as long as the output file is unchanged; where the sidecar cannot
+be written (a read-only directory) the index is kept in memory only.
+`MemberIndex` then reads any block straight out of the file through mmap,
+so opening member 14,233 costs a dict lookup and one slice instead of a
+parse of the whole run.
+"""
+import json
+import mmap
+import os
+import tempfile
+
+from steeldesign.parser import parse_staad_report
+from steeldesign.stream import MEMBER_HEADER
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+_HEADER = MEMBER_HEADER.encode()
+_LOADCASE = b"Loadcase:"
+
+
+def index_path(path):
+    """Path of the sidecar index that belongs to an output file."""
+    return os.fspath(path) + INDEX_SUFFIX
+
+
+def _leading_int(buf, pos, end):
+    """Integer that starts (after blanks) at buf[pos:end], or None."""
+    digits = buf[pos:min(end, pos + 32)].split(None, 1)
+    if digits and digits[0].isdigit():
+        return int(digits[0])
+    return None
+
+
+def scan_offsets(buf):
+    """
+    Yields (member, loadcase, start, end) for every member block in `buf`
+    (bytes or an mmap). Blocks start at the line that holds the "Member No:"
+    header and run to the next one, exactly as `stream.iter_member_blocks`
+    splits them. The load case is the critical one from the Status line.
+    """
+    size = len(buf)
+    at = buf.find(_HEADER)
+    while at >= 0:
+        start = buf.rfind(b"\n", 0, at) + 1
+        nxt = buf.find(_HEADER, at + len(_HEADER))
+        end = size if nxt < 0 else buf.rfind(b"\n", 0, nxt) + 1
+        member = _leading_int(buf, at + len(_HEADER), end)
+        lc_at = buf.find(_LOADCASE, at, end)
+        loadcase = _leading_int(buf, lc_at + len(_LOADCASE), end) if lc_at >= 0 else None
+        yield member, loadcase, start, end
+        at = nxt
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def build_index(path, write=True):
+    """
+    Builds the member index of an output file in one sequential scan and,
+    unless `write` is False, saves it as the sidecar if it can. Returns the
+    entries as a list of [member, loadcase, start, end].
+    """
+    stamp = _stamp(path)
+    with open(path, "rb") as fh:
+        if stamp["size"] == 0:
+            entries = []
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                entries = [list(entry) for entry in scan_offsets(buf)]
+    if write:
+        _write_sidecar(index_path(path), {"version": INDEX_VERSION, **stamp, "members": entries})
+    return entries
+
+
+def _write_sidecar(target, stored):
+    # Written under a temporary name so readers never see half a file
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(suffix=".tmp", prefix=os.path.basename(target) + ".",
+                                   dir=os.path.dirname(target) or None)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(stored, fh, separators=(",", ":"))
+        os.replace(tmp, target)
+        tmp = None
+    except OSError:
+        # Read-only location: the entries are still good for this process
+        pass
+    finally:
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_index(path):
+    """
+    Entries of the sidecar index, or None when there is none or it no longer
+    matches the output file (different size or modification time).
+    """
+    try:
+        with open(index_path(path), "r", encoding="utf-8") as fh:
+            stored = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    stamp = _stamp(path)
+    if stored.get("version") != INDEX_VERSION or any(stored.get(k) != v for k, v in stamp.items()):
+        return None
+    return stored["members"]
+
+
+class MemberIndex:
+    """
+    Member number / load case -> block lookups on one output file.
+
+    Use as a context manager, or call `close()`, to release the mmap.
+    """
+
+    def __init__(self, path, rebuild=False):
+        self.path = os.fspath(path)
+        entries = None if rebuild else load_index(self.path)
+        if entries is None:
+            entries = build_index(self.path)
+        self.entries = entries
+        self._by_member = {}
+        for entry in entries:
+            self._by_member.setdefault(entry[0], []).append(entry)
+        self._fh = open(self.path, "rb")
+        self._buf = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if entries else b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._fh.close()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, member):
+        return member in self._by_member
+
+    def members(self):
+        """Member numbers in the file, in file order."""
+        return [member for member in self._by_member if member is not None]
+
+    def loadcases(self, member):
+        """Critical load cases recorded for a member, in file order."""
+        return [entry[1] for entry in self._by_member.get(member, [])]
+
+    def block(self, member, loadcase=None):
+        """
+        Text of a member's design block. With several blocks for the same
+        member, `loadcase` picks one; otherwise the first is returned.
+        Raises KeyError if there is no such block.
+        """
+        for _, lc, start, end in self._by_member.get(member, []):
+            if loadcase is None or lc == loadcase:
+                # Same text as reading the file in text mode would give
+                text = self._buf[start:end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+                return text if text.endswith("\n") else text + "\n"
+        raise KeyError((member, loadcase) if loadcase is not None else member)
+
+    def report(self, member, loadcase=None, parse=parse_staad_report):
+        """Parsed (and recalculated) data of a single member."""
+        return parse(self.block(member, loadcase))
@@ -0,0 +1,94 @@
+"""
+AISC 360-16 equation library and LaTeX substitution templates.
+
+The calculation sheets show each equation twice: symbolically, then with
+the numbers put in. `substitute` does the second step with one
+str.format call on a template compiled once per (equation, symbols) pair
+and kept in an LRU, so rendering many members does not re-scan the
+equation text for every symbol. Symbols are matched as whole tokens
+only: "E" does not hit the E of "\\Exp" or a longer name such as "E_s",
+and "c" no longer turns "\\frac" into "\\fra1".
+"""
+import re
+from functools import lru_cache
+
+# Maps STAAD references (Eq.X-Y) to LaTeX strings
+AISC_EQS = {
+    # Chapter D (Tension)
+    "EQ.D2-1": r"P_n = F_y A_g",
+    "EQ.D2-2": r"P_n = F_u A_e",
+    "EQ.D3-1": r"A_e = A_n U",
+
+    # Chapter E (Compression)
+    "EQ.E3-1": r"P_n = F_{cr} A_g",
+    "EQ.E3-2": r"F_{cr} = 0.658^{\frac{F_y}{F_e}} F_y",
+    "EQ.E3-3": r"F_{cr} = 0.877 F_e",
+    "EQ.E3-4": r"F_e = \frac{\pi^2 E}{(L_c/r)^2}",
+    "EQ.E4-1": r"P_n = F_{cr} A_g",
+    "EQ.E4-2": r"F_e = \left( \frac{\pi^2 E C_w}{(L_{cz})^2} + G J \right) \frac{1}{I_x + I_y}",
+
+    # Chapter F (Flexure)
+    "EQ.F2-1": r"M_n = M_p = F_y Z_x",
+    "EQ.F2-2": r"M_n = C_b [M_p - (M_p - 0.7 F_y S_x)(\frac{L_b - L_p}{L_r - L_p})] \le M_p",
+    "EQ.F2-3": r"M_n = F_{cr} S_x",
+    "EQ.F2-4": r"F_{cr} = \frac{C_b \pi^2 E}{(L_b/r_{ts})^2} \sqrt{1 + 0.078 \frac{J c}{S_x h_0} (L_b/r_{ts})^2}",
+    "EQ.F2-5": r"L_p = 1.76 r_y \sqrt{\frac{E}{F_y}}",
+    "EQ.F2-6": r"L_r = 1.95 r_{ts} \frac{E}{0.7 F_y} \sqrt{\frac{J c}{S_x h_0} + \sqrt{(\frac{J c}{S_x h_0})^2 + 6.76 (\frac{0.7 F_y}{E})^2}}",
+    "EQ.F2-7": r"r_{ts}^2 = \frac{\sqrt{I_y C_w}}{S_x}",
+    "EQ.F2-8A": r"c = 1", # Simplified for doubly symmetric
+    "EQ.F6-1": r"M_n = M_p = F_y Z_y \le 1.6 F_y S_y",
+    "EQ.F6-2": r"M_n = M_p - (M_p - 0.7 F_y S_y)(\frac{\lambda - \lambda_p}{\lambda_r - \lambda_p})",
+    "EQ.F3-1": r"M_n = M_p - (M_p - 0.7 F_y S_x)(\frac{\lambda - \lambda_p}{\lambda_r - \lambda_p})",
+
+    # Chapter G (Shear)
+    "EQ.G2-1": r"V_n = 0.6 F_y A_w C_{v1}",
+    "EQ.G6-1": r"V_n = 0.6 F_y A_w C_{v2}",
+    "EQ.G2-9": r"C_v = 1.0", # Simplified logic often seen
+
+    # Chapter H (Interaction)
+    "EQ.H1-1A": r"\frac{P_r}{P_c} + \frac{8}{9} \left( \frac{M_{rx}}{M_{cx}} + \frac{M_{ry}}{M_{cy}} \right) \le 1.0",
+    "EQ.H1-1B": r"\frac{P_r}{2P_c} + \left( \frac{M_{rx}}{M_{cx}} + \frac{M_{ry}}{M_{cy}} \right) \le 1.0",
+}
+
+TEMPLATE_CACHE_SIZE = 1024
+
+# A symbol is not part of a longer token: no letter or backslash (command)
+# before it, no letter, digit, subscript or prime after it
+_BEFORE = r"(?<![A-Za-z\\])"
+_AFTER = r"(?![A-Za-z0-9_'])"
+
+
+def _escape(literal):
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(expr, symbols):
+    """
+    `expr` as a str.format template: every whole-token occurrence of
+    symbols[i] becomes the field {i} and LaTeX braces are escaped, so
+    template.format(*values) fills all symbols in one pass. Longer
+    symbols win where two would match.
+    """
+    if not symbols:
+        return _escape(expr)
+    index = {name: i for i, name in enumerate(symbols)}
+    names = sorted(index, key=len, reverse=True)
+    pattern = re.compile(_BEFORE + "(" + "|".join(re.escape(name) for name in names) + ")" + _AFTER)
+
+    parts = []
+    pos = 0
+    for m in pattern.finditer(expr):
+        parts.append(_escape(expr[pos:m.start()]))
+        parts.append(f"{{{index[m.group(1)]}}}")
+        pos = m.end()
+    parts.append(_escape(expr[pos:]))
+    return "".join(parts)
+
+
+def substitute(expr, subs):
+    """`expr` with the symbols in the `subs` dict replaced by their values."""
+    if not subs:
+        return expr
+    return compile_template(expr, tuple(subs)).format(*subs.values())
+
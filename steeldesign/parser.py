@@ -0,0 +1,405 @@
+"""
+Parser for STAAD.Pro AISC 360-16 member design output.
+
+Each call handles a single member block, i.e. the text from one
+"Member No:" header up to the next one. Use ``steeldesign.stream`` to walk
+a complete output file member by member.
+
+The report is cut at its box rules; boxes that open with a known section
+title are handled whole, everything else is read line by line. Lines are
+classified once by their leading label (see `_line_kind`) and handed to a
+prebuilt extractor; all key/value pairs of a line or box are read in a single
+pass of `_pairs`. The classification of a line start is memoised, so on a
+long output file each line costs a slice and a dict lookup.
+"""
+import re
+
+from steeldesign.checks import calculate_results
+from steeldesign.timing import span
+
+_MEMBER_NO = re.compile(r"Member No:\s+(\d+)")
+_PROFILE = re.compile(r"Profile:\s+(.*?)\s+\(")
+
+# Section property symbol in the report -> (key in data["properties"], unit)
+_PROPERTIES = {
+    "Ag": ("Ag", "in²"), "Axx": ("Axx", "in²"), "Ayy": ("Ayy", "in²"),
+    "Ixx": ("Ixx", "in⁴"), "Iyy": ("Iyy", "in⁴"), "J": ("J", "in⁴"),
+    "Sxx+": ("Sxx", "in³"), "Zxx": ("Zxx", "in³"),
+    "Syy+": ("Syy", "in³"), "Zyy": ("Zyy", "in³"),
+    "Cw": ("Cw", "in⁶"),
+}
+_DESIGN_PARAMETERS = ("Kx", "Ky", "NSF", "SLF", "CSP", "Cb")
+
+# Section titles -> (kind, key, result row marker and reference, intermediate
+# symbol -> field). Demands, capacities and intermediate results of the
+# checks are not read: `calculate_results` recomputes every one of them. What
+# survives is the clause reference of each check, set once its result row is
+# seen, and the LTB coefficients Cb and C, which feed the recalculation
+# ("CbX" wins over a plain "Cb").
+_SECTIONS = {
+    "Design Parameters": ("params", None, None, None),
+    "COMPRESSION CLASSIFICATION": ("class", "compression", None, None),
+    "FLEXURE CLASSIFICATION": ("class", "flexure", None, None),
+    "TENSILE YIELDING": ("check", "tension_yielding", ("Cl.D", "Cl.D2"), None),
+    "TENSILE RUPTURE": ("check", "tension_rupture", ("Cl.D", "Cl.D2"), None),
+    "FLEXURAL BUCKLING X": ("check", "compression_x", ("Cl.E", "Cl.E3"), None),
+    "FLEXURAL BUCKLING Y": ("check", "compression_y", ("Cl.E", "Cl.E3"), None),
+    "FLEXURAL-TORSIONAL-BUCKLING": ("check", "ftb", ("Cl.E", "Cl.E4"), None),
+    "SHEAR ALONG X": ("check", "shear_x", ("Cl.G", "Cl.G1"), None),
+    "SHEAR ALONG Y": ("check", "shear_y", ("Cl.G", "Cl.G1"), None),
+    "FLEXURAL YIELDING (X)": ("check", "flexure_x", ("Cl.F", "Cl.F2.1"), None),
+    "FLEXURAL YIELDING (Y)": ("check", "flexure_y", ("Cl.F", "Cl.F6.1"), None),
+    "LAT TOR BUCK ABOUT X": ("check", "ltb_x", ("Cl.F", "Cl.F2.2"), {"Cb": "Cb", "CbX": "Cb", "Cx": "C"}),
+    "FLANGE LOCAL BUCK(X)": ("check", "flb_x", ("Cl.F", "Cl.F3.1"), None),
+    "FLANGE LOCAL BUCK(Y)": ("check", "flb_y", ("Cl.F", "Cl.F6.2"), None),
+    "COMBINED FORCES CLAUSE H1": ("check", "interaction", None, None),
+    # Headings: a group heading opens the box of its first check, a "box"
+    # heading has its whole box read by one extractor (_BOX_EXTRACTORS) and
+    # the other boxes hold nothing that is read
+    "CHECKS FOR AXIAL TENSION": ("group", None, None, None),
+    "CHECKS FOR AXIAL COMPRESSION": ("group", None, None, None),
+    "CHECKS FOR SHEAR": ("group", None, None, None),
+    "CHECKS FOR BENDING": ("group", None, None, None),
+    "CHECKS FOR AXIAL BEND INTERACTION": ("group", None, None, None),
+    "SECTION PROPERTIES": ("box", "properties", None, None),
+    "MATERIAL PROPERTIES": ("box", "material", None, None),
+    "COMPRESSION SLENDERNESS": ("skip", None, None, None),
+    "STRENGTH CHECKS": ("skip", None, None, None),
+}
+_NO_SECTION = (None, None, None, None)
+
+# Kinds of line besides the label extractors below
+_SKIP = "skip"            # rules and blank lines
+_CONTEXT = "context"      # meaning depends on the current section
+_ROW = "row"              # numeric result row of a check
+_TITLE = "title"          # section title, see _SECTIONS
+_CLASSIFICATION = "class" # Flange:/Web: row of a classification table
+_RESOLVE = "resolve"      # start of line too indented to tell, strip first
+
+_RULE_END = "----------|\n"
+_HEAD_WIDTH = 8
+_MAX_MEMO = 4096
+_line_kinds = {}
+_title_sections = {}
+
+
+def parse_value(line, key):
+    """Helper to extract a float value after a key in a line."""
+    # Look for key followed by : or = and then a number (possibly scientific)
+    # We handle cases like "Pz: 6.830" or "Ag : 9.130E+00"
+    match = re.search(rf"{key}\s*[:=]\s*([-\d.E+]+)", line)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return 0.0
+    return 0.0
+
+
+def _to_float(text):
+    try:
+        return float(text)
+    except ValueError:
+        return 0.0
+
+
+def _first_token(text):
+    tokens = text.split(None, 1)
+    return tokens[0].rstrip("|") if tokens else ""
+
+
+def _pairs(line):
+    """
+    All "key: value" / "key = value" pairs of a line in one pass over it; the
+    first occurrence of a key wins.
+    """
+    pairs = {}
+    segments = line.replace("=", ":").split(":")
+    words = segments[0].split()
+    for segment in segments[1:]:
+        following = segment.split()
+        if words and following:
+            key = words[-1].lstrip("|")
+            if key not in pairs:
+                pairs[key] = following[0].rstrip("|")
+        words = following
+    return pairs
+
+
+# --- Extractors for lines identified by their leading label ---
+
+def _member_line(line, data):
+    m = _MEMBER_NO.search(line)
+    if m: data["id"] = m.group(1)
+    m = _PROFILE.search(line)
+    if m: data["profile"] = m.group(1).strip()
+
+
+def _status_line(line, data):
+    pairs = _pairs(line)
+    if pairs.get("Status"): data["status"] = pairs["Status"]
+    val = _to_float(pairs.get("Ratio", "0"))
+    if val: data["ratio"] = val
+    if pairs.get("Loadcase", "").isdigit(): data["loadcase"] = pairs["Loadcase"]
+
+
+def _axial_shear_line(line, data):
+    pairs = _pairs(line)
+    pz_type = "Tension" if "T" in line else "Compression"
+    forces = data["forces"]
+    forces["Pz"] = {"value": _to_float(pairs.get("Pz", "0")), "unit": "kips", "desc": f"Axial {pz_type}", "type": pz_type}
+    forces["Vy"] = {"value": _to_float(pairs.get("Vy", "0")), "unit": "kips", "desc": "Shear Y"}
+    forces["Vx"] = {"value": _to_float(pairs.get("Vx", "0")), "unit": "kips", "desc": "Shear X"}
+
+
+def _torsion_moment_line(line, data):
+    pairs = _pairs(line)
+    forces = data["forces"]
+    forces["Tz"] = {"value": _to_float(pairs.get("Tz", "0")), "unit": "kip-in", "desc": "Torsion"}
+    forces["My"] = {"value": _to_float(pairs.get("My", "0")), "unit": "kip-in", "desc": "Moment Y"}
+    forces["Mx"] = {"value": _to_float(pairs.get("Mx", "0")), "unit": "kip-in", "desc": "Moment X"}
+
+
+def _property_line(line, data):
+    props = data["properties"]
+    for symbol, text in _pairs(line).items():
+        if symbol in _PROPERTIES:
+            val = _to_float(text)
+            if val:
+                name, unit = _PROPERTIES[symbol]
+                props[name] = {"value": val, "unit": unit}
+
+
+def _material_line(line, data):
+    pairs = _pairs(line)
+    for key in ("Fyld", "Fu"):
+        val = _to_float(pairs.get(key, "0"))
+        if val: data["material"][key] = val
+
+
+def _length_line(line, data):
+    if "Actual Member Length" in line:
+        data["params"]["Length"] = _to_float(_pairs(line).get("Length", "0"))
+
+
+def _classification_line(line, table, numeric_lambda_p):
+    # Flange: NonCompact       9.20       9.15     24.08     Table.4.1b.Case10
+    label, _, row = line.partition(":")
+    row = row.split()
+    if len(row) < 5:
+        return
+    status, lam, lam_p, lam_r, case = row[:5]
+    try:
+        entry = {
+            "status": status, "lambda": float(lam),
+            "lambda_p": float(lam_p) if numeric_lambda_p and lam_p != "N/A" else lam_p,
+            "lambda_r": float(lam_r) if lam_r != "N/A" else "N/A",
+            "case": case
+        }
+    except ValueError:
+        return
+    table["flange" if "Flange" in label else "web"] = entry
+
+
+_BOX_EXTRACTORS = {
+    "properties": _property_line,
+    "material": _material_line,
+}
+
+_LEADING_LABELS = {
+    "Member No": _member_line,
+    "Status": _status_line,
+    "Pz": _axial_shear_line,
+    "Tz": _torsion_moment_line,
+    "Ag": _property_line,
+    "Ixx": _property_line,
+    "Sxx+": _property_line,
+    "Syy+": _property_line,
+    "Cw": _property_line,
+    "Fyld": _material_line,
+    "Actual Member Length": _length_line,
+    "Flange": _CLASSIFICATION,
+    "Web": _CLASSIFICATION,
+}
+
+
+def _line_kind(head):
+    """
+    Classifies a line from its first few characters.
+
+    Returns one of the extractors in `_LEADING_LABELS` or a line kind
+    (`_SKIP`, `_CONTEXT`, `_ROW`, `_TITLE`, `_RESOLVE`). Results are memoised
+    on the raw line start.
+    """
+    kind = _line_kinds.get(head)
+    if kind is not None:
+        return kind
+    label = head.lstrip("| \t").rstrip("\r\n")
+    if not label:
+        kind = _RESOLVE if len(head) == _HEAD_WIDTH else _SKIP
+    elif label.startswith("--"):
+        kind = _SKIP
+    elif label[0] in "-+.0123456789":
+        kind = _ROW
+    else:
+        found = {value for text, value in _LEADING_LABELS.items()
+                 if text.startswith(label) or label.startswith(text)}
+        if any(title.startswith(label) or label.startswith(title) for title in _SECTIONS):
+            found.add(_TITLE)
+        if not found:
+            kind = _CONTEXT
+        elif len(found) == 1:
+            kind = found.pop()
+        else:
+            kind = _RESOLVE
+    if len(_line_kinds) < _MAX_MEMO:
+        _line_kinds[head] = kind
+    return kind
+
+
+def _section_for(line):
+    """Entry of `_SECTIONS` for a title line, or None if it is not one."""
+    section = _title_sections.get(line)
+    if section is None:
+        title = line.strip(" |\t\r")
+        section = _SECTIONS.get(title) or _SECTIONS.get(title.partition("(")[0].rstrip())
+        if section is not None and len(_title_sections) < _MAX_MEMO:
+            _title_sections[line] = section
+    return section
+
+
+def parse_staad_report(text):
+    data = {
+        "id": "Unknown", "profile": "Unknown", "status": "Unknown", "ratio": 0.0, "loadcase": "Unknown",
+        "forces": {}, "properties": {}, "material": {}, "params": {}, "checks": {}
+    }
+
+    # Initialize checks structure with defaults
+    checks = {
+        "tension_yielding": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Pn": 0, "eqn": ""},
+        "tension_rupture": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Ae": 0, "Pn": 0, "eqn": ""},
+        "compression_x": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Lcx_rx": 0, "Fex": 0, "Fcrx": 0, "Pnx": 0},
+        "compression_y": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Lcy_ry": 0, "Fey": 0, "Fcry": 0, "Pny": 0},
+        "ftb": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Fe": 0, "Fcr": 0, "Pn": 0},
+        "shear_x": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Cv": 0, "Vnx": 0},
+        "shear_y": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Cv": 0, "Vny": 0},
+        "ltb_x": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Mnx": 0, "Cb": 1.0, "Lp": 0, "Lr": 0, "Rts": 0, "C": 1.0},
+        "flb_x": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Mnx": 0},
+        "flb_y": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Mny": 0},
+        "flexure_x": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Mnx": 0},
+        "flexure_y": {"demand": 0, "capacity": 0, "ratio": 0, "ref": "", "Mny": 0},
+        "interaction": {"ratio": 0, "criteria": "", "Pc": 0, "Mcx": 0, "Mcy": 0}
+    }
+
+    # Initialize classification structure
+    classification = {
+        "compression": {
+            "flange": {"status": "", "lambda": 0, "lambda_p": "N/A", "lambda_r": 0, "case": ""},
+            "web": {"status": "", "lambda": 0, "lambda_p": "N/A", "lambda_r": 0, "case": ""}
+        },
+        "flexure": {
+            "flange": {"status": "", "lambda": 0, "lambda_p": 0, "lambda_r": 0, "case": ""},
+            "web": {"status": "", "lambda": 0, "lambda_p": 0, "lambda_r": 0, "case": ""}
+        }
+    }
+    data["classification"] = classification
+
+    params = data["params"]
+    section = _NO_SECTION
+    kinds = _line_kinds
+
+    # The report is ruled into boxes. A box holding a single check needs no
+    # line-by-line work as only its reference and a few symbols are kept (see
+    # _SECTIONS), and a "CHECKS FOR ..." heading just opens the box of its
+    # first check. Boxes that are not recognised are read line by line.
+    for box in text.split(_RULE_END):
+        while box and (kinds.get(box[:_HEAD_WIDTH]) or _line_kind(box[:_HEAD_WIDTH])) is _TITLE:
+            title, _, rest = box.partition("\n")
+            title = _section_for(title)
+            if title is None or title[0] in ("params", "class"):
+                break
+            section = title
+            if title[0] == "group":
+                box = rest
+                continue
+            if title[0] == "box":
+                _BOX_EXTRACTORS[title[1]](rest, data)
+            if title[2] is not None and title[2][0] in box:
+                checks[title[1]]["ref"] = title[2][1]
+            if title[3] is not None:
+                pairs = _pairs(rest)
+                for symbol, field in title[3].items():
+                    if symbol in pairs: checks[title[1]][field] = _to_float(pairs[symbol])
+            box = ""
+        if not box:
+            continue
+
+        for line in box.split("\n"):
+            head = line[:_HEAD_WIDTH]
+            kind = kinds.get(head) or _line_kind(head)
+            if kind is _SKIP:
+                continue
+            if kind is _RESOLVE:
+                line = line.strip(" |\t\r")
+                if not line:
+                    continue
+                if line[0] in "-+.0123456789":
+                    kind = _ROW
+                else:
+                    kind = kinds.get(line[:_HEAD_WIDTH]) or _line_kind(line[:_HEAD_WIDTH])
+                    if kind is _RESOLVE:
+                        kind = _CONTEXT
+
+            if kind is _CONTEXT:
+                if section[3] is not None:
+                    # Mom. Distr. factor        : CbX    =  1.0000                Custom
+                    symbol, sep, value = line.partition("=")
+                    field = section[3].get(symbol.rpartition(":")[2].strip()) if sep else None
+                    if field is not None:
+                        checks[section[1]][field] = _to_float(_first_token(value))
+                elif section[0] == "params":
+                    # Kx:    2.00  Ky:    2.00  NSF:    1.00  SLF:    1.00  CSP:   12.00
+                    pairs = _pairs(line)
+                    for key in _DESIGN_PARAMETERS:
+                        if key in pairs: params[key] = _to_float(pairs[key])
+
+            elif kind is _ROW:
+                # 8.409       319.2       0.026     Cl.E3      1030      0.00
+                if section[2] is not None and section[2][0] in line:
+                    checks[section[1]]["ref"] = section[2][1]
+
+            elif kind is _TITLE:
+                section = _section_for(line) or section
+
+            elif kind is _CLASSIFICATION:
+                if section[0] == "class":
+                    _classification_line(line, classification[section[1]], section[1] == "flexure")
+
+            else:
+                kind(line, data)
+
+    # Truncated reports: section properties STAAD did not print are taken
+    # from the AISC shapes table (imported only then; it needs NumPy)
+    if len(data["properties"]) < len(_PROPERTIES):
+        from steeldesign.shapes import section_properties
+        for name, prop in section_properties(data["profile"]).items():
+            data["properties"].setdefault(name, prop)
+
+    # Fallback for Cb if not found in LTB section (sometimes in params)
+    # Priority: LTB section CbX > Params Cb > Default 1.0
+    if checks["ltb_x"]["Cb"] != 1.0:
+        data["params"]["Cb"] = checks["ltb_x"]["Cb"]
+    elif "Cb" in data["params"]:
+        # If found in params but not in LTB section, use params value
+        checks["ltb_x"]["Cb"] = data["params"]["Cb"]
+    else:
+        # Default
+        data["params"]["Cb"] = 1.0
+
+    data["checks"] = checks
+
+    # --- AUTO-CALCULATION ---
+    with span("calc"):
+        calculate_results(data)
+
+    return data
@@ -0,0 +1,236 @@
+"""
+Compact results of many members: slotted records and a column table.
+
+`parse_staad_report` returns a deep dict per member (forces with
+value/unit/desc, properties with value/unit, 13 check dicts), several KB
+each. For whole-model runs this module keeps only what the summary and
+the vectorized checks need:
+
+- `MemberRecord`, one member as a slotted dataclass (no per-instance
+  __dict__), for single-member views;
+- `MemberTable`, struct-of-arrays over N members: one NumPy column per
+  input of `vector.check_columns` plus the summary fields, with text
+  columns (profile, status, ref, governing) stored as int32 codes into a
+  list of labels.
+
+Reports are consumed one at a time, so the dicts of a model are never
+all alive at once. `MemberTable.check()` hands the float columns to
+`vector.check_columns` as they are (no copy). `load_table` builds the
+table of a whole output file in parallel; `browse.load_summary` reads
+models through it.
+"""
+import array
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from steeldesign.batch import CHUNK_MEMBERS, check_chunk, plan_chunks, summary_row
+from steeldesign.parser import parse_staad_report
+from steeldesign.vector import INPUT_DEFAULTS, check_columns
+
+INPUT_FIELDS = tuple(INPUT_DEFAULTS)
+LABEL_FIELDS = ("profile", "status", "ref", "governing")
+NUMBER_FIELDS = ("member", "loadcase")
+RATIO_FIELDS = ("ratio", "governing_ratio")
+
+# Member / load case number of a block that has none
+MISSING = -1
+
+# NumPy dtype of each array.array typecode used for the columns
+DTYPES = {"d": np.float64, "q": np.int64, "i": np.int32, "b": np.int8}
+
+
+@dataclass
+class MemberRecord:
+    """Summary and check inputs of one member."""
+    __slots__ = NUMBER_FIELDS + LABEL_FIELDS + RATIO_FIELDS + INPUT_FIELDS
+
+    member: int
+    loadcase: int
+    profile: str
+    status: str
+    ref: str
+    governing: str
+    ratio: float
+    governing_ratio: float
+    Ag: float
+    Ixx: float
+    Iyy: float
+    J: float
+    Cw: float
+    Sxx: float
+    Syy: float
+    Zxx: float
+    Zyy: float
+    Axx: float
+    Ayy: float
+    Fy: float
+    Fu: float
+    L: float
+    Kx: float
+    Ky: float
+    Cb: float
+    NSF: float
+    SLF: float
+    C: float
+    Pu: float
+    Vux: float
+    Vuy: float
+    Mux: float
+    Muy: float
+    tension: bool
+
+    @classmethod
+    def from_report(cls, data):
+        """Record of a parsed member dict (see parse_staad_report)."""
+        return cls(**_fields(data))
+
+
+def _number(text):
+    return int(text) if str(text).isdigit() else MISSING
+
+
+def _fields(data):
+    """Summary fields and check inputs of a parsed member, read the way
+    `calculate_results` / `vector.columns_from_reports` read them."""
+    summary = summary_row(data)
+    fields = {
+        "member": _number(summary["member"]),
+        "loadcase": _number(summary["loadcase"]),
+        "profile": summary["profile"],
+        "status": summary["status"],
+        "ref": summary["ref"],
+        "governing": summary["governing"],
+        "ratio": float(summary["ratio"]),
+        "governing_ratio": float(summary["governing_ratio"]),
+    }
+    props, params, forces = data["properties"], data["params"], data["forces"]
+    material = data["material"]
+    for name in ("Ag", "Ixx", "Iyy", "J", "Cw", "Sxx", "Syy", "Zxx", "Zyy", "Axx", "Ayy"):
+        fields[name] = float(props.get(name, {}).get("value", 0))
+    fields["Fy"] = float(material.get("Fyld", 50.0))
+    fields["Fu"] = float(material.get("Fu", 65.0))
+    fields["L"] = float(params.get("Length", 0))
+    for name in ("Kx", "Ky", "Cb", "NSF", "SLF"):
+        fields[name] = float(params.get(name, 1.0))
+    fields["C"] = float(data["checks"]["ltb_x"].get("C", 1.0))
+    pz = forces.get("Pz", {})
+    fields["Pu"] = abs(float(pz.get("value", 0)))
+    fields["tension"] = pz.get("type") == "Tension"
+    for name, key in (("Vux", "Vx"), ("Vuy", "Vy"), ("Mux", "Mx"), ("Muy", "My")):
+        fields[name] = abs(float(forces.get(key, {}).get("value", 0)))
+    return fields
+
+
+class MemberTable:
+    """
+    Struct-of-arrays results of N members. `columns` maps every field of
+    MemberRecord to a length-N array (text fields: int32 codes into
+    `labels[field]`).
+    """
+
+    def __init__(self, columns, labels):
+        self.columns = columns
+        self.labels = labels
+
+    @classmethod
+    def from_reports(cls, reports):
+        """Table of parsed member dicts, consumed one at a time."""
+        buffers = {name: array.array("d") for name in RATIO_FIELDS + INPUT_FIELDS}
+        buffers["tension"] = array.array("b")
+        for name in NUMBER_FIELDS:
+            buffers[name] = array.array("q")
+        for name in LABEL_FIELDS:
+            buffers[name] = array.array("i")
+        codes = {name: {} for name in LABEL_FIELDS}
+
+        for data in reports:
+            fields = _fields(data)
+            for name in LABEL_FIELDS:
+                fields[name] = codes[name].setdefault(fields[name], len(codes[name]))
+            for name, buf in buffers.items():
+                buf.append(fields[name])
+
+        columns = {name: np.frombuffer(buf, dtype=DTYPES[buf.typecode]) if len(buf)
+                   else np.zeros(0, dtype=DTYPES[buf.typecode])
+                   for name, buf in buffers.items()}
+        columns["tension"] = columns["tension"].view(bool)
+        return cls(columns, {name: list(found) for name, found in codes.items()})
+
+    @classmethod
+    def from_blocks(cls, blocks, parse=parse_staad_report):
+        """Table of member block texts, parsed one at a time."""
+        return cls.from_reports(parse(block) for block in blocks)
+
+    @classmethod
+    def concat(cls, tables):
+        """One table of several, in order; label codes are remapped."""
+        tables = list(tables)
+        if not tables:
+            return cls.from_reports([])
+        labels = {name: [] for name in LABEL_FIELDS}
+        parts = {name: [] for name in tables[0].columns}
+        for table in tables:
+            for name, column in table.columns.items():
+                if name in LABEL_FIELDS:
+                    index = {label: i for i, label in enumerate(labels[name])}
+                    remap = np.array([index.setdefault(label, len(index)) for label in table.labels[name]],
+                                     dtype=np.int32)
+                    labels[name] = list(index)
+                    column = remap[column] if len(remap) else column
+                parts[name].append(column)
+        return cls({name: np.concatenate(arrays) for name, arrays in parts.items()}, labels)
+
+    def __len__(self):
+        return len(self.columns["ratio"])
+
+    @property
+    def nbytes(self):
+        """Bytes held by the column arrays."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def label(self, name, i):
+        return self.labels[name][self.columns[name][i]]
+
+    def text(self, name):
+        """A label column decoded to an array of strings."""
+        return np.asarray(self.labels[name], dtype=object)[self.columns[name]] if len(self) else np.zeros(0, object)
+
+    def record(self, i):
+        """Row i as a MemberRecord."""
+        fields = {name: self.label(name, i) if name in LABEL_FIELDS else self.columns[name][i].item()
+                  for name in MemberRecord.__slots__}
+        return MemberRecord(**fields)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.record(i)
+
+    def input_columns(self):
+        """The input arrays of `vector.check_columns`, shared, not copied."""
+        return {name: self.columns[name] for name in INPUT_FIELDS}
+
+    def check(self):
+        """`vector.check_columns` for every member of the table."""
+        return check_columns(self.input_columns())
+
+
+def table_chunk(path, start, end):
+    """MemberTable of the member blocks in path[start:end]."""
+    return MemberTable.from_reports(check_chunk(path, start, end, full=True))
+
+
+def load_table(path, workers=None, chunk_members=CHUNK_MEMBERS):
+    """
+    MemberTable of every member of an output file, built in parallel like
+    `batch.check_file`; the workers send back compact tables, not dicts.
+    """
+    path = os.fspath(path)
+    chunks = plan_chunks(path, chunk_members)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        return MemberTable.concat(table_chunk(path, start, end) for start, end in chunks)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return MemberTable.concat(pool.map(table_chunk, [path] * len(chunks), *zip(*chunks)))
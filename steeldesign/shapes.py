@@ -0,0 +1,106 @@
+"""
+AISC Shapes Database v16.0 for the I-shaped members the checks cover
+(W, M, S and HP).
+
+The bundled CSV (data/aisc_shapes_v16.csv) is read once into a NumPy
+structured array, one row per shape, with the derived quantities the checks
+need already in columns: rx, ry, rts and ho from the database, c = 1 for
+doubly symmetric I-shapes (Eq. F2-8a), the Table B4.1 width-to-thickness
+ratios bf/2tf and h/tw, the nominal weight, and the STAAD shear areas
+Axx = 2 bf tf and Ayy = d tw. Profiles are found by name in O(1), using
+the strings the parser extracts ("ST  W8X31", "W8X31", "M12.5X12.4", ...).
+"""
+import functools
+import os
+
+import numpy as np
+
+SHAPES_CSV = os.path.join(os.path.dirname(__file__), "data", "aisc_shapes_v16.csv")
+
+E = 29000.0
+
+# Prefixes STAAD puts in front of the AISC name (ST = single section table)
+_STAAD_PREFIXES = ("ST",)
+
+_DERIVED = ("weight", "bf_2tf", "h_tw", "c", "Axx", "Ayy")
+
+
+def normalize_profile(profile):
+    """AISC designation for a STAAD profile string: "ST  W8X31" -> "W8X31"."""
+    tokens = str(profile).upper().split()
+    if len(tokens) > 1 and tokens[0] in _STAAD_PREFIXES:
+        tokens = tokens[1:]
+    return "".join(tokens).replace("_", ".")
+
+
+@functools.lru_cache(maxsize=None)
+def load_shapes(path=SHAPES_CSV):
+    """
+    The shapes table as (structured array, {designation: row}). Cached, so
+    only the first call reads the file.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        lines = [line for line in fh if not line.startswith("#")]
+    header = lines[0].strip().split(",")
+    text_cols = ("shape", "type")
+    dtype = [(name, "U16" if name in text_cols else "f8") for name in header]
+    dtype += [(name, "f8") for name in _DERIVED]
+    table = np.zeros(len(lines) - 1, dtype=dtype)
+    for i, line in enumerate(lines[1:]):
+        for name, value in zip(header, line.strip().split(",")):
+            table[name][i] = value if name in text_cols else float(value)
+    # Nominal weight (lb/ft) is the part of the designation after the X
+    table["weight"] = [float(name.rsplit("X", 1)[1]) for name in table["shape"]]
+    table["bf_2tf"] = table["bf"] / (2 * table["tf"])
+    # h: clear distance between flanges less the fillets, d - 2 kdes
+    table["h_tw"] = (table["d"] - 2 * table["kdes"]) / table["tw"]
+    table["c"] = 1.0
+    table["Axx"] = 2 * table["bf"] * table["tf"]
+    table["Ayy"] = table["d"] * table["tw"]
+    table.flags.writeable = False
+    return table, {name: i for i, name in enumerate(table["shape"])}
+
+
+def lookup(profile):
+    """Row of the shapes table for a profile, or None if it is not listed."""
+    table, rows = load_shapes()
+    i = rows.get(normalize_profile(profile))
+    return None if i is None else table[i]
+
+
+def section_properties(profile):
+    """
+    Section properties of a profile in the form of
+    `parse_staad_report(...)["properties"]`, or {} if it is not listed.
+    """
+    row = lookup(profile)
+    if row is None:
+        return {}
+    return {
+        "Ag": {"value": float(row["A"]), "unit": "in²"},
+        "Axx": {"value": float(row["Axx"]), "unit": "in²"},
+        "Ayy": {"value": float(row["Ayy"]), "unit": "in²"},
+        "Ixx": {"value": float(row["Ix"]), "unit": "in⁴"},
+        "Iyy": {"value": float(row["Iy"]), "unit": "in⁴"},
+        "J": {"value": float(row["J"]), "unit": "in⁴"},
+        "Sxx": {"value": float(row["Sx"]), "unit": "in³"},
+        "Zxx": {"value": float(row["Zx"]), "unit": "in³"},
+        "Syy": {"value": float(row["Sy"]), "unit": "in³"},
+        "Zyy": {"value": float(row["Zy"]), "unit": "in³"},
+        "Cw": {"value": float(row["Cw"]), "unit": "in⁶"},
+    }
+
+
+def slenderness_limits(Fy):
+    """
+    Table B4.1 limits for rolled I-shapes at yield stress Fy:
+    {element: (lambda_p, lambda_r)}; lambda_p is None for compression
+    members, which have only the slender limit.
+    """
+    root = (E / Fy)**0.5
+    return {
+        "compression_flange": (None, 0.56 * root),
+        "compression_web": (None, 1.49 * root),
+        "flexure_flange": (0.38 * root, 1.0 * root),
+        "flexure_web": (3.76 * root, 5.70 * root),
+    }
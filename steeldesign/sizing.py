@@ -0,0 +1,122 @@
+"""
+Lightest passing section for a member's forces and design parameters.
+
+Candidates from the AISC shapes table are tried in order of weight. Cheap
+upper bounds on the capacities rule most of them out before the full
+`calculate_results` check runs:
+
+- Pc <= 0.9 Fy Ag (yielding, and Fcr <= Fy for every buckling mode),
+- Mcx <= 0.9 Fy Zx, and Mcy is 0.9 min(Fy Zy, 1.6 Fy Sy) exactly,
+- phi Vn = 0.9 * 0.6 Fy Aw for the shear areas,
+
+and since Eq. H1-1a and H1-1b both give at least Pr/2Pc + 8/9 (Mrx/Mcx +
+Mry/Mcy), a shape whose bound on that reaches 1.0 cannot pass. The
+survivors are then screened with the exact capacities from
+`vector.check_columns`, all in one NumPy pass, so the scalar check usually
+runs once or twice per member.
+"""
+import copy
+
+import numpy as np
+
+from steeldesign.checks import calculate_results
+from steeldesign.shapes import load_shapes, section_properties
+from steeldesign.vector import check_columns
+
+# Checks that must be below PASS_LIMIT for a shape to be accepted
+ACCEPT_CHECKS = ("interaction", "shear_x", "shear_y")
+
+# As in calculate_results: a ratio of 1.0 or more is FAIL
+PASS_LIMIT = 1.0
+
+# The vector screen may only drop shapes that clearly fail; rounding
+# differences to the scalar check are far below this
+_SCREEN_TOLERANCE = 1e-9
+
+
+def _force(data, key):
+    return abs(data["forces"].get(key, {}).get("value", 0))
+
+
+def candidates(data, family="W"):
+    """
+    Rows of the shapes table in `family` that survive the capacity bounds
+    for the forces of `data`, lightest first.
+    """
+    table, _ = load_shapes()
+    family_rows = table[table["type"] == family]
+    family_rows = family_rows[np.argsort(family_rows["weight"], kind="stable")]
+
+    Fy = data["material"].get("Fyld", 50.0)
+    Pu, Mux, Muy = _force(data, "Pz"), _force(data, "Mx"), _force(data, "My")
+    Vux, Vuy = _force(data, "Vx"), _force(data, "Vy")
+
+    Pc_max = 0.9 * Fy * family_rows["A"]
+    Mcx_max = 0.9 * Fy * family_rows["Zx"]
+    Mcy = 0.9 * np.minimum(Fy * family_rows["Zy"], 1.6 * Fy * family_rows["Sy"])
+    bound = Pu / Pc_max / 2 + 8 / 9 * (Mux / Mcx_max + Muy / Mcy)
+    keep = (
+        (bound < PASS_LIMIT)
+        & (Vux <= 0.9 * 0.6 * Fy * family_rows["Axx"])
+        & (Vuy <= 0.9 * 0.6 * Fy * family_rows["Ayy"])
+    )
+    family_rows = family_rows[keep]
+
+    # Exact screen of the survivors with the array engine
+    params = data["params"]
+    member = {
+        "Fy": Fy, "Fu": data["material"].get("Fu", 65.0), "L": params.get("Length", 0),
+        "Kx": params.get("Kx", 1.0), "Ky": params.get("Ky", 1.0), "Cb": params.get("Cb", 1.0),
+        "NSF": params.get("NSF", 1.0), "SLF": params.get("SLF", 1.0), "C": data["checks"]["ltb_x"].get("C", 1.0),
+        "Pu": Pu, "Mux": Mux, "Muy": Muy, "Vux": Vux, "Vuy": Vuy,
+        "tension": data["forces"].get("Pz", {}).get("type") == "Tension",
+    }
+    columns = {name: np.full(len(family_rows), value) for name, value in member.items()}
+    for name, column in (("Ag", "A"), ("Ixx", "Ix"), ("Iyy", "Iy"), ("J", "J"), ("Cw", "Cw"),
+                         ("Sxx", "Sx"), ("Syy", "Sy"), ("Zxx", "Zx"), ("Zyy", "Zy"),
+                         ("Axx", "Axx"), ("Ayy", "Ayy")):
+        columns[name] = family_rows[column]
+    results = check_columns(columns)["checks"]
+    passing = np.ones(len(family_rows), dtype=bool)
+    for name in ACCEPT_CHECKS:
+        passing &= ~(results[name]["ratio"] >= PASS_LIMIT + _SCREEN_TOLERANCE)
+    return family_rows[passing]
+
+
+def check_shape(data, profile):
+    """Copy of `data` with the section replaced by `profile`, rechecked."""
+    trial = {key: value for key, value in data.items() if key not in ("checks", "properties")}
+    trial["checks"] = copy.deepcopy(data["checks"])
+    trial["properties"] = section_properties(profile)
+    trial["profile"] = profile
+    calculate_results(trial)
+    return trial
+
+
+def size_member(data, family="W"):
+    """
+    Lightest shape of `family` whose governing ratios (see ACCEPT_CHECKS)
+    are all below PASS_LIMIT for the forces, material and parameters of
+    `data`.
+
+    Returns {"profile", "weight", "ratio", "full_checks"} or None if no
+    shape in the family passes; "full_checks" counts the calculate_results
+    runs it took.
+    """
+    full_checks = 0
+    for row in candidates(data, family):
+        full_checks += 1
+        trial = check_shape(data, str(row["shape"]))
+        if all(trial["checks"][name]["ratio"] < PASS_LIMIT for name in ACCEPT_CHECKS):
+            return {
+                "profile": trial["profile"],
+                "weight": float(row["weight"]),
+                "ratio": trial["ratio"],
+                "full_checks": full_checks,
+            }
+    return None
+
+
+def size_members(members, family="W"):
+    """`size_member` for each parsed member of a group, in order."""
+    return [size_member(data, family) for data in members]
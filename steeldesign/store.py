@@ -0,0 +1,409 @@
+"""
+SQLite store of the batch results of an output file, for ad-hoc queries.
+
+`build_store` checks every member with `batch.check_ranges` and inserts
+the summary rows with one executemany in a single transaction into a
+sidecar database next to the output (``<file>.results.sqlite``), indexed
+on member, profile, shape, load case, governing check, equation and
+ratio. Like the member index it is reused while the output file is
+unchanged, so queries never re-parse the run:
+
+    python -m steeldesign.store run.anl --shape "W8X*" --min-ratio 0.9 \\
+        --ref Eq.H1-1a --loadcases 1000-1100
+
+Every row carries a fingerprint (BLAKE2b) of its member block. When the
+output changes, the rows of the previous store whose block is unchanged
+byte for byte are carried over and only new or edited blocks are parsed
+and checked; `build_store` reports the members that were added, removed
+or modified.
+"""
+import argparse
+import csv
+import hashlib
+import mmap
+import os
+import sqlite3
+import sys
+import tempfile
+
+from steeldesign.batch import CHUNK_MEMBERS, check_ranges
+from steeldesign.index import scan_offsets
+from steeldesign.shapes import normalize_profile
+
+STORE_SUFFIX = ".results.sqlite"
+STORE_VERSION = 2
+
+# Bytes of the BLAKE2b digest of a member block
+FINGERPRINT_SIZE = 16
+
+_NEXT_MEMBER = b"Member :"
+
+COLUMNS = ("member", "loadcase", "profile", "shape", "status", "ratio", "ref", "governing", "governing_ratio")
+
+SORT_COLUMNS = ("ratio", "governing_ratio", "member", "loadcase", "profile", "shape", "governing", "status")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value INTEGER);
+CREATE TABLE results (
+    member INTEGER, loadcase INTEGER, profile TEXT, shape TEXT, status TEXT,
+    ratio REAL, ref TEXT, governing TEXT, governing_ratio REAL, fingerprint BLOB
+);
+"""
+
+# Created after the bulk insert, which is faster than maintaining them row by row
+_INDEXES = """
+CREATE INDEX results_member ON results (member, loadcase);
+CREATE INDEX results_profile ON results (profile);
+CREATE INDEX results_shape ON results (shape);
+CREATE INDEX results_loadcase ON results (loadcase);
+CREATE INDEX results_governing ON results (governing, ratio);
+CREATE INDEX results_ref ON results (ref, ratio);
+CREATE INDEX results_ratio ON results (ratio);
+"""
+
+
+def store_path(path):
+    """Path of the results store that belongs to an output file."""
+    return os.fspath(path) + STORE_SUFFIX
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return {"version": STORE_VERSION, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _number(text):
+    return int(text) if str(text).isdigit() else None
+
+
+def _record(row):
+    """`batch.summary_row` -> tuple in COLUMNS order."""
+    return (
+        _number(row["member"]), _number(row["loadcase"]), row["profile"], normalize_profile(row["profile"]),
+        row["status"], row["ratio"], row["ref"], row["governing"], row["governing_ratio"],
+    )
+
+
+def _content_end(buf, start, end):
+    """
+    End of the content of the block buf[start:end]: a block runs up to the
+    next header line, so it ends with the blank, rule and "Member :" lines
+    that introduce the next member (or nothing, for the last one).
+    """
+    while end > start:
+        line_start = buf.rfind(b"\n", start, end - 1) + 1
+        line = buf[line_start:end].strip()
+        if line and not line.startswith(_NEXT_MEMBER) and line.strip(b"|-"):
+            break
+        end = line_start
+    return end
+
+
+def fingerprint_blocks(path):
+    """
+    (member, loadcase, start, end, fingerprint) of every member block of
+    an output file, in file order. The parsed results of a block depend
+    on its text alone (section, parameters, forces), so blocks with the
+    same fingerprint have the same results; the lines that introduce the
+    next member are left out, so editing a member does not change the
+    fingerprint of the one before it.
+    """
+    if os.path.getsize(path) == 0:
+        return []
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return [
+            (member, loadcase, start, end,
+             hashlib.blake2b(buf[start:_content_end(buf, start, end)], digest_size=FINGERPRINT_SIZE).digest())
+            for member, loadcase, start, end in scan_offsets(buf)
+        ]
+
+
+def _stored_rows(target):
+    """fingerprint -> row (COLUMNS order) of an existing store, current or not."""
+    if not os.path.exists(target):
+        return {}
+    conn = sqlite3.connect(target)
+    try:
+        if dict(conn.execute("SELECT key, value FROM meta")).get("version") != STORE_VERSION:
+            return {}
+        rows = conn.execute(f"SELECT fingerprint, {', '.join(COLUMNS)} FROM results")
+        return {row[0]: row[1:] for row in rows}
+    except sqlite3.DatabaseError:
+        return {}
+    finally:
+        conn.close()
+
+
+def _runs(blocks, indices, chunk_members):
+    """Byte ranges covering blocks[indices], merging up to `chunk_members`
+    consecutive blocks per range."""
+    runs, last, count = [], None, 0
+    for i in indices:
+        _, _, start, end, _ = blocks[i]
+        if runs and last == i - 1 and count < chunk_members:
+            runs[-1] = (runs[-1][0], end)
+            count += 1
+        else:
+            runs.append((start, end))
+            count = 1
+        last = i
+    return runs
+
+
+def _changes(previous, blocks, rows):
+    """
+    Members added, removed or modified since the previous store. A block
+    that is gone and a new one of the same member (and load case, if it
+    has several) are one modified member.
+    """
+    current = {block[4] for block in blocks}
+    removed = [dict(zip(COLUMNS, row)) for fp, row in previous.items() if fp not in current]
+    added = [dict(zip(COLUMNS, row)) for fp, row in rows if fp not in previous]
+    modified = []
+    for key in (("member", "loadcase"), ("member",)):
+        gone = {}
+        for row in removed:
+            gone.setdefault(tuple(row[k] for k in key), []).append(row)
+        still_added = []
+        for row in added:
+            before = gone.get(tuple(row[k] for k in key))
+            if before:
+                modified.append((before.pop(0), row))
+            else:
+                still_added.append(row)
+        paired = {id(before) for before, _ in modified}
+        removed = [row for row in removed if id(row) not in paired]
+        added = still_added
+    modified.sort(key=lambda pair: tuple(-1 if v is None else v for v in (pair[1]["member"], pair[1]["loadcase"])))
+    return {"added": added, "removed": removed, "modified": modified}
+
+
+def build_store(path, workers=None, chunk_members=CHUNK_MEMBERS, reuse=True):
+    """
+    Writes the store of an output file next to it, checking only the
+    member blocks the previous store (if any) has no results for, or all
+    of them when `reuse` is False (e.g. after a change to the checks). The
+    database is built under a unique temporary name in the same directory
+    and moved into place, so readers never see a partial store and two
+    sessions building at once do not write to the same file.
+
+    Returns a report: "members", "checked" and "reused" counts, the size
+    of the "previous" store (0 if there was none), and the "added",
+    "removed" and "modified" (before, after) rows relative to it.
+    """
+    path = os.fspath(path)
+    target = store_path(path)
+    stamp = _stamp(path)
+    blocks = fingerprint_blocks(path)
+    previous = _stored_rows(target)
+    stale = [i for i, block in enumerate(blocks) if not reuse or block[4] not in previous]
+    # Results come back in file order, the order of `stale`
+    checked = check_ranges(path, _runs(blocks, stale, chunk_members), workers)
+    fresh = []
+
+    def rows():
+        for *_, fingerprint in blocks:
+            row = previous.get(fingerprint) if reuse else None
+            if row is None:
+                row = _record(next(checked))
+                fresh.append((fingerprint, row))
+            yield row + (fingerprint,)
+
+    fd, building = tempfile.mkstemp(suffix=".tmp", prefix=os.path.basename(target) + ".",
+                                    dir=os.path.dirname(target) or None)
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(building)
+        try:
+            # Nothing to recover if the build dies: the file is simply rebuilt
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(_SCHEMA)
+            with conn:
+                conn.executemany(f"INSERT INTO results VALUES ({', '.join('?' * (len(COLUMNS) + 1))})", rows())
+                for statement in _INDEXES.strip().splitlines():
+                    conn.execute(statement)
+                conn.executemany("INSERT INTO meta VALUES (?, ?)", stamp.items())
+        finally:
+            conn.close()
+        os.replace(building, target)
+    except BaseException:
+        os.remove(building)
+        raise
+    return {"members": len(blocks), "checked": len(stale), "reused": len(blocks) - len(stale),
+            "previous": len(previous), **_changes(previous, blocks, fresh)}
+
+
+def describe_changes(report):
+    """Lines summarising a `build_store` report."""
+    lines = [
+        f"{report['members']} members: {report['checked']} checked, {report['reused']} reused; "
+        f"{len(report['modified'])} modified, {len(report['added'])} added, {len(report['removed'])} removed"
+    ]
+    if not report["previous"]:
+        return lines
+    for before, after in report["modified"]:
+        loadcase = after["loadcase"] if before["loadcase"] == after["loadcase"] else \
+            f"{before['loadcase']} -> {after['loadcase']}"
+        lines.append(
+            f"  member {after['member']} LC {loadcase}: ratio {before['ratio']:.3f} -> "
+            f"{after['ratio']:.3f} ({before['status']} -> {after['status']})"
+        )
+    for label, rows in (("added", report["added"]), ("removed", report["removed"])):
+        lines.extend(f"  {label} member {row['member']} LC {row['loadcase']}" for row in rows)
+    return lines
+
+
+def load_store(path):
+    """
+    Open connection to the store of an output file, or None when there is
+    none or it no longer matches the file (version, size or mtime).
+    """
+    target = store_path(path)
+    if not os.path.exists(target):
+        return None
+    try:
+        conn = sqlite3.connect(target)
+    except sqlite3.DatabaseError:
+        return None
+    try:
+        stored = dict(conn.execute("SELECT key, value FROM meta"))
+    except sqlite3.DatabaseError:
+        conn.close()
+        return None
+    if stored != _stamp(path):
+        conn.close()
+        return None
+    return conn
+
+
+def _range(column, bounds, where, params):
+    low, high = bounds
+    if low is not None:
+        where.append(f"{column} >= ?")
+        params.append(low)
+    if high is not None:
+        where.append(f"{column} <= ?")
+        params.append(high)
+
+
+class ResultsStore:
+    """
+    Queries over the stored results of one output file; builds the store
+    first when it is missing or stale. Use as a context manager, or call
+    `close()`.
+    """
+
+    def __init__(self, path, rebuild=False, workers=None):
+        self.path = os.fspath(path)
+        # Report of the build when this opened a new file version
+        self.changes = None
+        conn = None if rebuild else load_store(self.path)
+        if conn is None:
+            self.changes = build_store(self.path, workers, reuse=not rebuild)
+            conn = load_store(self.path)
+        conn.row_factory = sqlite3.Row
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def distinct(self, column):
+        """Sorted distinct values of a column, e.g. for filter choices."""
+        if column not in COLUMNS:
+            raise ValueError(f"unknown column {column!r}")
+        rows = self.conn.execute(f"SELECT DISTINCT {column} FROM results WHERE {column} IS NOT NULL ORDER BY 1")
+        return [row[0] for row in rows]
+
+    def query(self, shape=None, profile=None, status=None, governing=None, ref=None,
+              min_ratio=None, max_ratio=None, loadcases=(None, None), members=(None, None),
+              sort_by="ratio", descending=True, limit=50, offset=0):
+        """
+        Rows (dicts in COLUMNS order) matching every given filter and the
+        total number of matches, as (rows, total). `shape` is a GLOB
+        pattern on the AISC name ("W8X*"); `loadcases` and `members` are
+        inclusive (low, high) bounds, either of which may be None. Ties in
+        the sort keep file order.
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"cannot sort by {sort_by!r}; expected one of {', '.join(SORT_COLUMNS)}")
+        where, params = [], []
+        if shape:
+            where.append("shape GLOB ?")
+            params.append(shape.upper())
+        for column, value in (("profile", profile), ("status", status), ("governing", governing), ("ref", ref)):
+            if value:
+                where.append(f"{column} = ?")
+                params.append(value)
+        _range("ratio", (min_ratio, max_ratio), where, params)
+        _range("loadcase", loadcases, where, params)
+        _range("member", members, where, params)
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+
+        total = self.conn.execute(f"SELECT COUNT(*) FROM results{clause}", params).fetchone()[0]
+        order = "DESC" if descending else "ASC"
+        rows = self.conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM results{clause} ORDER BY {sort_by} {order}, rowid "
+            "LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        )
+        return [dict(row) for row in rows], total
+
+
+def parse_range(text):
+    """ "1000-1100" -> (1000, 1100); "1000" -> (1000, 1000); "1000-" -> (1000, None)."""
+    if not text:
+        return None, None
+    low, sep, high = text.partition("-")
+    low = int(low) if low.strip() else None
+    high = (int(high) if high.strip() else None) if sep else low
+    return low, high
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m steeldesign.store",
+        description="Build the SQLite results store of a STAAD.Pro output file and query it.",
+    )
+    parser.add_argument("path", help="STAAD output file (.ANL/.OUT)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="recheck every member, even if the store is current")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for a build")
+    parser.add_argument("--shape", help='AISC shape pattern, e.g. "W8X*"')
+    parser.add_argument("--status", choices=["PASS", "FAIL"])
+    parser.add_argument("--governing", help="governing check, e.g. compression_y")
+    parser.add_argument("--ref", help="STAAD governing equation, e.g. Eq.H1-1a")
+    parser.add_argument("--min-ratio", type=float)
+    parser.add_argument("--max-ratio", type=float)
+    parser.add_argument("--loadcases", type=parse_range, default=(None, None), help="load case or range, e.g. 1000-1100")
+    parser.add_argument("--members", type=parse_range, default=(None, None), help="member number or range")
+    parser.add_argument("--sort-by", choices=SORT_COLUMNS, default="ratio")
+    parser.add_argument("--ascending", action="store_true")
+    parser.add_argument("--limit", type=int, default=-1, help="rows to print (default: all)")
+    args = parser.parse_args(argv)
+
+    with ResultsStore(args.path, rebuild=args.rebuild, workers=args.workers) as store:
+        rows, total = store.query(
+            shape=args.shape, status=args.status, governing=args.governing, ref=args.ref,
+            min_ratio=args.min_ratio, max_ratio=args.max_ratio, loadcases=args.loadcases,
+            members=args.members, sort_by=args.sort_by, descending=not args.ascending, limit=args.limit,
+        )
+        if store.changes is not None:
+            print("\n".join(describe_changes(store.changes)), file=sys.stderr)
+    writer = csv.DictWriter(sys.stdout, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+    print(f"{total} of the stored members match", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Streaming access to full STAAD.Pro design output files.
+
+A complete .ANL/.OUT run holds one design block per member, each one
+starting at the line that carries the "Member No:" header. The helpers below
+split such a file lazily so only the member currently being parsed is held
+in memory, however large the run is.
+"""
+import os
+
+from steeldesign.parser import parse_staad_report
+
+MEMBER_HEADER = "Member No:"
+READ_SIZE = 1 << 20
+
+
+def iter_member_blocks(lines):
+    """
+    Yields the text of each member block found in an iterable of lines.
+
+    Anything before the first "Member No:" header (input echo, analysis
+    results, page headers) is skipped.
+    """
+    block = None
+    for line in lines:
+        if MEMBER_HEADER in line:
+            if block:
+                yield "".join(block)
+            block = []
+        if block is not None:
+            block.append(line if line.endswith("\n") else line + "\n")
+    if block:
+        yield "".join(block)
+
+
+def iter_file_blocks(fh, read_size=READ_SIZE):
+    """
+    Same as `iter_member_blocks` for an open text file, but reads it in large
+    chunks and finds the member headers with `str.find` instead of looking at
+    every line.
+    """
+    buf = ""
+    begin = None  # start of the current block in buf, None until the first header
+    pos = 0       # where to look for the next header
+    while True:
+        chunk = fh.read(read_size)
+        buf += chunk
+        # Only complete lines are searched; the tail waits for the next read
+        complete = buf.rfind("\n") + 1 if chunk else len(buf)
+        while True:
+            at = buf.find(MEMBER_HEADER, pos, complete)
+            if at < 0:
+                break
+            start = buf.rfind("\n", 0, at) + 1
+            if begin is not None:
+                yield buf[begin:start]
+            begin = start
+            pos = buf.find("\n", at) + 1 or complete
+        if not chunk:
+            break
+        # Keep the current block (or, before the first header, only the
+        # incomplete last line)
+        keep = complete if begin is None else begin
+        buf = buf[keep:]
+        pos = complete - keep
+        if begin is not None:
+            begin = 0
+    if begin is not None and buf[begin:]:
+        block = buf[begin:]
+        yield block if block.endswith("\n") else block + "\n"
+
+
+def open_report(path):
+    """Opens a STAAD output file for line-by-line reading."""
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def iter_member_reports(source, parse=parse_staad_report):
+    """
+    Parses a full STAAD output one member at a time.
+
+    `source` is a path to the output file or any iterable of lines (an open
+    file, `text.splitlines()`, ...). `parse` defaults to the recalculating
+    `parse_staad_report`; any single-block parser can be passed instead.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open_report(source) as fh:
+            for block in iter_file_blocks(fh):
+                yield parse(block)
+    else:
+        for block in iter_member_blocks(source):
+            yield parse(block)
+
+
+def block_label(block):
+    """Short one-line label for a member block, taken from its header line."""
+    header = block.split("\n", 1)[0]
+    return " ".join(header.strip("| \r").split())
@@ -0,0 +1,316 @@
+"""
+Synthetic STAAD.Pro AISC 360-16 member design output, for benchmarks.
+
+`member_block` writes one member in the layout of a real report: header
+and forces, slenderness, section properties, material, design parameters,
+the two classification tables and the tension / compression / shear /
+bending / H1 check boxes with their intermediate results. `random_member`
+draws a W-shape from the AISC table, a length, design parameters and
+forces; capacities and ratios come from `checks.section_capacities`, so
+every number in a block is consistent with the others. The same seed
+always gives the same text.
+
+    python -m steeldesign.synthetic 100000 -o model.anl --seed 1
+"""
+import argparse
+import math
+import random
+import sys
+
+from steeldesign.checks import section_capacities
+from steeldesign.shapes import E, load_shapes
+
+RULE = "|" + "-" * 77 + "|"
+WIDTH = 77
+
+LOADCASES = (1000, 1001, 1002, 1003, 1004, 1005, 1006, 1030, 1032)
+LENGTHS = (96.0, 121.0, 144.0, 168.0, 180.0, 240.0, 288.0, 360.0)
+K_FACTORS = (1.0, 1.0, 1.0, 1.2, 2.0)
+GRADES = ((50.0, 65.0), (50.0, 62.0), (36.0, 58.0))
+
+
+def _line(text):
+    return "|" + text.ljust(WIDTH) + "|"
+
+
+def _sig(value, digits):
+    """STAAD-style number with `digits` significant figures: 456.50, 1284."""
+    if value == 0:
+        return "0." + "0" * (digits - 1)
+    whole = int(math.floor(math.log10(abs(value)))) + 1
+    decimals = max(0, digits - whole)
+    text = f"{value:.{decimals}f}"
+    return text if decimals else text + "."
+
+
+def _result_row(demand, capacity, ratio, ref, loadcase):
+    return _line(f"  {_sig(demand, 4):>15}  {_sig(capacity, 4):>10}  {ratio:>9.3f}     "
+                 f"{ref:<10} {loadcase:>5}      0.00")
+
+
+def _intermediate(desc, symbol, value, unit, ref):
+    return _line(f"  {desc:<25}: {symbol:<6} =  {_sig(value, 5):<10} {unit:<10} {ref}")
+
+
+def _check(title, demand, capacity, ref, loadcase, intermediates):
+    ratio = abs(demand) / capacity if capacity else 0.0
+    lines = [
+        _line(f" {title}"),
+        _line("              DEMAND      CAPACITY    RATIO     REFERENCE    L/C    LOC"),
+        _result_row(demand, capacity, ratio, ref, loadcase),
+        _line(""),
+        _line(" Intermediate Results :"),
+    ]
+    lines += [_intermediate(*row) for row in intermediates]
+    lines.append(RULE)
+    return lines
+
+
+def _classification_row(label, status, lam, lam_p, lam_r, case):
+    lam_p = "N/A" if lam_p is None else f"{lam_p:.2f}"
+    return _line(f" {label:<6}: {status:<13}{lam:>7.2f}{lam_p:>10}{lam_r:>11.2f}     {case}")
+
+
+def _class_status(lam, lam_p, lam_r):
+    if lam_p is None:
+        return "NonSlender" if lam <= lam_r else "Slender"
+    if lam <= lam_p:
+        return "Compact"
+    return "NonCompact" if lam <= lam_r else "Slender"
+
+
+def member_block(member, profile, Fy, Fu, L, Kx, Ky, Cb, forces, loadcase, NSF=1.0, SLF=1.0, CSP=12.0):
+    """
+    Design block of one member as STAAD prints it. `profile` is a row of
+    the shapes table, `forces` a dict Pz (negative for compression), Vx,
+    Vy, Tz, Mx, My in kips and kip-in.
+    """
+    Ag, Ixx, Iyy, J, Cw = (float(profile[k]) for k in ("A", "Ix", "Iy", "J", "Cw"))
+    Sxx, Syy, Zxx, Zyy = (float(profile[k]) for k in ("Sx", "Sy", "Zx", "Zy"))
+    Axx, Ayy, c = float(profile["Axx"]), float(profile["Ayy"]), float(profile["c"])
+    cap = section_capacities(Fy, Fu, Ag, Ixx, Iyy, J, Cw, Sxx, Syy, Zxx, Zyy, Axx, Ayy,
+                             L, Kx, Ky, Cb, NSF, SLF, c)
+    name = str(profile["shape"])
+
+    Pz, Vx, Vy = forces["Pz"], forces["Vx"], forces["Vy"]
+    Tz, Mx, My = forces["Tz"], forces["Mx"], forces["My"]
+    Pu = abs(Pz)
+    tension = Pz > 0
+    Pu_t, Pu_c = (Pu, 0.0) if tension else (0.0, Pu)
+
+    Pc = cap["Pc_tension"] if tension else cap["Pc_compression"]
+    Mcx, Mcy = cap["Mcx"], cap["Mcy"]
+    pr = Pu / Pc if Pc else 0.0
+    moments = (abs(Mx) / Mcx if Mcx else 0.0) + (abs(My) / Mcy if Mcy else 0.0)
+    if pr >= 0.2:
+        ratio, criteria = pr + 8.0 / 9.0 * moments, "Eq.H1-1a"
+    else:
+        ratio, criteria = pr / 2.0 + moments, "Eq.H1-1b"
+    status = "PASS" if ratio < 1.0 else "FAIL"
+    slenderness = max(cap["KL_rx"], cap["KL_ry"])
+
+    root = math.sqrt(E / Fy)
+    bf_2tf, h_tw = float(profile["bf_2tf"]), float(profile["h_tw"])
+    comp_class = ((bf_2tf, None, 0.56 * root, "Table.4.1a.Case1"), (h_tw, None, 1.49 * root, "Table.4.1a.Case5"))
+    flex_class = ((bf_2tf, 0.38 * root, 1.0 * root, "Table.4.1b.Case10"), (h_tw, 3.76 * root, 5.70 * root, "Table.4.1b.Case15"))
+
+    lines = [
+        f"Member : {member:>5}",
+        RULE,
+        _line(f"  Member No: {member:>8}       Profile:  {('ST  ' + name):<22}(AISC SECTIONS)"),
+        _line(f"  Status: {status:>11}       Ratio: {ratio:>13.3f}       Loadcase: {loadcase:>8}"),
+        _line(f"  Location:      0.00       Ref:      {criteria}"),
+        _line(f"  Pz: {_sig(Pu, 4):>11}     {'T' if tension else 'C'}     Vy: {_sig(Vy, 4):>12}           Vx: {_sig(Vx, 4):>10}"),
+        _line(f"  Tz: {_sig(Tz, 4):>11}           My: {_sig(My, 4):>12}           Mx: {_sig(Mx, 4):>10}"),
+        RULE,
+        _line(" COMPRESSION SLENDERNESS"),
+        _line(f" Actual Slenderness Ratio    : {slenderness:>10.3f}"),
+        _line(" Allowable Slenderness Ratio :    200.000            LOC :     0.00"),
+        RULE,
+        _line(" STRENGTH CHECKS"),
+        _line(f" Critical L/C  : {loadcase:>6}             Ratio     : {ratio:>12.3f}({status})"),
+        _line(f"          Loc  :    0.00            Condition :    {criteria}"),
+        RULE,
+        _line(" SECTION PROPERTIES  (LOC:     0.00, PROPERTIES UNIT: IN  )"),
+        _line(f" Ag  : {Ag:>11.3E}     Axx : {Axx:>11.3E}     Ayy : {Ayy:>11.3E}"),
+        _line(f" Ixx : {Ixx:>11.3E}     Iyy : {Iyy:>11.3E}     J   : {J:>11.3E}"),
+        _line(f" Sxx+: {Sxx:>11.3E}     Sxx-: {Sxx:>11.3E}     Zxx : {Zxx:>11.3E}"),
+        _line(f" Syy+: {Syy:>11.3E}     Syy-: {Syy:>11.3E}     Zyy : {Zyy:>11.3E}"),
+        _line(f" Cw  : {Cw:>11.3E}     x0  :   0.000E+00     y0  :   0.000E+00"),
+        RULE,
+        _line(" MATERIAL PROPERTIES"),
+        _line(f" Fyld: {Fy:>15.3f}             Fu: {Fu:>15.3f}"),
+        RULE,
+        _line(f" Actual Member Length: {L:>13.3f}"),
+        _line(" Design Parameters                                  (Rolled)"),
+        _line(f" Kx: {Kx:>7.2f}  Ky: {Ky:>7.2f}  NSF: {NSF:>7.2f}  SLF: {SLF:>7.2f}  CSP: {CSP:>7.2f}"),
+        RULE,
+        _line(f" COMPRESSION CLASSIFICATION (L/C: {loadcase:>6} LOC:     0.00)"),
+        _line("                          λ         λp        λr       CASE"),
+    ]
+    for label, (lam, lam_p, lam_r, case) in zip(("Flange", "Web"), comp_class):
+        lines.append(_classification_row(label, _class_status(lam, lam_p, lam_r), lam, lam_p, lam_r, case))
+    lines += [
+        _line(""),
+        _line(f" FLEXURE CLASSIFICATION     (L/C: {loadcase:>6} LOC:     0.00)"),
+        _line("                          λ         λp        λr       CASE"),
+    ]
+    for label, (lam, lam_p, lam_r, case) in zip(("Flange", "Web"), flex_class):
+        lines.append(_classification_row(label, _class_status(lam, lam_p, lam_r), lam, lam_p, lam_r, case))
+    lines.append(RULE)
+
+    lines += [_line(" CHECKS FOR AXIAL TENSION"), RULE]
+    lines += _check("TENSILE YIELDING", Pu_t, cap["phi_Pn_yield"], "Cl.D2", loadcase, [
+        ("Nom. Ten. Yld Cap", "Pn", cap["Pn_yield"], "kip", "Eq.D2-1"),
+    ])
+    lines += _check("TENSILE RUPTURE", Pu_t, cap["phi_Pn_rup"], "Cl.D2", loadcase, [
+        ("Effective area", "Ae", cap["Ae"], "in2", "Eq.D3-1"),
+        ("Nom. Ten. Rpt Cap", "Pn", cap["Pn_rup"], "kip", "Eq.D2-2"),
+    ])
+
+    lines.append(_line(" CHECKS FOR AXIAL COMPRESSION"))
+    lines += _check("FLEXURAL BUCKLING X", Pu_c, cap["phi_Pnx"], "Cl.E3", loadcase, [
+        ("Effective Slenderness", "Lcx/rx", cap["KL_rx"], "", "Cl.E2"),
+        ("Elastic Buckling Stress", "Fex", cap["Fex"], "ksi", "Eq.E3-4"),
+        ("Crit. Buckling Stress", "Fcrx", cap["Fcrx"], "ksi", "Eq.E3-2"),
+        ("Nom. Flexural Buckling", "Pnx", cap["Pnx"], "kip", "Eq.E3-1"),
+    ])
+    lines += _check("FLEXURAL BUCKLING Y", Pu_c, cap["phi_Pny"], "Cl.E3", loadcase, [
+        ("Effective Slenderness", "Lcy/ry", cap["KL_ry"], "", "Cl.E2"),
+        ("Elastic Buckling Stress", "Fey", cap["Fey"], "ksi", "Eq.E3-4"),
+        ("Crit. Buckling Stress", "Fcry", cap["Fcry"], "ksi", "Eq.E3-2"),
+        ("Nom. Flexural Buckling", "Pny", cap["Pny"], "kip", "Eq.E3-1"),
+    ])
+    lines += _check("FLEXURAL-TORSIONAL-BUCKLING", Pu_c, cap["phi_Pn_ftb"], "Cl.E4", loadcase, [
+        ("Elastic F-T-B Stress", "Fe", cap["Fe_ftb"], "ksi", "Eq.E4-2"),
+        ("Crit. F-T-B Stress", "Fcr", cap["Fcr_ftb"], "ksi", "Eq.E3-2"),
+        ("Nom. Flex-tor Buckling", "Pn", cap["Pn_ftb"], "kip", "Eq.E4-1"),
+    ])
+
+    lines += [_line(" CHECKS FOR SHEAR"), RULE]
+    lines += _check("SHEAR ALONG X", Vx, cap["phi_Vnx"], "Cl.G1", loadcase, [
+        ("Coefficient Cv Along X", "Cv", cap["Cv"], "", "Eq.G2-9"),
+        ("Coefficient Kv Along X", "Kv", 1.2, "", "Cl.G6"),
+        ("Nom. Shear Along X", "Vnx", cap["Vnx"], "kip", "Eq.G6-1"),
+    ])
+    lines += _check("SHEAR ALONG Y", Vy, cap["phi_Vny"], "Cl.G1", loadcase, [
+        ("Coefficient Cv Along Y", "Cv", cap["Cv"], "", "-"),
+        ("Coefficient Kv Along Y", "Kv", 5.34, "", "Eq.G2-5"),
+        ("Nom. Shear Along Y", "Vny", cap["Vny"], "kip", "Eq.G2-1"),
+    ])
+
+    lines += [_line(" CHECKS FOR BENDING"), RULE]
+    if L <= cap["Lp"]:
+        lines += _check("FLEXURAL YIELDING (X)", Mx, cap["phi_Mnx_yield"], "Cl.F2.1", loadcase, [
+            ("Nom Flex Yielding Along X", "Mnx", cap["Mnx_yield"], "kip-in", "Eq.F2-1"),
+        ])
+    lines += _check("FLEXURAL YIELDING (Y)", My, cap["phi_Mny"], "Cl.F6.1", loadcase, [
+        ("Nom Flex Yielding Along Y", "Mny", cap["Mny_yield"], "kip-in", "Eq.F6-1"),
+    ])
+    lines += _check("LAT TOR BUCK ABOUT X", Mx, cap["phi_Mnx"], "Cl.F2.2", loadcase, [
+        ("Nom L-T-B Cap", "Mnx", cap["Mn_ltb"], "kip-in", "Eq.F2-2"),
+        ("Mom. Distr. factor", "CbX", Cb, "", "Custom"),
+        ("Limiting Unbraced Length", "LpX", cap["Lp"], "in", "Eq.F2-5"),
+        ("coefficient C", "Cx", c, "", "Eq.F2-8a"),
+        ("Effective Rad. of Gyr.", "Rts", cap["rts"], "in", "Eq.F2-7"),
+        ("Limiting Unbraced Length", "LrX", cap["Lr"], "in", "Eq.F2-6"),
+    ])
+    lines += _check("FLANGE LOCAL BUCK(X)", Mx, cap["phi_Mn_flb_x"], "Cl.F3.1", loadcase, [
+        ("Nom F-L-B Cap", "Mnx", cap["Mn_flb_x"], "kip-in", "Eq.F3-1"),
+    ])
+    lines += _check("FLANGE LOCAL BUCK(Y)", My, cap["phi_Mn_flb_y"], "Cl.F6.2", loadcase, [
+        ("Nom F-L-B Cap", "Mny", cap["Mn_flb_y"], "kip-in", "Eq.F6-2"),
+    ])
+
+    lines += [
+        _line(" CHECKS FOR AXIAL BEND INTERACTION"),
+        RULE,
+        _line(" COMBINED FORCES CLAUSE H1"),
+        _line("                            RATIO      CRITERIA           L/C      LOC"),
+        _line(f"                     {ratio:>12.3f}      {criteria:<10} {loadcase:>11}       0.00"),
+        _line(""),
+        _line(" Intermediate Results :"),
+        _intermediate("Axial Capacity", "Pc", Pc, "kip", "Cl.H1.1"),
+        _intermediate("Moment Capacity", "Mcx", Mcx, "kip-in", "Cl.H1.1"),
+        _intermediate("Moment Capacity", "Mcy", Mcy, "kip-in", "Cl.H1.1"),
+        RULE,
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def random_member(rng, member):
+    """Keyword arguments of `member_block` for a random W-shape member."""
+    table, _ = load_shapes()
+    shapes = _w_shapes()
+    profile = table[shapes[rng.randrange(len(shapes))]]
+    Fy, Fu = rng.choice(GRADES)
+    L = rng.choice(LENGTHS)
+    # Forces scaled to the section so ratios spread around 0.1 .. 1.3
+    Py = Fy * float(profile["A"])
+    Mp = Fy * float(profile["Zx"])
+    utilization = rng.uniform(0.05, 0.9)
+    forces = {
+        "Pz": rng.choice((-1.0, 1.0)) * utilization * rng.uniform(0.05, 0.5) * Py,
+        "Vx": rng.uniform(-0.02, 0.02) * Py,
+        "Vy": rng.uniform(-0.05, 0.05) * Py,
+        "Tz": rng.uniform(-0.01, 0.01) * Mp,
+        "Mx": rng.choice((-1.0, 1.0)) * utilization * rng.uniform(0.2, 0.9) * Mp,
+        "My": rng.uniform(-0.1, 0.1) * Fy * float(profile["Zy"]),
+    }
+    return {
+        "member": member,
+        "profile": profile,
+        "Fy": Fy,
+        "Fu": Fu,
+        "L": L,
+        "Kx": rng.choice(K_FACTORS),
+        "Ky": rng.choice(K_FACTORS),
+        "Cb": rng.choice((1.0, 1.0, 1.14, 1.32)),
+        "forces": forces,
+        "loadcase": rng.choice(LOADCASES),
+    }
+
+
+_w_rows = None
+
+
+def _w_shapes():
+    global _w_rows
+    if _w_rows is None:
+        table, _ = load_shapes()
+        _w_rows = [i for i, kind in enumerate(table["type"]) if kind == "W"]
+    return _w_rows
+
+
+def synthetic_members(count, seed=0):
+    """Yields the blocks of `count` random members numbered from 1."""
+    rng = random.Random(seed)
+    for member in range(1, count + 1):
+        yield member_block(**random_member(rng, member))
+
+
+def synthetic_report(count, seed=0):
+    """A whole output file of `count` random members as one string."""
+    return "".join(synthetic_members(count, seed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m steeldesign.synthetic",
+        description="Write a synthetic STAAD.Pro AISC 360-16 design output.",
+    )
+    parser.add_argument("count", type=int, help="number of members")
+    parser.add_argument("-o", "--output", help="file to write (default: stdout)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        out.writelines(synthetic_members(args.count, args.seed))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
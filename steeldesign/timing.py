@@ -0,0 +1,148 @@
+"""
+Wall-clock timing of the stages of a page run (parse, calc, render, ...).
+
+A page creates one `Timings` per run, calls `stage(name)` at each stage
+boundary and `finish()` at the end; `summary()` gives the rows of the
+"Performance" sidebar panel (page_timing.py) and, if the environment
+variable STEELDESIGN_TIMING_LOG names a file, one JSON line per run is
+appended to it:
+
+    {"ts": ..., "page": "STAAD_CHECK", "member": "12", "input_size": 5321,
+     "total_ms": 84.2, "spans": [{"stage": "parse", "ms": 3.1}, ...]}
+
+Core code times its own steps with the module-level `span(name)`, which
+records into the Timings started in the current thread (Streamlit runs
+every session in its own thread) and is a shared no-op otherwise, so
+timing costs one ContextVar lookup per call when it is off.
+"""
+import json
+import os
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+TIMING_LOG_ENV = "STEELDESIGN_TIMING_LOG"
+
+_active = ContextVar("steeldesign_timings", default=None)
+_NULL = nullcontext()
+
+
+class _Span:
+    __slots__ = ("timings", "stage", "fields", "start")
+
+    def __init__(self, timings, stage, fields):
+        self.timings = timings
+        self.stage = stage
+        self.fields = fields
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timings.record(self.stage, time.perf_counter() - self.start, **self.fields)
+
+
+class Timings:
+    """Named spans of one page run; does nothing unless `enabled`."""
+
+    def __init__(self, page, enabled=True, log_path=None):
+        self.page = page
+        self.enabled = enabled
+        self.log_path = os.environ.get(TIMING_LOG_ENV) if log_path is None else log_path
+        self.context = {}
+        self.spans = []
+        self._stage = None
+        self._stage_start = None
+        self._run_start = None
+        self._token = None
+        self.total_ms = None
+
+    def start(self):
+        """Makes this the target of `span()` in the current thread."""
+        if self.enabled:
+            self._run_start = time.perf_counter()
+            self._token = _active.set(self)
+        return self
+
+    def annotate(self, **fields):
+        """Fields logged with the run, e.g. member=..., input_size=..."""
+        if self.enabled:
+            self.context.update(fields)
+
+    def record(self, stage, seconds, **fields):
+        # Spans inside an open stage are named after it: "parse.calc"
+        if self._stage is not None and stage != self._stage:
+            stage = f"{self._stage}.{stage}"
+        self.spans.append(dict(fields, stage=stage, ms=round(seconds * 1000, 3)))
+
+    def span(self, stage, **fields):
+        """Context manager timing one step."""
+        if not self.enabled:
+            return _NULL
+        return _Span(self, stage, fields)
+
+    def stage(self, name):
+        """Ends the current stage (if any) and starts `name`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._end_stage(now)
+        self._stage, self._stage_start = name, now
+
+    def _end_stage(self, now):
+        if self._stage is not None:
+            stage, self._stage = self._stage, None
+            self.record(stage, now - self._stage_start)
+
+    def finish(self):
+        """Ends the last stage, detaches the run and appends it to the log."""
+        if not self.enabled or self._run_start is None:
+            return self
+        now = time.perf_counter()
+        self._end_stage(now)
+        self.total_ms = round((now - self._run_start) * 1000, 3)
+        if self._token is not None:
+            _active.reset(self._token)
+            self._token = None
+        self._run_start = None
+        if self.log_path:
+            self.write(self.log_path)
+        return self
+
+    def rows(self):
+        """Spans as table rows (stage, ms) in the order they ended."""
+        return [{"stage": s["stage"], "ms": s["ms"]} for s in self.spans]
+
+    def summary(self):
+        """
+        Finishes the run; returns its table rows and a "Total ... ms" line,
+        or ([], None) when nothing was timed.
+        """
+        self.finish()
+        if not self.spans:
+            return [], None
+        return self.rows(), f"Total {self.total_ms:.1f} ms"
+
+    def write(self, path):
+        line = {"ts": round(time.time(), 3), "page": self.page}
+        line.update(self.context)
+        line.update(total_ms=self.total_ms, spans=self.spans)
+        try:
+            with open(path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(line, default=str) + "\n")
+        except OSError:
+            pass
+
+
+def span(stage, **fields):
+    """Times a step into the Timings started in this thread, if any."""
+    timings = _active.get()
+    if timings is None:
+        return _NULL
+    return timings.span(stage, **fields)
+
+
+def timing_enabled(requested=False):
+    """True if timing was asked for in the UI or a log file is configured."""
+    return bool(requested or os.environ.get(TIMING_LOG_ENV))
@@ -0,0 +1,222 @@
+"""
+Array version of `checks.calculate_results`.
+
+`check_columns` takes one array per input (see `INPUT_DEFAULTS`) and runs
+every AISC 360-16 check for all rows at once, with `np.where` in place of
+the scalar branches. Results come back in the same shape as the scalar
+`checks` dict, with an array in place of every number, and agree with
+`calculate_results` to rounding (1e-9 relative).
+
+Zero Mcx/Mcy in the interaction and zero rts in the LTB formulas give
+inf/nan here, as they do in the scalar code; a nan ratio is a FAIL.
+
+NumPy is needed here and by the other array code (envelope, shapes,
+sizing, records, browse and the weld modules). The parser, the scalar checks and the batch
+runner do not import it, except that the parser loads `shapes` when a
+report has no section properties.
+"""
+import math
+
+import numpy as np
+
+E = 29000.0
+G = 11200.0
+
+# Input column -> default used by calculate_results when it is missing
+INPUT_DEFAULTS = {
+    "Ag": 0.0, "Ixx": 0.0, "Iyy": 0.0, "J": 0.0, "Cw": 0.0,
+    "Sxx": 0.0, "Syy": 0.0, "Zxx": 0.0, "Zyy": 0.0, "Axx": 0.0, "Ayy": 0.0,
+    "Fy": 50.0, "Fu": 65.0,
+    "L": 0.0, "Kx": 1.0, "Ky": 1.0, "Cb": 1.0, "NSF": 1.0, "SLF": 1.0, "C": 1.0,
+    "Pu": 0.0, "Vux": 0.0, "Vuy": 0.0, "Mux": 0.0, "Muy": 0.0,
+    "tension": False,
+}
+
+
+def columns_from_reports(reports):
+    """
+    Input columns for `check_columns` from parsed member dicts (as returned
+    by `parse_staad_report`), read the way `calculate_results` reads them.
+    """
+    rows = {name: [] for name in INPUT_DEFAULTS}
+    for data in reports:
+        props, params, forces = data["properties"], data["params"], data["forces"]
+        material = data["material"]
+        for name in ("Ag", "Ixx", "Iyy", "J", "Cw", "Sxx", "Syy", "Zxx", "Zyy", "Axx", "Ayy"):
+            rows[name].append(props.get(name, {}).get("value", 0))
+        rows["Fy"].append(material.get("Fyld", 50.0))
+        rows["Fu"].append(material.get("Fu", 65.0))
+        rows["L"].append(params.get("Length", 0))
+        for name in ("Kx", "Ky", "Cb", "NSF", "SLF"):
+            rows[name].append(params.get(name, 1.0))
+        rows["C"].append(data["checks"]["ltb_x"].get("C", 1.0))
+        pz = forces.get("Pz", {})
+        rows["Pu"].append(abs(pz.get("value", 0)))
+        rows["tension"].append(pz.get("type") == "Tension")
+        for name, key in (("Vux", "Vx"), ("Vuy", "Vy"), ("Mux", "Mx"), ("Muy", "My")):
+            rows[name].append(abs(forces.get(key, {}).get("value", 0)))
+    return {
+        name: np.asarray(values, dtype=bool if name == "tension" else float)
+        for name, values in rows.items()
+    }
+
+
+def _ratio(demand, capacity):
+    """demand / capacity, 0 where the capacity is 0 (as in the scalar code)."""
+    safe = np.where(capacity != 0, capacity, 1.0)
+    return np.where(capacity != 0, demand / safe, 0.0)
+
+
+def _fcr_flexural(KL_r, Fy):
+    """Fe and Fcr of flexural buckling (Eq. E3-2/E3-3) for a column of KL/r."""
+    safe = np.where(KL_r > 0, KL_r, 1.0)
+    Fe = np.where(KL_r > 0, (math.pi**2 * E) / (safe**2), 0.0)
+    safe_fe = np.where(Fe > 0, Fe, 1.0)
+    inelastic = np.where(Fe > 0, (0.658**(Fy / safe_fe)) * Fy, 0.0)
+    Fcr = np.where(KL_r <= 4.71 * (E / Fy)**0.5, inelastic, 0.877 * Fe)
+    return Fe, Fcr
+
+
+def check_columns(columns):
+    """
+    Runs every check for N members. `columns` maps input names (see
+    `INPUT_DEFAULTS`) to length-N arrays; missing ones take the default.
+    Pu, Vux, Vuy, Mux and Muy are used as absolute values.
+    """
+    n = len(next(iter(columns.values()))) if columns else 0
+    col = {}
+    for name, default in INPUT_DEFAULTS.items():
+        value = columns.get(name)
+        if value is None:
+            value = np.full(n, default)
+        col[name] = np.asarray(value, dtype=bool if name == "tension" else float)
+    Ag, Ixx, Iyy, J, Cw = col["Ag"], col["Ixx"], col["Iyy"], col["J"], col["Cw"]
+    Sxx, Syy, Zxx, Zyy = col["Sxx"], col["Syy"], col["Zxx"], col["Zyy"]
+    Axx, Ayy, Fy, Fu = col["Axx"], col["Ayy"], col["Fy"], col["Fu"]
+    L, Kx, Ky, Cb, NSF, SLF, c = col["L"], col["Kx"], col["Ky"], col["Cb"], col["NSF"], col["SLF"], col["C"]
+    Pu, Vux, Vuy = np.abs(col["Pu"]), np.abs(col["Vux"]), np.abs(col["Vuy"])
+    Mux, Muy = np.abs(col["Mux"]), np.abs(col["Muy"])
+    is_tension = col["tension"]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Derived
+        safe_ag = np.where(Ag > 0, Ag, 1.0)
+        rx = np.where(Ag > 0, (Ixx / safe_ag)**0.5, 0.0)
+        ry = np.where(Ag > 0, (Iyy / safe_ag)**0.5, 0.0)
+        safe_iyy = np.where(Iyy > 0, Iyy, 1.0)
+        h0 = np.where(Iyy > 0, (4 * Cw / safe_iyy)**0.5, 0.0)
+
+        # --- TENSION ---
+        Pn_yield = Fy * Ag
+        phi_Pn_yield = 0.9 * Pn_yield
+        Ae = Ag * NSF * SLF
+        Pn_rup = Fu * Ae
+        phi_Pn_rup = 0.75 * Pn_rup
+
+        # --- COMPRESSION ---
+        KL_rx = np.where(rx > 0, (Kx * L) / np.where(rx > 0, rx, 1.0), 0.0)
+        Fex, Fcrx = _fcr_flexural(KL_rx, Fy)
+        Pnx = Fcrx * Ag
+        phi_Pnx = 0.9 * Pnx
+        KL_ry = np.where(ry > 0, (Ky * L) / np.where(ry > 0, ry, 1.0), 0.0)
+        Fey, Fcry = _fcr_flexural(KL_ry, Fy)
+        Pny = Fcry * Ag
+        phi_Pny = 0.9 * Pny
+
+        # FTB, doubly symmetric (xo = yo = 0), Kz = 1
+        ro2 = np.where(Ag > 0, (Ixx + Iyy) / safe_ag, 0.0)
+        Lcz = 1.0 * L
+        term1 = np.where(Lcz > 0, (math.pi**2 * E * Cw) / np.where(Lcz > 0, Lcz, 1.0)**2, 0.0)
+        term2 = G * J
+        ag_ro2 = Ag * ro2
+        Fe_ftb = np.where(ag_ro2 > 0, (term1 + term2) * (1 / np.where(ag_ro2 > 0, ag_ro2, 1.0)), 0.0)
+        safe_fe = np.where(Fe_ftb > 0, Fe_ftb, 1.0)
+        Fcr_ftb = np.where(
+            Fe_ftb > 0,
+            np.where(Fy / safe_fe <= 2.25, (0.658**(Fy / safe_fe)) * Fy, 0.877 * Fe_ftb),
+            0.0,
+        )
+        Pn_ftb = Fcr_ftb * Ag
+        phi_Pn_ftb = 0.9 * Pn_ftb
+
+        # --- SHEAR ---
+        Cv = 1.0
+        Vnx = 0.6 * Fy * Axx * Cv
+        phi_Vnx = 0.9 * Vnx
+        Vny = 0.6 * Fy * Ayy * Cv
+        phi_Vny = 0.9 * Vny
+
+        # --- BENDING ---
+        Mnx_yield = Fy * Zxx
+        phi_Mnx_yield = 0.9 * Mnx_yield
+        Mny_yield = Fy * Zyy
+        Mny_yield = np.where(Mny_yield > 1.6 * Fy * Syy, 1.6 * Fy * Syy, Mny_yield)
+        phi_Mny = 0.9 * Mny_yield
+
+        # LTB
+        Lp = np.where(ry > 0, 1.76 * ry * (E / Fy)**0.5, 0.0)
+        safe_sxx = np.where(Sxx > 0, Sxx, 1.0)
+        rts = np.where(Sxx > 0, ((Iyy * Cw)**0.5 / safe_sxx)**0.5, 0.0)
+        has_lr = (rts > 0) & (h0 > 0)
+        term_lr1 = 1.95 * rts * E / (0.7 * Fy)
+        term_lr2 = (J * c) / (Sxx * h0)
+        term_lr3 = (term_lr2**2 + 6.76 * (0.7 * Fy / E)**2)**0.5
+        Lr = np.where(has_lr, term_lr1 * (term_lr2 + term_lr3)**0.5, 0.0)
+
+        Mp = Fy * Zxx
+        Lb = L
+        inelastic = Cb * (Mp - (Mp - 0.7 * Fy * Sxx) * (Lb - Lp) / (Lr - Lp))
+        Fcr_ltb = (Cb * math.pi**2 * E) / ((Lb / rts)**2) * (1 + 0.078 * (J * c) / (Sxx * h0) * (Lb / rts)**2)**0.5
+        elastic = Fcr_ltb * Sxx
+        Mn_ltb = np.where(Lb <= Lp, Mp, np.where(Lb <= Lr, inelastic, elastic))
+        Mn_ltb = np.where(Mn_ltb > Mp, Mp, Mn_ltb)
+        phi_Mnx = 0.9 * Mn_ltb
+
+        Mn_flb_x = Mp
+        phi_Mn_flb_x = 0.9 * Mn_flb_x
+        Mn_flb_y = Mny_yield
+        phi_Mn_flb_y = 0.9 * Mn_flb_y
+
+        # --- INTERACTION ---
+        Pc = np.where(
+            is_tension,
+            np.minimum(phi_Pn_yield, phi_Pn_rup),
+            np.minimum(np.minimum(phi_Pnx, phi_Pny), phi_Pn_ftb),
+        )
+        Mcx = np.minimum(phi_Mnx, phi_Mn_flb_x)
+        Mcy = np.minimum(phi_Mny, phi_Mn_flb_y)
+        Pr_Pc = np.where(Pc > 0, Pu / np.where(Pc > 0, Pc, 1.0), 0.0)
+        moments = Mux / Mcx + Muy / Mcy
+        h1_1a = Pr_Pc >= 0.2
+        ratio = np.where(h1_1a, Pr_Pc + 8 / 9 * moments, Pr_Pc / 2 + moments)
+
+    eqn = np.where(h1_1a, "Eq.H1-1a", "Eq.H1-1b")
+    return {
+        "checks": {
+            "tension_yielding": {"Pn": Pn_yield, "capacity": phi_Pn_yield, "demand": Pu,
+                                 "ratio": _ratio(Pu, phi_Pn_yield)},
+            "tension_rupture": {"Pn": Pn_rup, "capacity": phi_Pn_rup, "demand": Pu,
+                                "ratio": _ratio(Pu, phi_Pn_rup), "Ae": Ae},
+            "compression_x": {"Pnx": Pnx, "capacity": phi_Pnx, "demand": Pu, "ratio": _ratio(Pu, phi_Pnx),
+                              "Lcx_rx": KL_rx, "Fex": Fex, "Fcrx": Fcrx},
+            "compression_y": {"Pny": Pny, "capacity": phi_Pny, "demand": Pu, "ratio": _ratio(Pu, phi_Pny),
+                              "Lcy_ry": KL_ry, "Fey": Fey, "Fcry": Fcry},
+            "ftb": {"Pn": Pn_ftb, "capacity": phi_Pn_ftb, "demand": Pu, "ratio": _ratio(Pu, phi_Pn_ftb),
+                    "Fe": Fe_ftb, "Fcr": Fcr_ftb},
+            "shear_x": {"Vnx": Vnx, "capacity": phi_Vnx, "demand": Vux, "ratio": _ratio(Vux, phi_Vnx)},
+            "shear_y": {"Vny": Vny, "capacity": phi_Vny, "demand": Vuy, "ratio": _ratio(Vuy, phi_Vny)},
+            "flexure_x": {"Mnx": Mnx_yield, "capacity": phi_Mnx_yield, "demand": Mux,
+                          "ratio": _ratio(Mux, phi_Mnx_yield)},
+            "flexure_y": {"Mny": Mny_yield, "capacity": phi_Mny, "demand": Muy, "ratio": _ratio(Muy, phi_Mny)},
+            "ltb_x": {"Mnx": Mn_ltb, "capacity": phi_Mnx, "demand": Mux, "ratio": _ratio(Mux, phi_Mnx),
+                      "Lp": Lp, "Lr": Lr, "Rts": rts, "Cb": Cb},
+            "flb_x": {"Mnx": Mn_flb_x, "capacity": phi_Mn_flb_x, "demand": Mux,
+                      "ratio": _ratio(Mux, phi_Mn_flb_x)},
+            "flb_y": {"Mny": Mn_flb_y, "capacity": phi_Mn_flb_y, "demand": Muy,
+                      "ratio": _ratio(Muy, phi_Mn_flb_y)},
+            "interaction": {"ratio": ratio, "criteria": eqn, "Pc": Pc, "Mcx": Mcx, "Mcy": Mcy},
+        },
+        "ratio": ratio,
+        "status": np.where(ratio < 1.0, "PASS", "FAIL"),
+        "ref": eqn,
+    }
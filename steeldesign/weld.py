@@ -0,0 +1,350 @@
+"""
+Fillet weld group capacity (AISC 360-16 J2.4) for whole tables of welds.
+
+Same calculation as the Weld.py sheet, t = 0.707 w, rn = 0.6 FEXX t and
+Rn = rn n L, with phi = 0.75 (LRFD) or Omega = 2.0 (ASD), but done on
+columns so a job's thousands of shear tabs and clip welds are checked in
+one pass.
+
+Eccentrically loaded groups use the instantaneous center (IC) method of
+J2.4(c) and AISC Manual Part 8: the weld is cut into short elements, each
+with the load-deformation curve of Eq. J2-5 to J2-10, and the IC is found
+by Newton iteration so that the element forces balance the load. The result
+is the Manual's coefficient C, with Rn = C C1 D l.
+"""
+import functools
+
+import numpy as np
+import pandas as pd
+
+PHI = 0.75
+OMEGA = 2.0
+
+# Input columns of a weld table; "method" is LRFD or ASD
+WELD_COLUMNS = ["FEXX", "w", "L", "n", "Ru", "method"]
+
+# Input columns of a connection schedule to size welds for: t_plate is the
+# thinner part joined (in); an optional L_max caps the length of each line
+SIZING_COLUMNS = ["FEXX", "n", "Ru", "method", "t_plate"]
+
+# Weld sizes in sixteenths, lengths rounded up to this (in)
+SIZE_INCREMENT = 1 / 16
+LENGTH_INCREMENT = 0.25
+
+
+def read_weld_table(source, columns=WELD_COLUMNS):
+    """
+    Reads a CSV of welds (path or file-like) with the given columns; other
+    columns (ids, marks, ...) are kept. "method" defaults to LRFD.
+    """
+    table = pd.read_csv(source)
+    table.columns = [str(col).strip() for col in table.columns]
+    if "method" not in table.columns:
+        table["method"] = "LRFD"
+    missing = [col for col in columns if col not in table.columns]
+    if missing:
+        raise ValueError(f"weld table is missing column(s): {', '.join(missing)}")
+    return table
+
+
+def weld_capacity(table):
+    """
+    Adds the results to a copy of a weld table: throat t (in), Fw (ksi),
+    rn (kips/in), L_total (in), Rn (kips), R_design (phi Rn or Rn / Omega,
+    kips), utilization (Ru / R_design) and status (OK / NG).
+    """
+    out = table.copy()
+    w = out["w"].to_numpy(dtype=float)
+    fexx = out["FEXX"].to_numpy(dtype=float)
+    length = out["L"].to_numpy(dtype=float)
+    n = out["n"].to_numpy(dtype=float)
+    ru = out["Ru"].to_numpy(dtype=float)
+    lrfd = out["method"].astype(str).str.strip().str.upper().to_numpy() != "ASD"
+
+    t = 0.707 * w
+    fw = 0.6 * fexx
+    rn = fw * t
+    l_total = n * length
+    Rn = rn * l_total
+    r_design = np.where(lrfd, PHI * Rn, Rn / OMEGA)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        utilization = np.where(r_design > 0, ru / np.where(r_design > 0, r_design, 1.0), 0.0)
+
+    out["t"] = t
+    out["Fw"] = fw
+    out["rn"] = rn
+    out["L_total"] = l_total
+    out["Rn"] = Rn
+    out["R_design"] = r_design
+    out["utilization"] = utilization
+    out["status"] = np.where(utilization <= 1.0, "OK", "NG")
+    return out
+
+
+def worst_welds(results, count=10):
+    """The `count` most highly utilized welds of a `weld_capacity` table."""
+    return results.nlargest(count, "utilization")
+
+
+def minimum_weld_size(t_plate):
+    """Table J2.4 minimum fillet size (in) for the thinner part joined."""
+    t_plate = np.asarray(t_plate, dtype=float)
+    return np.select(
+        [t_plate <= 0.25, t_plate <= 0.5, t_plate <= 0.75],
+        [0.125, 0.1875, 0.25],
+        default=0.3125,
+    )
+
+
+def maximum_weld_size(t_plate):
+    """J2.2b maximum fillet size (in) along an edge of material t_plate."""
+    t_plate = np.asarray(t_plate, dtype=float)
+    return np.where(t_plate < 0.25, t_plate, t_plate - 0.0625)
+
+
+def _round_up(values, increment):
+    # The tolerance keeps exact multiples from rounding up a step
+    return np.ceil(values / increment - 1e-9) * increment
+
+
+def size_welds(table, size_increment=SIZE_INCREMENT, length_increment=LENGTH_INCREMENT):
+    """
+    Smallest weld size and then shortest length that carry Ru, for every
+    connection of a schedule (SIZING_COLUMNS, optional L_max) at once.
+
+    Capacity is linear in w and in L, so both are found by inverting
+    R_design = factor 0.6 FEXX 0.707 w n L: the J2.2b minimum size is used
+    unless the length it needs exceeds L_max, in which case w is the size
+    that just works at L_max (a blank L_max is no limit). Sizes are
+    multiples of `size_increment`. L is rounded up to `length_increment` and is
+    at least 4 w (J2.2b minimum length). Connections that would need more
+    than the maximum size get status NG with w and L left empty; the rest
+    are checked with `weld_capacity`.
+    """
+    out = table.copy()
+    fexx = out["FEXX"].to_numpy(dtype=float)
+    n = out["n"].to_numpy(dtype=float)
+    ru = out["Ru"].to_numpy(dtype=float)
+    t_plate = out["t_plate"].to_numpy(dtype=float)
+    l_max = out["L_max"].to_numpy(dtype=float) if "L_max" in out.columns else np.full(len(out), np.inf)
+    # A blank L_max cell means no limit on the length
+    l_max = np.where(np.isnan(l_max), np.inf, l_max)
+    lrfd = out["method"].astype(str).str.strip().str.upper().to_numpy() != "ASD"
+
+    # Design strength per inch of one line per inch of weld size
+    strength = np.where(lrfd, PHI, 1 / OMEGA) * 0.6 * fexx * 0.707 * n
+    # On the size grid: a plate thinner than the smallest size left is NG
+    w_min = _round_up(np.minimum(minimum_weld_size(t_plate), t_plate), size_increment)
+    w_max = maximum_weld_size(t_plate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w_at_l_max = np.where(np.isfinite(l_max), ru / (strength * l_max), 0.0)
+    w = np.maximum(w_min, _round_up(w_at_l_max, size_increment))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        length = np.maximum(_round_up(ru / (strength * w), length_increment), _round_up(4 * w, length_increment))
+    feasible = (w <= w_max + 1e-9) & (length <= l_max + 1e-9)
+
+    out["w"] = np.where(feasible, w, np.nan)
+    out["L"] = np.where(feasible, length, np.nan)
+    out["w_min"] = w_min
+    out["w_max"] = w_max
+    checked = weld_capacity(out)
+    checked["status"] = np.where(feasible, checked["status"], "NG")
+    return checked
+
+
+# ---------------------------------------------------------------------------
+# Instantaneous center method
+# ---------------------------------------------------------------------------
+# Weld groups for the IC solve, all with a vertical line of length l:
+#   "line"      the vertical line alone
+#   "parallel"  two vertical lines kl apart (n = 2 in the Weld.py sheet)
+#   "L"         vertical line plus a horizontal kl at the bottom
+#   "C"         vertical line plus horizontals kl at top and bottom
+# Horizontal legs run toward the load (+x).
+WELD_GROUPS = ("line", "parallel", "L", "C")
+
+# Elements along the vertical line l; other legs in proportion
+IC_ELEMENTS = 60
+IC_TOLERANCE = 1e-8
+IC_MAX_ITERATIONS = 30
+# Multiples of the elastic IC distance to start Newton from, in turn
+IC_RESTARTS = (1.0, 0.5, 2.0, 0.25, 4.0)
+IC_CACHE_SIZE = 4096
+
+
+def _segments(group, k):
+    """Straight welds of a group as (start, end) points, l = 1."""
+    if group not in WELD_GROUPS:
+        raise ValueError(f"unknown weld group {group!r}; use one of {', '.join(WELD_GROUPS)}")
+    vertical = ((0.0, 0.0), (0.0, 1.0))
+    if group == "line":
+        return [vertical]
+    if group == "parallel":
+        return [vertical, ((k, 0.0), (k, 1.0))]
+    if k <= 0:
+        return [vertical]
+    if group == "L":
+        return [vertical, ((0.0, 0.0), (k, 0.0))]
+    return [vertical, ((0.0, 0.0), (k, 0.0)), ((0.0, 1.0), (k, 1.0))]
+
+
+@functools.lru_cache(maxsize=256)
+def weld_elements(group, k, elements=IC_ELEMENTS):
+    """
+    Element midpoints (x, y, centroid at the origin), unit weld directions
+    (tx, ty) and lengths of a group with l = 1, as read-only arrays.
+    """
+    xs, ys, txs, tys, lengths = [], [], [], [], []
+    for (x1, y1), (x2, y2) in _segments(group, k):
+        length = np.hypot(x2 - x1, y2 - y1)
+        count = max(2, int(round(elements * length)))
+        s = (np.arange(count) + 0.5) / count
+        xs.append(x1 + s * (x2 - x1))
+        ys.append(y1 + s * (y2 - y1))
+        txs.append(np.full(count, (x2 - x1) / length))
+        tys.append(np.full(count, (y2 - y1) / length))
+        lengths.append(np.full(count, length / count))
+    x, y, tx, ty, ds = (np.concatenate(part) for part in (xs, ys, txs, tys, lengths))
+    total = ds.sum()
+    x = x - (x * ds).sum() / total
+    y = y - (y * ds).sum() / total
+    for arr in (x, y, tx, ty, ds):
+        arr.flags.writeable = False
+    return x, y, tx, ty, ds
+
+
+def _deformations(cos_theta, w):
+    """
+    sin(theta), Delta_u (Eq. J2-8) and Delta_m (Eq. J2-7) of elements whose
+    force makes angle theta with the weld axis, from |cos(theta)|.
+    """
+    theta = np.degrees(np.arccos(np.clip(cos_theta, 0.0, 1.0)))
+    delta_u = np.minimum(1.087 * w * (theta + 6) ** -0.65, 0.17 * w)
+    delta_m = 0.209 * w * (theta + 2) ** -0.32
+    return np.sin(np.radians(theta)), delta_u, delta_m
+
+
+def _element_forces(sin_theta, p, w, FEXX, ds):
+    """Element forces, Fnw Awe with Fnw from Eq. J2-5 and f(p) of Eq. J2-6."""
+    f_p = np.maximum(p * (1.9 - 0.9 * p), 0.0) ** 0.3
+    return 0.6 * FEXX * (1.0 + 0.5 * sin_theta ** 1.5) * f_p * 0.707 * w * ds
+
+
+def _ic_forces(ic, x, y, tx, ty, ds, load_point, direction, w, FEXX):
+    """
+    Element resistances for an IC at `ic`: (load P in equilibrium with the
+    moment about the IC, residual force vector / P).
+    """
+    rx, ry = x - ic[0], y - ic[1]
+    r = np.maximum(np.hypot(rx, ry), 1e-12)
+    arm = (load_point[0] - ic[0]) * direction[1] - (load_point[1] - ic[1]) * direction[0]
+    sense = 1.0 if arm >= 0 else -1.0
+    # Elements move perpendicular to r about the IC
+    ux, uy = -sense * ry / r, sense * rx / r
+    sin_theta, delta_u, delta_m = _deformations(np.abs(ux * tx + uy * ty), w)
+    # Deformations in proportion to r, limited by the critical element
+    critical = np.argmin(delta_u / r)
+    force = _element_forces(sin_theta, r * (delta_u[critical] / r[critical]) / delta_m, w, FEXX, ds)
+    P = (force * r).sum() / abs(arm)
+    # The load is resisted by the element forces along their motion
+    residual = np.array([(force * ux).sum() - P * direction[0], (force * uy).sum() - P * direction[1]])
+    return P, residual / P
+
+
+def _concentric(x, y, tx, ty, ds, direction, w, FEXX):
+    """Group strength for a load through the centroid: equal translation."""
+    sin_theta, delta_u, delta_m = _deformations(np.abs(direction[0] * tx + direction[1] * ty), w)
+    return float(_element_forces(sin_theta, delta_u.min() / delta_m, w, FEXX, ds).sum())
+
+
+def ic_solve(group, k, a, theta, guess=None, w=1 / 16, FEXX=70.0, elements=IC_ELEMENTS, perpendicular=False):
+    """
+    Instantaneous center solve for a group with l = 1 (see WELD_GROUPS).
+
+    The load acts at angle `theta` (degrees from vertical) through a point
+    a l to the right of the centroid, or, with `perpendicular`, along a line
+    a l from the centroid (a cos(theta) for the horizontal a). `guess` is a
+    starting IC (x, y) from the centroid, tried before the elastic center
+    of rotation.
+
+    Returns {"Rn", "ic", "iterations", "converged"}; Rn is in kips for weld
+    size w (in) and l = 1 in, and ic is None for a concentric load. Where
+    the critical element switches right at the solution the iteration can
+    stall short of the tolerance from every start; the best point is then
+    returned with "converged" False.
+    """
+    x, y, tx, ty, ds = weld_elements(group, float(k), elements)
+    angle = np.radians(theta)
+    direction = np.array([np.sin(angle), -np.cos(angle)])
+    normal = np.array([-direction[1], direction[0]])
+    load_point = float(a) * normal if perpendicular else np.array([float(a), 0.0])
+    eccentricity = float(load_point @ normal)
+    if abs(eccentricity) < 1e-9:
+        return {"Rn": _concentric(x, y, tx, ty, ds, direction, w, FEXX), "ic": None, "iterations": 0,
+                "converged": True}
+
+    def residual(point):
+        # Scaled by the IC distance: the force residual alone also tends to
+        # zero as the IC runs off to infinity (the concentric limit)
+        P, res = _ic_forces(point, x, y, tx, ty, ds, load_point, direction, w, FEXX)
+        res = res * max(1.0, np.hypot(*point))
+        error = np.hypot(*res)
+        return P, res, error if np.isfinite(error) else np.inf
+
+    # Elastic center of rotation, Ip / (A e) from the centroid, then points
+    # nearer and farther along the same line if Newton stalls from there
+    elastic = -((x * x + y * y) * ds).sum() / (ds.sum() * eccentricity) * normal
+    starts = [] if guess is None else [np.array(guess, dtype=float)]
+    starts += [elastic * factor for factor in IC_RESTARTS]
+
+    best, iterations = None, 0
+    for ic in starts:
+        P, res, error = residual(ic)
+        for _ in range(IC_MAX_ITERATIONS):
+            if error < IC_TOLERANCE:
+                break
+            iterations += 1
+            jac = np.empty((2, 2))
+            for j in range(2):
+                shifted = ic.copy()
+                shifted[j] += 1e-7 * max(1.0, abs(ic[j]))
+                jac[:, j] = (residual(shifted)[1] - res) / (shifted[j] - ic[j])
+            try:
+                delta = np.linalg.solve(jac, -res)
+            except np.linalg.LinAlgError:
+                delta = -res
+            # Halve the step until the residual goes down
+            scale = 1.0
+            while True:
+                trial = residual(ic + scale * delta)
+                if trial[2] < error or scale < 1e-4:
+                    break
+                scale *= 0.5
+            ic = ic + scale * delta
+            P, res, error = trial
+        if best is None or error < best[2]:
+            best = (P, ic, error)
+        if error < IC_TOLERANCE:
+            break
+    P, ic, error = best
+    return {"Rn": float(P), "ic": (float(ic[0]), float(ic[1])), "iterations": iterations,
+            "converged": bool(error < IC_TOLERANCE)}
+
+
+@functools.lru_cache(maxsize=IC_CACHE_SIZE)
+def ic_coefficient(group, k, a, theta):
+    """
+    AISC Manual Part 8 coefficient C for a group, eccentricity a and load
+    angle theta (degrees): Rn = C C1 D l with D the weld size in sixteenths
+    and C1 = FEXX / 70. Solves with 1/16 in. E70 weld and l = 1.
+    """
+    return ic_solve(group, k, a, theta)["Rn"]
+
+
+def eccentric_capacity(group, l, k, a, theta, w, FEXX=70.0, method="LRFD"):
+    """
+    Design strength (kips) of an eccentrically loaded group with vertical
+    length l (in) and weld size w (in): phi Rn or Rn / Omega.
+    """
+    Rn = ic_coefficient(group, float(k), float(a), float(theta)) * (FEXX / 70.0) * (w * 16) * l
+    return PHI * Rn if str(method).strip().upper() != "ASD" else Rn / OMEGA
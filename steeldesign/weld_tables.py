@@ -0,0 +1,193 @@
+"""
+Precomputed eccentric weld coefficients C (AISC Manual Part 8 style).
+
+An instantaneous center solve takes about a millisecond, which adds up over
+a schedule of thousands of brackets. The tables hold C from `weld.ic_solve`
+over a grid of k, eccentricity and load angle for every group in
+`weld.WELD_GROUPS`. They ship with the package as data/weld_c_tables.npz;
+after a change to the solve or the grid, bump C_TABLES_VERSION and
+regenerate the file (about 10 s) with
+
+    python -m steeldesign.weld_tables
+
+Queries are answered by trilinear interpolation. The grid is over
+the perpendicular eccentricity of the load line, a cos(theta), rather than
+the horizontal a: C only depends on the line of action, and it changes
+smoothly with theta at a fixed distance to it, whereas at a fixed a it
+jumps toward the concentric value as theta approaches 90. Queries outside
+the grid, and welds whose utilization from the interpolated C is within
+`EXACT_BAND` of 1.0, are solved exactly instead.
+"""
+import argparse
+import functools
+import os
+import threading
+
+import numpy as np
+
+from steeldesign.weld import OMEGA, PHI, WELD_GROUPS, ic_coefficient, ic_solve
+
+C_TABLES_NPZ = os.path.join(os.path.dirname(__file__), "data", "weld_c_tables.npz")
+C_TABLES_VERSION = 2
+
+# Grid of the tables; finer in the eccentricity where C changes fastest
+K_GRID = np.concatenate([np.arange(0.0, 1.0, 0.1), np.arange(1.0, 2.01, 0.2)]).round(3)
+ECC_GRID = np.concatenate([np.arange(0.0, 0.3, 0.05), np.arange(0.3, 1.0, 0.1), np.arange(1.0, 3.01, 0.2)]).round(3)
+THETA_GRID = np.arange(0.0, 90.1, 15.0)
+
+# One build at a time when the tables are missing; see load_c_tables
+_LOAD_LOCK = threading.Lock()
+
+# Utilizations this close to 1.0 are rechecked with an exact solve
+EXACT_BAND = 0.05
+
+# Columns of an eccentric weld table, in addition to weld.WELD_COLUMNS:
+# group (see WELD_GROUPS), kL and e (in, e from the centroid), theta (deg)
+ECCENTRIC_COLUMNS = ["group", "kL", "e", "theta"]
+
+
+def build_c_tables(k_grid=K_GRID, ecc_grid=ECC_GRID, theta_grid=THETA_GRID):
+    """
+    C over (k, a cos(theta), theta) for every weld group, as a dict of
+    arrays ready for np.savez. Along the eccentricity axis each solve
+    starts from the IC of the previous grid point.
+    """
+    tables = {"k": np.asarray(k_grid, dtype=float), "ecc": np.asarray(ecc_grid, dtype=float),
+              "theta": np.asarray(theta_grid, dtype=float), "version": np.array(C_TABLES_VERSION)}
+    shape = (len(tables["k"]), len(tables["ecc"]), len(tables["theta"]))
+    for group in WELD_GROUPS:
+        C = np.empty(shape)
+        # A single line does not depend on k
+        k_values = tables["k"][:1] if group == "line" else tables["k"]
+        for i, k in enumerate(k_values):
+            for m, theta in enumerate(tables["theta"]):
+                guess = None
+                for j, ecc in enumerate(tables["ecc"]):
+                    solved = ic_solve(group, k, ecc, theta, guess=guess, perpendicular=True)
+                    C[i, j, m] = solved["Rn"]
+                    # The IC distance goes roughly as 1 / eccentricity
+                    next_ecc = tables["ecc"][j + 1] if j + 1 < len(tables["ecc"]) else ecc
+                    guess = None if solved["ic"] is None else np.array(solved["ic"]) * ecc / next_ecc
+        if group == "line":
+            C[:] = C[:1]
+        tables[group] = C
+    return tables
+
+
+def load_c_tables(path=C_TABLES_NPZ):
+    """
+    The C tables from `path`. If the file is missing or from another
+    version they are built in memory (once per process, the other callers
+    wait for it) and not written anywhere: the package directory may be
+    read-only, and the shipped file is regenerated with `main`.
+    """
+    with _LOAD_LOCK:
+        return _load_c_tables(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_c_tables(path):
+    if os.path.exists(path):
+        with np.load(path) as npz:
+            tables = {name: npz[name] for name in npz.files}
+        if int(tables.get("version", -1)) == C_TABLES_VERSION:
+            return tables
+    return build_c_tables()
+
+
+def _bracket(grid, values):
+    """Lower grid index and weight of the upper neighbour for each value."""
+    i = np.clip(np.searchsorted(grid, values, side="right") - 1, 0, len(grid) - 2)
+    return i, (values - grid[i]) / (grid[i + 1] - grid[i])
+
+
+def interpolate_c(group, k, a, theta, tables=None):
+    """
+    Trilinear C for arrays of k, a and theta of one group, and a mask of
+    the queries inside the grid (outside it the values are extrapolated).
+    """
+    if group not in WELD_GROUPS:
+        raise ValueError(f"unknown weld group {group!r}; use one of {', '.join(WELD_GROUPS)}")
+    tables = load_c_tables() if tables is None else tables
+    k, a, theta = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (k, a, theta)))
+    C = tables[group]
+    ecc = a * np.cos(np.radians(theta))
+    axes = [(tables["k"], k), (tables["ecc"], ecc), (tables["theta"], theta)]
+    inside = np.ones(k.shape, dtype=bool)
+    brackets = []
+    for grid, values in axes:
+        inside &= (values >= grid[0]) & (values <= grid[-1])
+        brackets.append(_bracket(grid, values))
+    (i, ti), (j, tj), (m, tm) = brackets
+    result = np.zeros(k.shape)
+    for di in (0, 1):
+        for dj in (0, 1):
+            for dm in (0, 1):
+                weight = (ti if di else 1 - ti) * (tj if dj else 1 - tj) * (tm if dm else 1 - tm)
+                result += weight * C[i + di, j + dj, m + dm]
+    return result, inside
+
+
+def c_coefficients(group, k, a, theta, tables=None):
+    """C for arrays of queries of one group; exact solves outside the grid."""
+    C, inside = interpolate_c(group, k, a, theta, tables)
+    k, a, theta = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (k, a, theta)))
+    for idx in zip(*np.nonzero(~inside)):
+        C[idx] = ic_coefficient(group, float(k[idx]), float(a[idx]), float(theta[idx]))
+    return C
+
+
+def eccentric_capacity_table(table, tables=None):
+    """
+    Adds C, R_design (kips), utilization, status (OK / NG) and "exact"
+    (whether C came from an IC solve) to a copy of an eccentric weld
+    table: weld.WELD_COLUMNS (n is not used) plus ECCENTRIC_COLUMNS.
+    """
+    out = table.copy()
+    length = out["L"].to_numpy(dtype=float)
+    k = out["kL"].to_numpy(dtype=float) / length
+    a = out["e"].to_numpy(dtype=float) / length
+    theta = out["theta"].to_numpy(dtype=float)
+    groups = out["group"].astype(str).str.strip().to_numpy()
+    C = np.zeros(len(out))
+    inside = np.zeros(len(out), dtype=bool)
+    for group in np.unique(groups):
+        rows = groups == group
+        C[rows], inside[rows] = interpolate_c(group, k[rows], a[rows], theta[rows], tables)
+
+    scale = out["FEXX"].to_numpy(dtype=float) / 70.0 * out["w"].to_numpy(dtype=float) * 16 * length
+    lrfd = out["method"].astype(str).str.strip().str.upper().to_numpy() != "ASD"
+    factor = np.where(lrfd, PHI, 1 / OMEGA)
+    ru = out["Ru"].to_numpy(dtype=float)
+
+    def utilization_of(C):
+        r_design = factor * C * scale
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return r_design, np.where(r_design > 0, ru / np.where(r_design > 0, r_design, 1.0), 0.0)
+
+    r_design, utilization = utilization_of(C)
+    exact = ~inside | (np.abs(utilization - 1.0) <= EXACT_BAND)
+    for row in np.nonzero(exact)[0]:
+        C[row] = ic_coefficient(groups[row], float(k[row]), float(a[row]), float(theta[row]))
+    r_design, utilization = utilization_of(C)
+
+    out["C"] = C
+    out["R_design"] = r_design
+    out["utilization"] = utilization
+    out["status"] = np.where(utilization <= 1.0, "OK", "NG")
+    out["exact"] = exact
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m steeldesign.weld_tables",
+        description="Precompute the eccentric weld coefficient tables.",
+    )
+    parser.add_argument("-o", "--output", default=C_TABLES_NPZ, help="npz file to write")
+    args = parser.parse_args(argv)
+    np.savez_compressed(args.output, **build_c_tables())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+Shared test data: the sample report of the STAAD_CHECK page (one W8X31
+member) and output files made of renumbered copies of it.
+"""
+import pytest
+
+from helpers import read_data, renumbered
+
+
+@pytest.fixture(scope="session")
+def sample_report():
+    return read_data("sample_report.txt")
+
+
+@pytest.fixture
+def sample_model(tmp_path, sample_report):
+    """model(count): path of an output file holding members 1..count."""
+    def model(count, name="model.anl"):
+        path = tmp_path / name
+        path.write_text("".join(renumbered(sample_report, n) for n in range(1, count + 1)))
+        return path
+    return model
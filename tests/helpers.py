@@ -0,0 +1,16 @@
+"""Helpers shared by the tests: the sample report and renumbered copies of it."""
+import os
+import re
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def read_data(name):
+    with open(os.path.join(DATA, name), encoding="utf-8") as fh:
+        return fh.read()
+
+
+def renumbered(block, member):
+    """The sample block with its member number replaced (same widths)."""
+    block = re.sub(r"^Member :\s*\d+", f"Member :{member:>6}", block, flags=re.M)
+    return re.sub(r"Member No:\s*\d+", f"Member No:{member:>9}", block)
@@ -0,0 +1,45 @@
+"""Parallel batch checks against parsing the file member by member."""
+import math
+
+from helpers import renumbered
+from steeldesign.batch import check_file, plan_chunks, summary_row
+from steeldesign.parser import parse_staad_report
+from steeldesign.stream import iter_member_reports
+from steeldesign.vector import check_columns, columns_from_reports
+
+
+def test_chunks_cover_the_file(sample_model):
+    path = sample_model(25)
+    chunks = plan_chunks(path, 4)
+    assert len(chunks) == 7
+    assert all(end == start for (_, end), (start, _) in zip(chunks, chunks[1:]))
+    assert chunks[-1][1] == path.stat().st_size
+
+
+def test_check_file_matches_sequential_parse(sample_model):
+    path = sample_model(25)
+    expected = [summary_row(data) for data in iter_member_reports(path)]
+    assert list(check_file(path, workers=1, chunk_members=4)) == expected
+    assert list(check_file(path, workers=2, chunk_members=4)) == expected
+    full = list(check_file(path, workers=1, chunk_members=7, full=True))
+    assert [data["id"] for data in full] == [str(n) for n in range(1, 26)]
+
+
+def test_undefined_capacities_fail_instead_of_stopping_the_run(tmp_path, sample_report):
+    # An angle has no warping constant, so rts = 0 and F2-4 is undefined
+    angle = sample_report.replace("ST  W8X31 ", "ST  L40404").replace("5.311E+02", "0.000E+00")
+    path = tmp_path / "model.anl"
+    path.write_text(renumbered(sample_report, 1) + renumbered(angle, 2) + renumbered(sample_report, 3))
+    rows = list(check_file(path, workers=1))
+    assert [row["member"] for row in rows] == ["1", "2", "3"]
+    assert rows[0]["status"] == rows[2]["status"] == "PASS"
+    assert rows[1]["status"] == "FAIL" and math.isnan(rows[1]["ratio"])
+
+    data = list(iter_member_reports(path))[1]
+    assert math.isnan(check_columns(columns_from_reports([data]))["ratio"][0])
+
+    # No plastic modulus: Mcx = 0 and the moment ratio is infinite
+    no_zxx = sample_report.replace("ST  W8X31 ", "ST  L40404").replace("Zxx :   3.040E+01", "Zxx :   0.000E+00")
+    data = parse_staad_report(no_zxx)
+    assert data["checks"]["interaction"]["Mcx"] == 0
+    assert data["ratio"] == math.inf and data["status"] == "FAIL"
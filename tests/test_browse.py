@@ -0,0 +1,51 @@
+"""The model browser's summary: filtering, sorting and paging."""
+import pandas as pd
+import pytest
+
+from steeldesign.batch import check_file
+from steeldesign.browse import load_summary, query_summary, table_frame
+from steeldesign.records import MemberTable
+from steeldesign.stream import iter_member_reports
+from steeldesign.synthetic import synthetic_members
+
+
+@pytest.fixture(scope="module")
+def model(tmp_path_factory):
+    path = tmp_path_factory.mktemp("browse") / "model.anl"
+    path.write_text("".join(synthetic_members(150, seed=4)))
+    return path
+
+
+def test_load_summary_matches_summary_rows(model):
+    # Several chunks, so the label codes of the tables are remapped
+    frame = load_summary(model, workers=1, chunk_members=40)
+    rows = list(check_file(model, workers=1))
+    assert frame["member"].tolist() == [int(row["member"]) for row in rows]
+    assert frame["loadcase"].tolist() == [int(row["loadcase"]) for row in rows]
+    for column in ("profile", "status", "ref", "governing", "ratio", "governing_ratio"):
+        assert frame[column].tolist() == [row[column] for row in rows], column
+    assert str(frame["member"].dtype) == "Int64" and frame["profile"].dtype == "category"
+
+    single = table_frame(MemberTable.from_reports(iter_member_reports(model)))
+    pd.testing.assert_frame_equal(frame, single)
+
+
+def test_query_filters_sorts_and_pages(model):
+    frame = load_summary(model, workers=1)
+    page, total = query_summary(frame, status="FAIL", page_size=500)
+    failing = frame[frame["status"] == "FAIL"]
+    assert total == len(failing) > 0
+    assert page["ratio"].tolist() == sorted(failing["ratio"], reverse=True)
+
+    page, total = query_summary(frame, profile="w8", min_ratio=0.5, sort_by="member", descending=False)
+    expected = [member for member, profile, ratio in zip(frame["member"], frame["profile"], frame["ratio"])
+                if "W8" in profile and ratio >= 0.5]
+    assert page["member"].tolist() == expected and total == len(expected)
+
+    rows, total = query_summary(frame, sort_by="profile", descending=False, page_size=500)
+    assert rows["profile"].tolist() == sorted(frame["profile"])
+
+    # Pages past the end are clamped to the last one
+    page, total = query_summary(frame, sort_by="member", descending=False, page=9, page_size=40)
+    assert total == 150
+    assert page["member"].tolist() == list(range(121, 151))
@@ -0,0 +1,58 @@
+"""The content-addressed result cache and its disk tier."""
+import os
+import stat
+
+from steeldesign.cache import PRUNE_EVERY, ResultCache, cached, content_key
+from steeldesign.parser import parse_staad_report
+
+
+def test_key_depends_on_namespace_text_and_params():
+    key = content_key("parse", "text", {"a": 1})
+    assert key == content_key("parse", "text", {"a": 1})
+    assert key != content_key("parse", "text", {"a": 2})
+    assert key != content_key("parse", "other", {"a": 1})
+    assert key != content_key("split", "text", {"a": 1})
+
+
+def test_repeated_text_is_computed_once(sample_report):
+    cache = ResultCache(maxsize=2)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return parse_staad_report(sample_report)
+
+    first = cached("parse_staad_report", sample_report, compute, cache=cache)
+    assert cached("parse_staad_report", sample_report, compute, cache=cache) is first
+    assert len(calls) == 1
+    assert cache.info()["hits"] == 1
+
+
+def test_disk_tier_survives_a_new_process(tmp_path):
+    cache = ResultCache(directory=str(tmp_path / "cache"))
+    cache.put(content_key("test", "text"), 42)
+    assert ResultCache(directory=cache.directory).get(content_key("test", "text")) == 42
+
+
+def test_unreadable_entry_is_recomputed(tmp_path):
+    cache = ResultCache(directory=tmp_path / "cache")
+    key = content_key("test", "text")
+    # Unpickles to a reference to a module that does not exist
+    with open(os.path.join(cache.directory, key + ".pkl"), "wb") as fh:
+        fh.write(b"cno_such_module\nthing\n.")
+    assert cache.get_or_compute(key, lambda: 42) == 42
+    assert ResultCache(directory=cache.directory).get(key) == 42
+
+
+def test_disk_tier_is_pruned_every_few_stores(tmp_path):
+    cache = ResultCache(maxsize=1, directory=tmp_path / "cache", disk_maxsize=10)
+    for i in range(PRUNE_EVERY - 1):
+        cache.put(f"k{i}", i)
+    assert len(os.listdir(cache.directory)) == PRUNE_EVERY - 1
+    cache.put("last", -1)
+    assert len(os.listdir(cache.directory)) == 10
+
+
+def test_cache_directory_is_private(tmp_path):
+    cache = ResultCache(directory=tmp_path / "cache")
+    assert stat.S_IMODE(os.stat(cache.directory).st_mode) & 0o077 == 0
@@ -0,0 +1,61 @@
+"""Columnar export of batch results."""
+import pytest
+
+pytest.importorskip("pyarrow")
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from steeldesign.batch import check_file
+from steeldesign.export import export_file
+from steeldesign.shapes import normalize_profile
+from steeldesign.synthetic import synthetic_members
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "model.anl"
+    path.write_text("".join(synthetic_members(80, seed=12)))
+    return path
+
+
+def test_export_matches_summary_rows(model, tmp_path):
+    output = tmp_path / "results.parquet"
+    assert export_file(model, output, workers=1, chunk_members=30) == 80
+    table = pq.read_table(output)
+    rows = list(check_file(model, workers=1))
+    assert table.column("member").to_pylist() == [int(row["member"]) for row in rows]
+    assert table.column("ratio").to_pylist() == [row["ratio"] for row in rows]
+    assert table.column("profile").to_pylist() == [row["profile"] for row in rows]
+    assert table.column("shape").to_pylist() == [normalize_profile(row["profile"]) for row in rows]
+
+    arrow = tmp_path / "results.arrow"
+    export_file(model, arrow, fmt="arrow", workers=1)
+    with ipc.open_file(arrow) as reader:
+        assert reader.read_all().equals(table)
+
+
+def test_partitioned_by_loadcase(model, tmp_path):
+    output = tmp_path / "results"
+    export_file(model, output, partition_by="loadcase", workers=1)
+    assert all(path.name.startswith("loadcase=") for path in output.iterdir())
+    dataset = ds.dataset(output, format="parquet", partitioning="hive")
+    assert dataset.count_rows() == 80
+
+
+def test_partitioned_by_shape(model, tmp_path):
+    output = tmp_path / "results"
+    export_file(model, output, partition_by="shape", workers=1)
+    shapes = sorted(path.name for path in output.iterdir())
+    assert shapes and all(name.startswith("shape=W") and " " not in name for name in shapes)
+    dataset = ds.dataset(output, format="parquet", partitioning="hive")
+    assert dataset.count_rows() == 80
+    name = shapes[0].split("=", 1)[1]
+    subset = dataset.to_table(filter=ds.field("shape") == name)
+    assert subset.num_rows > 0
+    assert {normalize_profile(p) for p in subset.column("profile").to_pylist()} == {name}
+
+
+def test_unknown_partition_column(model, tmp_path):
+    with pytest.raises(ValueError):
+        export_file(model, tmp_path / "out", partition_by="profile", workers=1)
@@ -0,0 +1,47 @@
+"""Member index lookups and the sidecar file."""
+import os
+
+from helpers import renumbered
+from steeldesign import index as index_module
+from steeldesign.index import MemberIndex, index_path, load_index
+from steeldesign.parser import parse_staad_report
+
+
+def test_blocks_read_through_the_index(sample_model):
+    path = sample_model(30)
+    with MemberIndex(path) as index:
+        assert index.members() == list(range(1, 31))
+        assert 17 in index and 31 not in index
+        assert index.loadcases(17) == [1006]
+        for member in (1, 17, 30):
+            assert parse_staad_report(index.block(member))["id"] == str(member)
+        assert index.report(12)["id"] == "12"
+    assert [entry[0] for entry in load_index(path)] == list(range(1, 31))
+
+
+def test_sidecar_is_dropped_when_the_file_changes(sample_model, sample_report):
+    path = sample_model(3)
+    MemberIndex(path).close()
+    with open(path, "a") as fh:
+        fh.write(renumbered(sample_report, 4))
+    assert load_index(path) is None
+    with MemberIndex(path) as index:
+        assert index.members() == [1, 2, 3, 4]
+
+
+def test_index_without_a_writable_sidecar(sample_model, tmp_path, monkeypatch):
+    path = sample_model(30)
+    unwritable = tmp_path / "missing" / "model.anl.idx"
+    monkeypatch.setattr(index_module, "index_path", lambda _: os.fspath(unwritable))
+    with MemberIndex(path) as index:
+        assert len(index) == 30
+        assert parse_staad_report(index.block(12))["id"] == "12"
+    assert not unwritable.exists()
+    assert not os.path.exists(index_path(path))
+
+
+def test_sidecar_leaves_no_temporary_files(sample_model):
+    path = sample_model(5)
+    MemberIndex(path).close()
+    MemberIndex(path, rebuild=True).close()
+    assert sorted(p.name for p in path.parent.iterdir()) == ["model.anl", "model.anl.idx"]
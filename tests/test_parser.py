@@ -0,0 +1,29 @@
+"""
+parse_staad_report and parse_check_blocks against the parsers they replaced
+in STAAD_CHECK.py and STAAD.py before the steeldesign package. Their output on
+the sample report is stored in data/*_baseline.json.
+"""
+import json
+
+from helpers import read_data
+from steeldesign.blocks import parse_check_blocks
+from steeldesign.parser import parse_staad_report
+
+
+def test_sample_matches_baseline_parser(sample_report):
+    expected = json.loads(read_data("sample_report_baseline.json"))
+    actual = json.loads(json.dumps(parse_staad_report(sample_report), default=str))
+    # The old parser left the clause of some checks empty; it is now read
+    for name, check in expected["checks"].items():
+        if check.get("ref") == "" and actual["checks"][name]["ref"]:
+            assert actual["checks"][name]["ref"].startswith("Cl."), name
+            actual["checks"][name]["ref"] = ""
+    assert actual == expected
+
+
+
+def test_check_blocks_match_baseline_parser(sample_report):
+    # Output of STAAD.py parse_block_logic before the steeldesign package
+    expected = json.loads(read_data("sample_check_blocks_baseline.json"))
+    actual = json.loads(json.dumps(parse_check_blocks(sample_report), default=str))
+    assert actual == expected
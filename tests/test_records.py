@@ -0,0 +1,25 @@
+"""MemberRecord / MemberTable against the parsed reports they hold."""
+import pytest
+
+from steeldesign.parser import parse_staad_report
+from steeldesign.records import MemberRecord, MemberTable, load_table
+from steeldesign.synthetic import synthetic_members
+
+
+def test_member_table_records_match_reports():
+    reports = [parse_staad_report(block) for block in synthetic_members(20, seed=6)]
+    table = MemberTable.from_reports(reports)
+    assert len(table) == 20
+    assert list(table) == [MemberRecord.from_report(data) for data in reports]
+    results = table.check()
+    assert list(results["ratio"]) == pytest.approx([data["ratio"] for data in reports], rel=1e-9)
+
+
+def test_load_table_concatenates_chunks(tmp_path):
+    blocks = list(synthetic_members(60, seed=8))
+    path = tmp_path / "model.anl"
+    path.write_text("".join(blocks))
+    # Several chunks, so the label codes of the tables are remapped
+    table = load_table(path, workers=1, chunk_members=16)
+    assert list(table) == list(MemberTable.from_blocks(blocks))
+    assert list(table.text("profile")) == [record.profile for record in table]
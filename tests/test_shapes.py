@@ -0,0 +1,37 @@
+"""The bundled AISC shapes table."""
+import re
+
+import pytest
+
+from steeldesign.parser import parse_staad_report
+from steeldesign.shapes import load_shapes, lookup, normalize_profile, section_properties
+
+
+def test_profile_names():
+    assert normalize_profile("ST  W8X31") == "W8X31"
+    assert normalize_profile("w8x31") == "W8X31"
+    assert lookup("ST  W8X31")["shape"] == lookup("W8X31")["shape"] == "W8X31"
+
+
+def test_table_agrees_with_staad_properties(sample_report):
+    printed = parse_staad_report(sample_report)["properties"]
+    tabulated = section_properties("ST  W8X31")
+    for name, prop in tabulated.items():
+        # STAAD prints four significant figures
+        assert prop["value"] == pytest.approx(printed[name]["value"], rel=1e-2), name
+
+
+def test_truncated_report_takes_properties_from_the_table(sample_report):
+    full = parse_staad_report(sample_report)
+    # The SECTION PROPERTIES box removed
+    truncated = re.sub(r"\| SECTION PROPERTIES.*?\|-{10,}\|\n", "", sample_report, flags=re.S)
+    assert "Ixx" not in truncated
+    data = parse_staad_report(truncated)
+    assert set(data["properties"]) >= set(section_properties("W8X31"))
+    assert data["ratio"] == pytest.approx(full["ratio"], rel=1e-3)
+
+
+def test_table_is_read_once():
+    table, by_name = load_shapes()
+    assert load_shapes()[0] is table
+    assert len(table) == len(by_name) > 300
@@ -0,0 +1,49 @@
+"""`sizing.size_member` against a brute-force search of the W shapes."""
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from steeldesign.parser import parse_staad_report
+from steeldesign.shapes import load_shapes
+from steeldesign.sizing import ACCEPT_CHECKS, PASS_LIMIT, check_shape, size_member
+
+
+def brute_force(data, family="W"):
+    table, _ = load_shapes()
+    rows = table[table["type"] == family]
+    for row in rows[np.argsort(rows["weight"], kind="stable")]:
+        trial = check_shape(data, str(row["shape"]))
+        if all(trial["checks"][name]["ratio"] < PASS_LIMIT for name in ACCEPT_CHECKS):
+            return trial["profile"]
+    return None
+
+
+def loaded(base, rng):
+    """The sample member under random forces and length."""
+    data = copy.deepcopy(base)
+    data["params"]["Length"] = rng.uniform(60.0, 480.0)
+    forces = data["forces"]
+    forces["Pz"]["value"] = rng.uniform(0, 800)
+    forces["Pz"]["type"] = rng.choice(("Tension", "Compression"))
+    for key, top in (("Vx", 40), ("Vy", 150), ("Mx", 12000), ("My", 1500)):
+        forces[key]["value"] = rng.uniform(-top, top)
+    return data
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_size_member_matches_brute_force(sample_report, seed):
+    data = loaded(parse_staad_report(sample_report), random.Random(seed))
+    sized = size_member(data)
+    assert (sized and sized["profile"]) == brute_force(data)
+    if sized:
+        assert sized["ratio"] < PASS_LIMIT
+        assert sized["full_checks"] >= 1
+
+
+def test_size_member_none_when_nothing_passes(sample_report):
+    data = parse_staad_report(sample_report)
+    data["forces"]["Mx"]["value"] = 1e9
+    assert size_member(data) is None
+    assert brute_force(data) is None
@@ -0,0 +1,90 @@
+"""The results store: incremental rebuilds against full ones, and queries."""
+import random
+import shutil
+import sqlite3
+
+import pytest
+
+from steeldesign.store import ResultsStore, build_store, load_store, store_path
+from steeldesign.synthetic import member_block, random_member, synthetic_members
+
+
+def stored(path):
+    conn = sqlite3.connect(store_path(path))
+    try:
+        return conn.execute("SELECT * FROM results ORDER BY rowid").fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "model.anl"
+    path.write_text("".join(synthetic_members(120, seed=11)))
+    return path
+
+
+def test_incremental_rebuild_matches_full_rebuild(model, tmp_path):
+    report = build_store(model, workers=1, chunk_members=25)
+    assert (report["members"], report["checked"], report["previous"]) == (120, 120, 0)
+
+    blocks = list(synthetic_members(120, seed=11))
+    for member in (5, 60, 61):
+        blocks[member - 1] = member_block(**random_member(random.Random(member * 13), member))
+    del blocks[89]
+    blocks.append(member_block(**random_member(random.Random(1), 121)))
+    model.write_text("".join(blocks))
+
+    report = build_store(model, workers=1, chunk_members=25)
+    assert report["checked"] == 4 and report["reused"] == 116
+    assert [after["member"] for _, after in report["modified"]] == [5, 60, 61]
+    assert [row["member"] for row in report["added"]] == [121]
+    assert [row["member"] for row in report["removed"]] == [90]
+
+    full = tmp_path / "full.anl"
+    shutil.copyfile(model, full)
+    build_store(full, workers=1, reuse=False)
+    assert stored(model) == stored(full)
+
+
+def test_store_is_reused_until_the_file_changes(model):
+    assert build_store(model, workers=1)["members"] == 120
+    conn = load_store(model)
+    assert conn is not None
+    conn.close()
+    with open(model, "a") as fh:
+        fh.write(member_block(**random_member(random.Random(2), 121)))
+    assert load_store(model) is None
+
+
+def test_query_filters(model):
+    with ResultsStore(model, workers=1) as store:
+        assert len(store) == 120
+        rows, total = store.query(limit=1000)
+        assert total == 120
+        assert [row["ratio"] for row in rows] == sorted((row["ratio"] for row in rows), reverse=True)
+
+        shape = store.distinct("shape")[0]
+        rows, total = store.query(shape=shape, limit=1000)
+        assert total == len(rows) > 0 and {row["shape"] for row in rows} == {shape}
+
+        rows, total = store.query(min_ratio=0.5, max_ratio=0.9, members=(10, 80), limit=1000)
+        assert all(0.5 <= row["ratio"] <= 0.9 and 10 <= row["member"] <= 80 for row in rows)
+        assert total == len(rows)
+
+        with pytest.raises(ValueError):
+            store.query(sort_by="member; DROP TABLE results")
+
+
+def test_build_leaves_no_temporary_files(model):
+    build_store(model, workers=1)
+    build_store(model, workers=1)
+    assert sorted(p.name for p in model.parent.iterdir()) == ["model.anl", "model.anl.results.sqlite"]
+
+
+def test_unreadable_store_is_rebuilt(model):
+    with open(store_path(model), "wb") as fh:
+        fh.write(b"not a database" * 100)
+    assert load_store(model) is None
+    with ResultsStore(model, workers=1) as store:
+        assert len(store) == 120
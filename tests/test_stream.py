@@ -0,0 +1,24 @@
+"""Splitting whole output files into member blocks."""
+from helpers import renumbered
+from steeldesign.parser import parse_staad_report
+from steeldesign.stream import block_label, iter_member_blocks, iter_member_reports
+
+
+def test_blocks_split_at_member_headers(sample_report):
+    text = "STAAD.Pro input echo\n" + "".join(renumbered(sample_report, n) for n in range(1, 6))
+    blocks = list(iter_member_blocks(text.splitlines(keepends=True)))
+    assert [parse_staad_report(block)["id"] for block in blocks] == ["1", "2", "3", "4", "5"]
+    # Blocks start at the "Member No:" header; the echo before it is skipped
+    assert all("Member No:" in block.splitlines()[0] for block in blocks)
+    assert text.endswith("".join(blocks))
+    assert block_label(blocks[2]).startswith("Member No: 3 Profile: ST W8X31")
+
+
+def test_reports_of_a_file(sample_model, sample_report):
+    path = sample_model(4)
+    reports = list(iter_member_reports(path))
+    single = parse_staad_report(sample_report)
+    assert [data["id"] for data in reports] == ["1", "2", "3", "4"]
+    assert all(data["ratio"] == single["ratio"] for data in reports)
+    # Any iterable of lines works too
+    assert len(list(iter_member_reports(path.read_text().splitlines()))) == 4
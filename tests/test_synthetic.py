@@ -0,0 +1,38 @@
+"""Synthetic reports parse back to the inputs they were generated from."""
+import random
+
+import pytest
+
+from steeldesign.parser import parse_staad_report
+from steeldesign.stream import iter_member_blocks
+from steeldesign.synthetic import member_block, random_member, synthetic_report
+
+
+@pytest.mark.parametrize("member", range(1, 41))
+def test_synthetic_member_roundtrip(member):
+    spec = random_member(random.Random(member), member)
+    data = parse_staad_report(member_block(**spec))
+
+    assert data["id"] == str(member)
+    assert data["loadcase"] == str(spec["loadcase"])
+    assert data["profile"].split()[-1] == str(spec["profile"]["shape"])
+    assert data["material"]["Fyld"] == spec["Fy"]
+    assert data["params"]["Length"] == pytest.approx(spec["L"])
+    assert (data["params"]["Kx"], data["params"]["Ky"]) == (spec["Kx"], spec["Ky"])
+    # Forces are printed to four significant figures
+    for key, value in spec["forces"].items():
+        parsed = data["forces"][key]["value"]
+        if key == "Pz":
+            parsed = parsed if data["forces"]["Pz"]["type"] == "Tension" else -parsed
+        assert parsed == pytest.approx(value, rel=1e-3, abs=1e-3), key
+    # The recalculated ratio against the one STAAD (the generator) printed
+    printed = float(member_block(**spec).split("Ratio:")[1].split()[0])
+    assert data["ratio"] == pytest.approx(printed, rel=5e-3, abs=2e-3)
+    assert data["status"] == ("PASS" if data["ratio"] < 1.0 else "FAIL")
+
+
+def test_report_splits_into_every_member():
+    text = synthetic_report(25, seed=7)
+    blocks = list(iter_member_blocks(text.splitlines(keepends=True)))
+    assert [parse_staad_report(block)["id"] for block in blocks] == [str(n) for n in range(1, 26)]
+    assert text.endswith("".join(blocks))
@@ -0,0 +1,23 @@
+"""Stage timings of a page run."""
+from steeldesign.timing import Timings, span
+
+
+def test_summary_lists_stages_in_order():
+    timings = Timings("test", log_path="").start()
+    timings.stage("parse")
+    with span("calc"):
+        pass
+    timings.stage("render")
+    rows, total = timings.summary()
+    assert [row["stage"] for row in rows] == ["parse.calc", "parse", "render"]
+    assert total == f"Total {timings.total_ms:.1f} ms"
+    # The run is detached: core spans are no longer recorded
+    with span("late"):
+        pass
+    assert len(timings.spans) == 3
+
+
+def test_summary_is_empty_when_timing_is_off():
+    timings = Timings("test", enabled=False, log_path="").start()
+    timings.stage("parse")
+    assert timings.summary() == ([], None)
@@ -0,0 +1,109 @@
+"""
+`vector.check_columns` and `envelope.envelope` against the scalar
+`checks.calculate_results` they replace.
+"""
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from steeldesign.checks import calculate_results
+from steeldesign.envelope import envelope
+from steeldesign.parser import parse_staad_report
+from steeldesign.vector import check_columns, columns_from_reports
+
+SECTION = ("Ag", "Ixx", "Iyy", "J", "Cw", "Sxx", "Syy", "Zxx", "Zyy", "Axx", "Ayy")
+
+
+def varied_member(base, rng):
+    """The sample member with randomized section size, material, length and forces."""
+    data = copy.deepcopy(base)
+    scale = rng.uniform(0.3, 4.0)
+    for name, power in zip(SECTION, (2, 4, 4, 4, 6, 3, 3, 3, 3, 2, 2)):
+        data["properties"][name]["value"] *= scale ** (power / 2)
+    data["material"]["Fyld"], data["material"]["Fu"] = rng.choice(((50.0, 65.0), (36.0, 58.0)))
+    data["params"]["Length"] = rng.uniform(24.0, 720.0)
+    data["params"]["Kx"], data["params"]["Ky"] = rng.choice((1.0, 1.2, 2.0)), rng.choice((1.0, 2.0))
+    data["params"]["Cb"] = rng.choice((1.0, 1.14, 1.67))
+    forces = data["forces"]
+    forces["Pz"]["value"] = rng.uniform(0, 300) * scale
+    forces["Pz"]["type"] = rng.choice(("Tension", "Compression"))
+    for key, top in (("Vx", 30), ("Vy", 60), ("Mx", 2000), ("My", 500)):
+        forces[key]["value"] = rng.uniform(-top, top) * scale ** 1.5
+    calculate_results(data)
+    return data
+
+
+@pytest.fixture(scope="module")
+def reports(sample_report):
+    base = parse_staad_report(sample_report)
+    rng = random.Random(3)
+    return [varied_member(base, rng) for _ in range(300)]
+
+
+def test_check_columns_matches_calculate_results(reports):
+    results = check_columns(columns_from_reports(reports))
+    for i, data in enumerate(reports):
+        for name, check in data["checks"].items():
+            for key in ("demand", "capacity", "ratio"):
+                if key in check and key in results["checks"][name]:
+                    assert results["checks"][name][key][i] == pytest.approx(check[key], rel=1e-9, abs=1e-12), \
+                        (i, name, key)
+        assert results["ratio"][i] == pytest.approx(data["ratio"], rel=1e-9)
+        assert results["status"][i] == data["status"]
+        assert results["ref"][i] == data["ref"]
+
+
+def test_variations_cover_every_branch(reports):
+    results = check_columns(columns_from_reports(reports))
+    ltb = results["checks"]["ltb_x"]
+    L = columns_from_reports(reports)["L"]
+    assert (L <= ltb["Lp"]).any() and ((L > ltb["Lp"]) & (L <= ltb["Lr"])).any() and (L > ltb["Lr"]).any()
+    assert set(results["ref"]) == {"Eq.H1-1a", "Eq.H1-1b"}
+    assert set(results["status"]) == {"PASS", "FAIL"}
+
+
+def _rechecked(data, Pu, Mux, Muy, tension):
+    trial = copy.deepcopy(data)
+    forces = trial["forces"]
+    forces["Pz"] = dict(forces["Pz"], value=Pu, type="Tension" if tension else "Compression")
+    forces["Mx"] = dict(forces["Mx"], value=Mux)
+    forces["My"] = dict(forces["My"], value=Muy)
+    calculate_results(trial)
+    return trial
+
+
+def test_envelope_matches_scalar_load_cases(reports):
+    members = reports[:40]
+    rng = np.random.default_rng(5)
+    n, n_lc = len(members), 6
+    scale = np.array([[abs(d["forces"][k]["value"]) + 1.0 for k in ("Pz", "Mx", "My")] for d in members])
+    Pu = scale[:, :1] * rng.uniform(0, 2, (n, n_lc))
+    Mux = scale[:, 1:2] * rng.uniform(0, 2, (n, n_lc))
+    Muy = scale[:, 2:3] * rng.uniform(0, 2, (n, n_lc))
+    tension = rng.random((n, n_lc)) < 0.3
+    loadcases = np.arange(100, 100 + n_lc)
+
+    result = envelope(columns_from_reports(members), Pu, Mux, Muy, tension, loadcases=loadcases)
+
+    for i, data in enumerate(members):
+        scalar = [_rechecked(data, Pu[i, j], Mux[i, j], Muy[i, j], tension[i, j]) for j in range(n_lc)]
+        ratios = [trial["ratio"] for trial in scalar]
+        assert result["ratios"][i] == pytest.approx(ratios, rel=1e-9)
+        worst = int(np.argmax(ratios))
+        assert result["loadcase"][i] == loadcases[worst]
+        assert result["ratio"][i] == pytest.approx(ratios[worst], rel=1e-9)
+        assert result["criteria"][i] == scalar[worst]["ref"]
+        assert result["status"][i] == scalar[worst]["status"]
+
+
+def test_envelope_stations_axis(reports):
+    members = reports[:5]
+    Pu = np.zeros((5, 2, 3))
+    Mux = np.arange(30, dtype=float).reshape(5, 2, 3)
+    result = envelope(columns_from_reports(members), Pu, Mux, 0.0, stations=[0.0, 0.5, 1.0])
+    assert result["ratios"].shape == (5, 2, 3)
+    # The largest moment of every member is at load case 1, last station
+    assert list(result["loadcase"]) == [1] * 5
+    assert list(result["location"]) == [1.0] * 5
@@ -0,0 +1,93 @@
+"""Instantaneous center coefficients C for eccentric weld groups."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from steeldesign.weld import eccentric_capacity, ic_coefficient, ic_solve, size_welds
+from steeldesign.weld_tables import C_TABLES_NPZ, C_TABLES_VERSION, build_c_tables, c_coefficients
+from steeldesign.weld_tables import interpolate_c, load_c_tables
+
+
+def schedule(**columns):
+    base = {"FEXX": [70.0], "n": [2], "Ru": [40.0], "method": ["LRFD"], "t_plate": [0.375]}
+    base.update(columns)
+    return pd.DataFrame(base)
+
+
+def test_concentric_c_matches_strength_of_a_line():
+    # Load along the line: 0.6 FEXX 0.707 / 16 per inch of a 1/16 weld
+    assert ic_coefficient("line", 0, 0, 0) == pytest.approx(0.6 * 70 * 0.707 / 16, rel=2e-3)
+    # Perpendicular to the line the J2-5 directional increase is 1.5
+    assert ic_coefficient("line", 0, 0, 90) / ic_coefficient("line", 0, 0, 0) == pytest.approx(1.5, rel=2e-3)
+    # Two lines carry twice one line
+    assert ic_coefficient("parallel", 0.5, 0, 0) == pytest.approx(2 * ic_coefficient("line", 0, 0, 0))
+
+
+def test_eccentric_c_below_concentric():
+    for group in ("line", "parallel", "L", "C"):
+        solved = ic_solve(group, 0.5, 0.5, 0)
+        assert solved["converged"], group
+        assert 0 < solved["Rn"] < ic_coefficient(group, 0.5, 0, 0)
+
+
+def test_eccentric_capacity_scales_with_length_and_size():
+    C = ic_coefficient("C", 0.5, 0.5, 0.0)
+    assert eccentric_capacity("C", 8.0, 0.5, 0.5, 0.0, 0.25) == pytest.approx(0.75 * C * 4 * 8.0)
+    assert eccentric_capacity("C", 8.0, 0.5, 0.5, 0.0, 0.25, method="ASD") == pytest.approx(C * 4 * 8.0 / 2.0)
+
+
+def test_c_tables_interpolate_their_nodes_and_solve_outside():
+    tables = build_c_tables(k_grid=[0.0, 0.5, 1.0], ecc_grid=[0.0, 0.5, 1.0], theta_grid=[0.0, 45.0, 90.0])
+    k, ecc, theta = 0.5, 0.5, 45.0
+    a = ecc / np.cos(np.radians(theta))
+    C, inside = interpolate_c("C", k, a, theta, tables)
+    assert inside
+    assert C == pytest.approx(ic_solve("C", k, ecc, theta, perpendicular=True)["Rn"], rel=1e-9)
+
+    # Outside the grid the exact coefficient is used
+    C = c_coefficients("L", np.array([0.5]), np.array([2.0]), np.array([0.0]), tables)
+    assert C[0] == pytest.approx(ic_coefficient("L", 0.5, 2.0, 0.0))
+
+
+def test_warm_started_c_tables_match_cold_solves():
+    ecc_grid = [0.2, 0.4, 0.8, 1.6]
+    tables = build_c_tables(k_grid=[0.5], ecc_grid=ecc_grid, theta_grid=[0.0, 60.0])
+    for group in ("L", "C"):
+        for j, ecc in enumerate(ecc_grid):
+            for m, theta in enumerate((0.0, 60.0)):
+                cold = ic_solve(group, 0.5, ecc, theta, perpendicular=True)["Rn"]
+                assert tables[group][0, j, m] == pytest.approx(cold, rel=1e-7), (group, ecc, theta)
+
+
+def test_shipped_c_tables_are_current():
+    with np.load(C_TABLES_NPZ) as npz:
+        assert int(npz["version"]) == C_TABLES_VERSION
+    tables = load_c_tables()
+    i, j, m = 3, 4, 2
+    k, ecc, theta = tables["k"][i], tables["ecc"][j], tables["theta"][m]
+    assert tables["L"][i, j, m] == pytest.approx(ic_solve("L", k, ecc, theta, perpendicular=True)["Rn"], rel=1e-9)
+
+
+def test_unknown_group_lists_the_groups():
+    with pytest.raises(ValueError, match="line, parallel, L, C"):
+        interpolate_c("T", 0.5, 0.5, 0.0)
+
+
+def test_size_welds_blank_l_max_is_no_limit():
+    sized = size_welds(schedule(L_max=[np.nan]))
+    unlimited = size_welds(schedule(L_max=[1e6]))
+    assert sized["status"][0] == "OK"
+    assert (sized["w"][0], sized["L"][0]) == (unlimited["w"][0], unlimited["L"][0])
+
+
+def test_size_welds_sizes_on_the_sixteenth_grid():
+    sized = size_welds(schedule(Ru=[50.0, 50.0, 50.0], FEXX=[70.0] * 3, n=[2] * 3, method=["LRFD"] * 3,
+                                t_plate=[0.375, 0.375, 0.1], L_max=[4.0, np.nan, np.nan]))
+    sixteenths = sized["w"].to_numpy()[:2] * 16
+    assert np.allclose(sixteenths, np.round(sixteenths))
+    assert (sized["status"][:2] == "OK").all()
+    assert (sized["utilization"][:2] <= 1.0).all()
+    # The length cap forces a larger, shorter weld
+    assert sized["w"][0] > sized["w"][1] and sized["L"][0] <= 4.0
+    # Thinner than the smallest fillet on the grid
+    assert sized["status"][2] == "NG" and np.isnan(sized["w"][2])